@@ -0,0 +1,84 @@
+"""Check the CRCs in captures written by ``capture_messages.py``.
+
+Every record's CRC is recomputed in software and compared with the recorded
+CRC and with SPIRIT1's own verdict.  Records are processed in chunks, so
+archives of any size stream through in bounded memory; install the
+``numpy`` extra for the batch path.  The packet format defaults to the one
+``capture_messages.py`` configures.
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from spirit1 import BasicPacketConfig
+from spirit1.basic_packet import BasicPacketMessage
+from spirit1.crc import basic_packet_crcs
+from spirit1.enums import CrcMode
+
+
+def read_records(paths: Iterable[str]) -> Iterator[tuple[str, int, dict]]:
+    for path in paths:
+        with (sys.stdin if path == "-" else open(path)) as lines:
+            for number, line in enumerate(lines, 1):
+                if line.strip():
+                    yield path, number, json.loads(line)
+
+
+def packet_message(record: dict) -> BasicPacketMessage:
+    return BasicPacketMessage(
+        payload=bytes.fromhex(record["payload"]),
+        source_address=record["source_address"],
+        destination_address=record["destination_address"],
+        control_data=bytes.fromhex(record["control_data"]),
+        crc=bytes.fromhex(record["crc"]) if record["crc"] is not None else None,
+    )
+
+
+def verify(args: argparse.Namespace) -> int:
+    config = BasicPacketConfig(
+        fixed_packet_length=args.max_length,
+        crc_mode=CrcMode[args.crc_mode],
+        control_length=args.control_length,
+        address_field=not args.no_address,
+    )
+    checked = mismatches = disagreements = 0
+    records = read_records(args.paths)
+    while chunk := list(islice(records, args.chunk)):
+        messages = [packet_message(record) for _, _, record in chunk]
+        for (path, number, record), message, crc in zip(chunk, messages, basic_packet_crcs(config, messages)):
+            valid = crc == message.crc
+            checked += 1
+            mismatches += not valid
+            if record["crc_valid"] is not None and valid != record["crc_valid"]:
+                disagreements += 1
+                print(f"{path}:{number}: software CRC {crc.hex()}, SPIRIT1 reported "
+                      f"{'valid' if record['crc_valid'] else 'invalid'}", file=sys.stderr)
+    print(f"{checked} records, {mismatches} CRC mismatches, {disagreements} disagree with SPIRIT1")
+    return 1 if disagreements else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", default=["-"], help="JSONL capture files, or - for stdin")
+    parser.add_argument("--crc-mode", default=CrcMode.CRC_MODE_864CBF.name,
+                        choices=[mode.name for mode in CrcMode if mode != CrcMode.CRC_MODE_OFF])
+    parser.add_argument("--control-length", type=int, default=4, help="Control bytes per packet (default: 4)")
+    parser.add_argument("--no-address", action="store_true", help="Packets have no address field")
+    parser.add_argument(
+        "--max-length",
+        type=int,
+        default=100,
+        help="Longest packet, which sets the length field width (default: 100)",
+    )
+    parser.add_argument("--chunk", type=int, default=65_536, help="Records checked per batch")
+    args = parser.parse_args()
+    if args.chunk < 1:
+        parser.error("--chunk must be at least 1")
+    raise SystemExit(verify(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 """Python driver for the STMicroelectronics SPIRIT1 RF transceiver."""
 
 from .basic_packet import BasicPacket, BasicPacketConfig, BasicPacketMessage
+from .calibration import CalibrationKey, VcoCalibrationCache
+from .channels import ChannelEntry, ChannelTable
+from .compact import CompactMessage, PayloadPool
+from .compiler import RegisterImage, compile_registers
 from .device import Spirit1Device
 from .diagnostics import dump_configuration
 from .formatting import (
@@ -9,7 +13,16 @@ from .formatting import (
     format_basic_packet_one_line,
     to_dict,
 )
-from .gpio import GpioZeroShutdownPin, ShutdownPin, open_gpiozero_sdn
+from .gpio import (
+    GpioZeroIrqPin,
+    GpioZeroShutdownPin,
+    IrqPin,
+    ShutdownPin,
+    open_gpiozero_irq,
+    open_gpiozero_sdn,
+)
+from .modulation import ModulationSetting, ModulationSolver, modulation_solver
+from .packet_view import PacketView, PacketViewDecoder
 from .radio import Radio
 from .radio_config import RadioConfig
 from .receiver import ReceivedMessage, Receiver
@@ -21,6 +34,7 @@ from .stack_packet import (
     StackPacketConfig,
     StackPacketMessage,
 )
+from .transmitter import TransmitOutcome, TransmitResult, Transmitter
 
 __version__ = "0.1.2"
 
@@ -28,23 +42,42 @@ __all__ = [
     "BasicPacket",
     "BasicPacketConfig",
     "BasicPacketMessage",
+    "CalibrationKey",
+    "ChannelEntry",
+    "ChannelTable",
+    "CompactMessage",
     "ExperimentalStackPacketWarning",
+    "GpioZeroIrqPin",
     "GpioZeroShutdownPin",
+    "IrqPin",
+    "ModulationSetting",
+    "ModulationSolver",
+    "PacketView",
+    "PacketViewDecoder",
+    "PayloadPool",
     "Radio",
     "RadioConfig",
     "ReceivedMessage",
     "Receiver",
+    "RegisterImage",
     "ShutdownPin",
     "SpiDevice",
     "Spirit1Device",
     "StackPacket",
     "StackPacketConfig",
     "StackPacketMessage",
+    "TransmitOutcome",
+    "TransmitResult",
+    "Transmitter",
+    "VcoCalibrationCache",
     "__version__",
     "basic_packet_to_dict",
+    "compile_registers",
     "dump_configuration",
     "format_basic_packet",
     "format_basic_packet_one_line",
+    "modulation_solver",
+    "open_gpiozero_irq",
     "open_gpiozero_sdn",
     "open_spidev",
     "to_dict",
@@ -0,0 +1,17 @@
+"""Lazy access to the optional NumPy dependency."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def require_numpy(feature: str) -> Any:
+    """Import NumPy, explaining how to install it when it is missing."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise RuntimeError(
+            f"{feature} requires the optional 'numpy' dependency; " +
+            "install spirit1[numpy]"
+        ) from error
+    return numpy
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import time
-from collections.abc import AsyncIterator, Sequence
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass, field
 
+from .compact import CompactMessage
 from .device import Spirit1Device
 from .enums import CrcMode
 from .receiver import ReceivedMessage, Receiver
 from .registers import Spirit1Registers
+from .transmitter import TransmitResult, Transmitter
 
 
 @dataclass
@@ -28,6 +30,20 @@ class BasicPacketConfig:
     def sync_length(self) -> int:
         return len(self.sync_words)
 
+    @property
+    def length_width(self) -> int:
+        """Bits in the length field of variable-length packets."""
+        return ((self.fixed_packet_length.bit_length() - 1) & 0x0F) + 1
+
+    @property
+    def crc_length(self) -> int:
+        """Bytes of CRC appended to each packet."""
+        return self.crc_mode.length
+
+    def packet_length(self, payload_length: int) -> int:
+        """Return the packet length programmed for a payload of this size."""
+        return payload_length + self.control_length + (2 if self.address_field else 0)
+
     def validate(self) -> list[str]:
         errors: list[str] = []
         if not 1 <= self.preamble_length <= 32:
@@ -50,7 +66,7 @@ class BasicPacketMessage:
     destination_address: int|None = None
     control_data: bytes = b""
     crc: bytes|None = None
-    raw: ReceivedMessage|None = None
+    raw: ReceivedMessage|CompactMessage|None = None
 
     @property
     def rssi(self) -> int|None:
@@ -76,9 +92,15 @@ class BasicPacketMessage:
 class BasicPacket:
     """Applies :class:`BasicPacketConfig` and streams decoded basic packets."""
 
-    def __init__(self, spirit: Spirit1Device, config: BasicPacketConfig|None = None):
+    def __init__(
+        self,
+        spirit: Spirit1Device,
+        config: BasicPacketConfig|None = None,
+        transmitter: Transmitter|None = None,
+    ):
         self.spirit:Spirit1Device = spirit
         self.config:BasicPacketConfig = config or BasicPacketConfig()
+        self.transmitter:Transmitter = transmitter or Transmitter(spirit)
 
     def apply(self) -> bool:
         if self.config.validate():
@@ -92,7 +114,7 @@ class BasicPacket:
 
         packet_control = [
             (int(self.config.address_field) << 3) | self.config.control_length,
-            (self.config.fixed_packet_length.bit_length() - 1) & 0x0F,
+            self.config.length_width - 1,
             (self.config.preamble_length << 3)
             | ((self.config.sync_length - 1) << 1)
             | int(not self.config.fixed_length),
@@ -102,14 +124,49 @@ class BasicPacket:
         ]
         _ = self.spirit.write_registers(Spirit1Registers.PKTCTRL_4, *packet_control)
         _ = self.spirit.write_registers(Spirit1Registers.SYNC_4, *reversed(self.config.sync_words))
+        # Applying a configuration usually follows a reset, so re-send headers.
+        self.transmitter.invalidate()
         return True
 
-    async def receive(self, receiver: Receiver) -> AsyncIterator[BasicPacketMessage]:
+    async def receive(
+        self,
+        receiver: Receiver,
+        low_duty_cycle: bool = False,
+    ) -> AsyncIterator[BasicPacketMessage]:
         """Convert a raw receiver stream into a basic-packet stream."""
-        async for raw_message in receiver.receive():
+        stream = receiver.receive(low_duty_cycle=True) if low_duty_cycle else receiver.receive()
+        async for raw_message in stream:
             yield self.decode(raw_message)
 
-    def decode(self, raw_message: ReceivedMessage) -> BasicPacketMessage:
+    async def receive_batch(
+        self,
+        receiver: Receiver,
+        max_messages: int = 32,
+        max_latency: float = 0.05,
+        low_duty_cycle: bool = False,
+    ) -> AsyncIterator[list[BasicPacketMessage]]:
+        """Convert batches from :meth:`Receiver.receive_batch` into basic packets."""
+        async for raw_messages in receiver.receive_batch(max_messages, max_latency, low_duty_cycle):
+            yield self.decode_batch(raw_messages)
+
+    def decode_batch(self, raw_messages: Iterable[ReceivedMessage|CompactMessage]) -> list[BasicPacketMessage]:
+        """Decode many snapshots, resolving the packet format once per batch."""
+        address_field = self.config.address_field
+        control_length = self.config.control_length
+        crc_length = self.config.crc_length
+        return [
+            BasicPacketMessage(
+                payload=bytes(raw_message.payload),
+                source_address=raw_message.source_address if address_field else None,
+                destination_address=raw_message.destination_address if address_field else None,
+                control_data=raw_message.control_data[-control_length:] if control_length else b"",
+                crc=raw_message.crc[:crc_length] if crc_length else None,
+                raw=raw_message,
+            )
+            for raw_message in raw_messages
+        ]
+
+    def decode(self, raw_message: ReceivedMessage|CompactMessage) -> BasicPacketMessage:
         """Convert an immutable received-message snapshot into a basic packet."""
         if self.config.address_field:
             source_address = raw_message.source_address
@@ -126,56 +183,51 @@ class BasicPacket:
         )
 
     def transmit(self, message: BasicPacketMessage, timeout: float = 1.0) -> bool:
-        """Write a message to the TX FIFO and wait for transmission to finish."""
+        """Write a message to the TX FIFO and wait for transmission to finish.
+
+        Payloads larger than the 96-byte FIFO are streamed by
+        :class:`~spirit1.transmitter.Transmitter`.  Enable
+        :data:`~spirit1.transmitter.TRANSMIT_IRQS` in the IRQ mask.
+        """
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than zero")
+        self.transmitter.write_header(self._header_registers(message))
+        return self.transmitter.transmit(message.payload, timeout)
+
+    async def transmit_async(self, message: BasicPacketMessage, timeout: float = 1.0) -> TransmitResult:
+        """Send a message and await its TX_DATA_SENT interrupt.
+
+        Enable :data:`~spirit1.transmitter.TRANSMIT_IRQS` in the IRQ mask.
+        """
         if timeout <= 0:
             raise ValueError("Timeout must be greater than zero")
+        self.transmitter.write_header(self._header_registers(message))
+        return await self.transmitter.transmit_async(message.payload, timeout)
+
+    def submit(self, message: BasicPacketMessage, timeout: float = 1.0) -> asyncio.Future[TransmitResult]:
+        """Queue a message for pipelined transmission and return its future.
+
+        Queued messages are sent back to back; see
+        :meth:`~spirit1.transmitter.Transmitter.submit`.  Await
+        :meth:`~spirit1.transmitter.Transmitter.drain` to wait for all of them.
+        """
+        return self.transmitter.submit(self._header_registers(message), message.payload, timeout)
+
+    def _header_registers(self, message: BasicPacketMessage) -> dict[Spirit1Registers|int, int]:
+        """Return the packet registers that describe ``message``."""
         if self.config.address_field:
             if message.destination_address is None:
                 raise ValueError("Basic packet address field is enabled, but no destination was supplied")
-            _ = self.spirit.write_registers(Spirit1Registers.RX_SOURCE_ADDR, message.destination_address)
-            if message.source_address is not None:
-                _ = self.spirit.write_registers(Spirit1Registers.TX_SOURCE_ADDR, message.source_address)
         elif message.source_address is not None or message.destination_address is not None:
             raise ValueError("Packet addresses require address_field=True")
-        self._write_control_data(message.control_data)
-        self._set_payload_length(len(message.payload))
-
-        _ = self.spirit.flush_tx_fifo()
-        _ = self.spirit.write_linear_fifo(message.payload)
-        if not self.spirit.start_tx():
-            return False
-        deadline = time.monotonic() + timeout
-        while self.spirit.linear_fifo_tx_size():
-            if time.monotonic() >= deadline:
-                return False
-            time.sleep(0.01)
-        return True
-
-    def _decode_crc(self, raw_message: ReceivedMessage) -> bytes|None:
-        if self.config.crc_mode == CrcMode.CRC_MODE_OFF:
-            return None
-        length = 3
-        if self.config.crc_mode == CrcMode.CRC_MODE_7:
-            length = 1
-        elif self.config.crc_mode in (CrcMode.CRC_MODE_1021, CrcMode.CRC_MODE_8005):
-            length = 2
-        return raw_message.crc[:length]
-
-    def _write_control_data(self, control_data: Sequence[int]) -> None:
-        if not self.config.control_length:
-            return
-        if len(control_data) < self.config.control_length:
-            raise ValueError("Not enough control-data bytes for the configured packet format")
-        values = control_data[:self.config.control_length]
-        register = Spirit1Registers.TX_CTRL_3 + (4 - self.config.control_length)
-        _ = self.spirit.write_registers(register, *values)
-
-    def _set_payload_length(self, payload_length: int) -> None:
-        total_length = payload_length + self.config.control_length + (2 if self.config.address_field else 0)
-        if not 0 <= total_length <= 0xFFFF:
-            raise ValueError("Payload plus packet overhead must fit in 65535 bytes")
-        _ = self.spirit.write_registers(
-            Spirit1Registers.PKTLEN_1,
-            (total_length >> 8) & 0xFF,
-            total_length & 0xFF,
+        return Transmitter.header_registers(
+            self.config.packet_length(len(message.payload)),
+            message.destination_address,
+            message.source_address,
+            message.control_data,
+            self.config.control_length,
         )
+
+    def _decode_crc(self, raw_message: ReceivedMessage|CompactMessage) -> bytes|None:
+        length = self.config.crc_length
+        return raw_message.crc[:length] if length else None
@@ -0,0 +1,159 @@
+"""Cache of VCO calibration results, optionally kept on disk."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_FILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CalibrationKey:
+    """The settings a VCO calibration result depends on."""
+
+    frequency: int
+    xtal_frequency: int
+    reference_divider: bool
+    digital_divider: bool
+
+
+@dataclass(frozen=True)
+class CalibrationRecord:
+    vco_tx: int
+    vco_rx: int
+    timestamp: float
+    temperature: float|None = None
+
+
+class VcoCalibrationCache:
+    """Remember VCO calibration words so they can be reused instead of measured.
+
+    Records older than ``max_age`` seconds are discarded.  When a
+    ``temperature`` callable is supplied, records taken more than
+    ``max_temperature_drift`` degrees away from the current reading are
+    discarded too.  With a ``path`` the cache is loaded from, and saved to,
+    a small JSON file.  The file is only rewritten when a record is added,
+    changed or removed; use :meth:`batch` to save once after many changes.
+    """
+
+    def __init__(
+        self,
+        path: str|os.PathLike[str]|None = None,
+        max_age: float|None = 7 * 24 * 3600,
+        max_temperature_drift: float = 10.0,
+        temperature: Callable[[], float|None]|None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path: Path|None = Path(path).expanduser() if path is not None else None
+        self.max_age: float|None = max_age
+        self.max_temperature_drift: float = max_temperature_drift
+        self.temperature: Callable[[], float|None]|None = temperature
+        self.clock: Callable[[], float] = clock
+        self._records: dict[CalibrationKey, CalibrationRecord] = {}
+        self._batching: int = 0
+        self._dirty: bool = False
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: CalibrationKey) -> tuple[int, int]|None:
+        """Return the cached (TX, RX) calibration words, if still valid."""
+        record = self._records.get(key)
+        if record is None:
+            return None
+        if self.max_age is not None and self.clock() - record.timestamp > self.max_age:
+            logger.debug("Discarding VCO calibration for %d Hz: too old", key.frequency)
+            del self._records[key]
+            return None
+        temperature = self.temperature() if self.temperature is not None else None
+        if (
+            temperature is not None
+            and record.temperature is not None
+            and abs(temperature - record.temperature) > self.max_temperature_drift
+        ):
+            logger.debug("Discarding VCO calibration for %d Hz: temperature drift", key.frequency)
+            del self._records[key]
+            return None
+        return record.vco_tx, record.vco_rx
+
+    def put(self, key: CalibrationKey, vco_tx: int, vco_rx: int) -> None:
+        """Store calibration words.
+
+        The file is saved when the words for ``key`` change.  Refreshing an
+        unchanged record only updates it in memory until the next save.
+        """
+        temperature = self.temperature() if self.temperature is not None else None
+        previous = self._records.get(key)
+        self._records[key] = CalibrationRecord(vco_tx, vco_rx, self.clock(), temperature)
+        if previous is None or (previous.vco_tx, previous.vco_rx) != (vco_tx, vco_rx):
+            self._changed()
+
+    def invalidate(self, key: CalibrationKey|None = None) -> None:
+        """Forget one calibration, or every calibration when ``key`` is omitted."""
+        if key is None:
+            removed = bool(self._records)
+            self._records.clear()
+        else:
+            removed = self._records.pop(key, None) is not None
+        if removed:
+            self._changed()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the block ends, then save once if anything changed."""
+        self._batching += 1
+        try:
+            yield
+        finally:
+            self._batching -= 1
+            if not self._batching and self._dirty:
+                self.save()
+
+    def load(self) -> None:
+        if self.path is None:
+            raise ValueError("The calibration cache has no file")
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != _FILE_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')!r}")
+            records = {
+                CalibrationKey(
+                    entry["frequency"],
+                    entry["xtal_frequency"],
+                    entry["reference_divider"],
+                    entry["digital_divider"],
+                ): CalibrationRecord(entry["vco_tx"], entry["vco_rx"], entry["timestamp"], entry.get("temperature"))
+                for entry in data["entries"]
+            }
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring unreadable VCO calibration cache %s: %s", self.path, error)
+            return
+        self._records.update(records)
+
+    def save(self) -> None:
+        if self.path is None:
+            raise ValueError("The calibration cache has no file")
+        entries = [{**asdict(key), **asdict(record)} for key, record in self._records.items()]
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps({"version": _FILE_VERSION, "entries": entries}, indent=1))
+        os.replace(temporary, self.path)
+        self._dirty = False
+
+    def _changed(self) -> None:
+        if self.path is None:
+            return
+        if self._batching:
+            self._dirty = True
+        else:
+            self.save()
@@ -0,0 +1,144 @@
+"""Precomputed channel tables for fast frequency changes."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from .frequency import Frequency
+from .radio import Radio, channel_step, synth_frequency
+from .registers import Spirit1Registers
+
+logger = logging.getLogger(__name__)
+
+# Registers a hop rewrites, besides the VCO calibration words.
+_TUNING_REGISTERS: tuple[Spirit1Registers, ...] = (
+    Spirit1Registers.SYNT_3,
+    Spirit1Registers.SYNT_2,
+    Spirit1Registers.SYNT_1,
+    Spirit1Registers.SYNT_0,
+    Spirit1Registers.CHANNEL_NUMBER,
+    Spirit1Registers.SYNTH_CONFIG_HI,
+)
+
+
+@dataclass(frozen=True)
+class ChannelEntry:
+    """Synthesizer registers and VCO calibration words for one frequency."""
+
+    frequency: int
+    synt: tuple[int, int, int, int]
+    vco_select: int
+    vco_tx: int|None = None
+    vco_rx: int|None = None
+
+    @property
+    def calibrated(self) -> bool:
+        return self.vco_tx is not None and self.vco_rx is not None
+
+
+class ChannelTable:
+    """Hop between frequencies using precomputed synthesizer settings.
+
+    Each channel is programmed as an absolute synthesizer frequency with
+    CHANNEL_NUMBER left at zero; FC_OFFSET still applies on top.  Once the
+    table is calibrated, a hop writes SYNT_3..0 and CHANNEL_NUMBER through
+    RCO_VCO_CALIBR_IN0 in two bursts, plus SYNTH_CONFIG_HI only when the
+    VCO selection changes.  Hop from READY; the VCO's own calibration stays
+    disabled so the stored words are used.  Hopping marks those registers as
+    unknown to the radio, so a later :meth:`Radio.reconfigure` rewrites them.
+    """
+
+    def __init__(self, radio: Radio, frequencies: Sequence[int]):
+        self.radio: Radio = radio
+        self.entries: list[ChannelEntry] = [self._entry(frequency) for frequency in frequencies]
+        self.current: int|None = None
+        self._rco_word: int|None = None
+        self._vco_select: int|None = None
+
+    @classmethod
+    def from_channels(cls, radio: Radio, channels: Iterable[int]) -> ChannelTable:
+        """Build a table from channel numbers on the radio's channel raster.
+
+        Channels are spaced by the quantised step the synthesizer uses, which
+        differs slightly from the nominal ``channel_space``.
+        """
+        config = radio.config
+        step = channel_step(config.channel_space, radio.xtal_frequency)
+        return cls(radio, [config.base_frequency + round(step * channel) for channel in channels])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> ChannelEntry:
+        return self.entries[index]
+
+    @property
+    def calibrated(self) -> bool:
+        return all(entry.calibrated for entry in self.entries)
+
+    def calibrate(self, indexes: Iterable[int]|None = None) -> bool:
+        """Run VCO calibration on each channel and store the results.
+
+        Channels found in the radio's calibration cache are not measured
+        again, and new results are saved to its file once at the end.  The
+        radio's synthesizer, channel number and calibration words are
+        restored afterwards.
+        """
+        spirit = self.radio.spirit
+        original = self.radio.config
+        self._rco_word = spirit.read_register(Spirit1Registers.RCO_VCO_CALIBR_IN2)
+        words = spirit.read_register_block(Spirit1Registers.RCO_VCO_CALIBR_IN1, 2)
+        cache = self.radio.calibration_cache
+        # Entries are absolute frequencies, so measure them on channel zero.
+        _ = spirit.write_registers(Spirit1Registers.CHANNEL_NUMBER, 0)
+        try:
+            with cache.batch() if cache is not None else contextlib.nullcontext():
+                for index in range(len(self.entries)) if indexes is None else indexes:
+                    entry = self.entries[index]
+                    self.radio.config = dataclasses.replace(
+                        original,
+                        base_frequency=entry.frequency,
+                        channel_number=0,
+                        frequency_offset=0,
+                    )
+                    self.radio.write_frequency_base(False)
+                    calibration = self.radio.cached_vco_calibration()
+                    if calibration is None:
+                        logger.warning("Unable to calibrate the VCO at %d Hz", entry.frequency)
+                        return False
+                    self.entries[index] = dataclasses.replace(entry, vco_tx=calibration[0], vco_rx=calibration[1])
+        finally:
+            self.radio.config = original
+            self.radio.write_frequency_base(False)
+            _ = spirit.write_registers(Spirit1Registers.CHANNEL_NUMBER, original.channel_number, self._rco_word, *words)
+            self._vco_select = synth_frequency(original).vco().value
+        self.current = None
+        return True
+
+    def hop(self, index: int, start_rx: bool = False) -> bool:
+        """Retune to channel ``index``, optionally entering RX afterwards."""
+        entry = self.entries[index]
+        if not entry.calibrated:
+            raise ValueError(f"Channel {index} at {entry.frequency} Hz has not been calibrated")
+        spirit = self.radio.spirit
+        if self._rco_word is None:
+            self._rco_word = spirit.read_register(Spirit1Registers.RCO_VCO_CALIBR_IN2)
+        if entry.vco_select != self._vco_select:
+            spirit.update_register(Spirit1Registers.SYNTH_CONFIG_HI, 0xF9, entry.vco_select)
+            self._vco_select = entry.vco_select
+        _ = spirit.write_registers(Spirit1Registers.SYNT_3, *entry.synt)
+        _ = spirit.write_registers(Spirit1Registers.CHANNEL_NUMBER, 0, self._rco_word, entry.vco_tx, entry.vco_rx)
+        self.radio.invalidate(_TUNING_REGISTERS)
+        self.current = index
+        return spirit.start_rx() if start_rx else True
+
+    def _entry(self, frequency: int) -> ChannelEntry:
+        synth = Frequency(frequency)
+        if not synth.is_possible():
+            raise ValueError(f"Frequency {frequency} Hz is outside the permitted bands")
+        synt = synth.synt_reg_values(self.radio.reference_divider, self.radio.xtal_frequency)
+        return ChannelEntry(frequency, tuple(synt), synth.vco().value)
@@ -0,0 +1,185 @@
+"""Software data whitening and FEC for SPIRIT1 frames.
+
+SPIRIT1 whitens with the PN9 sequence (x^9 + x^5 + 1, seeded with ones) and
+encodes FEC frames with a rate 1/2, constraint length 4 convolutional code,
+interleaving each 4-byte block of code symbols.  On transmit, whitening comes
+before FEC.  These functions follow the scheme SPIRIT1 shares with TI's
+CC1101 (design notes DN504 and DN509); they have not been checked against
+frames captured over the air.
+
+Each function accepts bytes or a NumPy array.  Bytes give bytes back.  Arrays
+are treated as one frame per row, so equal-length frames are processed
+together; NumPy is only imported for array input.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from ._numpy import require_numpy
+
+# Two code symbols for each 4-bit window of three earlier bits and the current bit.
+_ENCODE: tuple[int, ...] = (0, 3, 1, 2, 3, 0, 2, 1, 3, 0, 2, 1, 0, 3, 1, 2)
+# Appended before encoding so the trellis ends in a known state.
+TRELLIS_TERMINATOR = 0x0B
+_STATES = 8
+# Bit errors in a 2-bit symbol difference.
+_DISTANCE: tuple[int, ...] = (0, 1, 1, 2)
+# Transmission order of the 16 code symbols in each interleaved 4-byte block:
+# symbol ``4 * row + column`` is sent as ``4 * (3 - column) + 3 - row``.
+_INTERLEAVE: tuple[int, ...] = tuple(4 * (3 - index % 4) + 3 - index // 4 for index in range(16))
+
+
+def _numpy() -> Any:
+    return require_numpy("spirit1.coding")
+
+
+def _is_bytes(data: Any) -> bool:
+    return isinstance(data, (bytes, bytearray, memoryview))
+
+
+@functools.lru_cache(maxsize=16)
+def pn9(length: int) -> bytes:
+    """Return the first ``length`` bytes of the PN9 whitening sequence."""
+    state = 0x1FF
+    sequence = bytearray(length)
+    for index in range(length):
+        sequence[index] = state & 0xFF
+        for _ in range(8):
+            state = (state >> 1) | (((state ^ (state >> 5)) & 1) << 8)
+    return bytes(sequence)
+
+
+def whiten(data: Any) -> Any:
+    """XOR ``data`` with the PN9 sequence; whitening and de-whitening are the same."""
+    if _is_bytes(data):
+        return bytes(a ^ b for a, b in zip(data, pn9(len(data))))
+    np = _numpy()
+    data = np.asarray(data, dtype=np.uint8)
+    return data ^ np.frombuffer(pn9(data.shape[-1]), dtype=np.uint8)
+
+
+def _terminated(length: int) -> int:
+    """Bytes encoded for ``length`` data bytes: the terminator pads to an even count."""
+    return length + 2 - length % 2
+
+
+def encoded_length(length: int) -> int:
+    """Return the size of ``length`` bytes after FEC encoding."""
+    return 2 * _terminated(length)
+
+
+def _interleave(symbols: Any) -> Any:
+    """Reorder blocks of 16 code symbols along the last axis; the inverse of itself."""
+    return symbols[..., _INTERLEAVE]
+
+
+def _symbols_to_bytes(symbols: list[int]) -> bytes:
+    return bytes(
+        (symbols[index] << 6) | (symbols[index + 1] << 4) | (symbols[index + 2] << 2) | symbols[index + 3]
+        for index in range(0, len(symbols), 4)
+    )
+
+
+def fec_encode(data: Any) -> Any:
+    """Append the trellis terminator, encode and interleave.
+
+    The result is :func:`encoded_length` bytes long.
+    """
+    if not _is_bytes(data):
+        return _fec_encode_array(data)
+    data = bytes(data).ljust(_terminated(len(data)), bytes([TRELLIS_TERMINATOR]))
+    history = 0
+    symbols: list[int] = []
+    for byte in data:
+        for bit in range(7, -1, -1):
+            history = ((history << 1) | ((byte >> bit) & 1)) & 0x0F
+            symbols.append(_ENCODE[history])
+    interleaved = [symbols[block + index] for block in range(0, len(symbols), 16) for index in _INTERLEAVE]
+    return _symbols_to_bytes(interleaved)
+
+
+def _fec_encode_array(data: Any) -> Any:
+    np = _numpy()
+    data = np.asarray(data, dtype=np.uint8)
+    frames = data.reshape(-1, data.shape[-1])
+    terminator = np.full((frames.shape[0], _terminated(frames.shape[1]) - frames.shape[1]), TRELLIS_TERMINATOR, np.uint8)
+    bits = np.unpackbits(np.concatenate([frames, terminator], axis=1), axis=1).astype(np.int64)
+    # The window of each bit and the three before it, starting from zeros.
+    padded = np.pad(bits, ((0, 0), (3, 0)))
+    windows = (padded[:, :-3] << 3) | (padded[:, 1:-2] << 2) | (padded[:, 2:-1] << 1) | padded[:, 3:]
+    symbols = np.asarray(_ENCODE, dtype=np.uint8)[windows]
+    symbols = _interleave(symbols.reshape(frames.shape[0], -1, 16)).reshape(frames.shape[0], -1, 4)
+    encoded = (symbols[..., 0] << 6) | (symbols[..., 1] << 4) | (symbols[..., 2] << 2) | symbols[..., 3]
+    return encoded.reshape(*data.shape[:-1], -1)
+
+
+def fec_decode(data: Any) -> Any:
+    """De-interleave and Viterbi-decode FEC frames.
+
+    Returns half as many bytes as ``data``, ending with the one or two
+    trellis terminator bytes that :func:`fec_encode` appended.  Decoding uses
+    hard decisions and corrects scattered bit errors.
+    """
+    if not _is_bytes(data):
+        return _fec_decode_array(data)
+    if len(data) % 4:
+        raise ValueError("FEC frames are a whole number of 4-byte blocks")
+    received = [(byte >> shift) & 3 for byte in data for shift in (6, 4, 2, 0)]
+    symbols = [received[block + index] for block in range(0, len(received), 16) for index in _INTERLEAVE]
+    metrics = [0] + [len(symbols) * 2] * (_STATES - 1)
+    decisions: list[list[int]] = []
+    for symbol in symbols:
+        costs = [_DISTANCE[expected ^ symbol] for expected in _ENCODE]
+        step = [0] * _STATES
+        next_metrics = [0] * _STATES
+        for state in range(_STATES):
+            # ``state`` holds the last three bits; it is reached from two earlier states.
+            low = metrics[state >> 1] + costs[state]
+            high = metrics[(state >> 1) | 4] + costs[state | 8]
+            step[state] = int(high < low)
+            next_metrics[state] = min(low, high)
+        decisions.append(step)
+        metrics = next_metrics
+    state = metrics.index(min(metrics))
+    bits = []
+    for step in reversed(decisions):
+        bits.append(state & 1)
+        state = (state >> 1) | (step[state] << 2)
+    bits.reverse()
+    return bytes(
+        sum(bit << (7 - index) for index, bit in enumerate(bits[offset:offset + 8]))
+        for offset in range(0, len(bits), 8)
+    )
+
+
+def _fec_decode_array(data: Any) -> Any:
+    np = _numpy()
+    data = np.asarray(data, dtype=np.uint8)
+    if data.shape[-1] % 4:
+        raise ValueError("FEC frames are a whole number of 4-byte blocks")
+    frames = data.reshape(-1, data.shape[-1])
+    count = frames.shape[0]
+    received = np.stack([(frames >> shift) & 3 for shift in (6, 4, 2, 0)], axis=-1).reshape(count, -1, 16)
+    symbols = _interleave(received).reshape(count, -1)
+    expected = np.asarray(_ENCODE, dtype=np.uint8)
+    distance = np.asarray(_DISTANCE, dtype=np.int64)
+    states = np.arange(_STATES)
+    metrics = np.full((count, _STATES), symbols.shape[1] * 2, dtype=np.int64)
+    metrics[:, 0] = 0
+    decisions = np.empty((symbols.shape[1], count, _STATES), dtype=bool)
+    for step in range(symbols.shape[1]):
+        # Hamming distance from the received symbol to each window's code symbol.
+        costs = distance[expected[None, :] ^ symbols[:, step, None]]
+        low = metrics[:, states >> 1] + costs[:, states]
+        high = metrics[:, (states >> 1) | 4] + costs[:, states | 8]
+        decisions[step] = high < low
+        metrics = np.minimum(low, high)
+    state = metrics.argmin(axis=1)
+    rows = np.arange(count)
+    bits = np.empty((count, symbols.shape[1]), dtype=np.uint8)
+    for step in range(symbols.shape[1] - 1, -1, -1):
+        bits[:, step] = state & 1
+        state = (state >> 1) | (decisions[step, rows, state].astype(np.int64) << 2)
+    return np.packbits(bits, axis=1).reshape(*data.shape[:-1], -1)
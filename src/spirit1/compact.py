@@ -0,0 +1,168 @@
+"""Compact storage for large numbers of received messages."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .receiver import ReceivedMessage
+
+# Field lengths are packed into one integer: offset | payload | control | CRC.
+_CONTROL_SHIFT = 2
+_LENGTH_SHIFT = 5
+_OFFSET_SHIFT = 21
+
+
+class PayloadPool:
+    """Pack many payloads into a few shared, fixed-size ``bytearray`` slabs.
+
+    Slabs are append-only and are released by Python once every message stored
+    in them has been discarded, so long-lived collections pay one allocation
+    per slab rather than several per message.
+    """
+
+    def __init__(self, slab_size: int = 65_536):
+        if slab_size <= 0:
+            raise ValueError("Slab size must be greater than zero")
+        self.slab_size: int = slab_size
+        self._slab: bytearray = bytearray(slab_size)
+        self._used: int = 0
+
+    def store(self, *parts: Sequence[int]) -> tuple[bytes|bytearray, int]:
+        """Copy ``parts`` contiguously and return the backing buffer and offset."""
+        length = sum(len(part) for part in parts)
+        if length > self.slab_size:
+            return b"".join(bytes(part) for part in parts), 0
+        if self._used + length > self.slab_size:
+            # The previous slab stays alive for as long as messages use it.
+            self._slab = bytearray(self.slab_size)
+            self._used = 0
+        offset = self._used
+        for part in parts:
+            self._slab[self._used:self._used + len(part)] = part
+            self._used += len(part)
+        return self._slab, offset
+
+
+class CompactMessage:
+    """A slotted, read-only snapshot of a :class:`ReceivedMessage`.
+
+    The payload, control data and CRC share one buffer, optionally a
+    :class:`PayloadPool` slab.  :attr:`payload` is a read-only memoryview over
+    that buffer; copy it with ``bytes(message.payload)`` when needed.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_span",
+        "agc_word",
+        "crc_valid",
+        "destination_address",
+        "pqi",
+        "rssi",
+        "source_address",
+        "sqi",
+    )
+
+    def __init__(
+        self,
+        payload: Sequence[int] = b"",
+        crc_valid: bool|None = None,
+        rssi: int|None = None,
+        sqi: int|None = None,
+        pqi: int|None = None,
+        agc_word: int|None = None,
+        source_address: int|None = None,
+        destination_address: int|None = None,
+        control_data: bytes = b"",
+        crc: bytes = b"",
+        pool: PayloadPool|None = None,
+    ):
+        if len(payload) > 0xFFFF:
+            raise ValueError("Payload must not exceed 65535 bytes")
+        if len(control_data) > 4 or len(crc) > 3:
+            raise ValueError("Control data and CRC must fit SPIRIT1 packet fields")
+        if pool is None:
+            self._buffer, offset = bytes(payload) + control_data + crc, 0
+        else:
+            self._buffer, offset = pool.store(payload, control_data, crc)
+        self._span: int = (
+            (offset << _OFFSET_SHIFT)
+            | (len(payload) << _LENGTH_SHIFT)
+            | (len(control_data) << _CONTROL_SHIFT)
+            | len(crc)
+        )
+        self.crc_valid: bool|None = crc_valid
+        self.rssi: int|None = rssi
+        self.sqi: int|None = sqi
+        self.pqi: int|None = pqi
+        self.agc_word: int|None = agc_word
+        self.source_address: int|None = source_address
+        self.destination_address: int|None = destination_address
+
+    @classmethod
+    def from_received(cls, message: ReceivedMessage, pool: PayloadPool|None = None) -> CompactMessage:
+        return cls(
+            message.payload,
+            crc_valid=message.crc_valid,
+            rssi=message.rssi,
+            sqi=message.sqi,
+            pqi=message.pqi,
+            agc_word=message.agc_word,
+            source_address=message.source_address,
+            destination_address=message.destination_address,
+            control_data=message.control_data,
+            crc=message.crc,
+            pool=pool,
+        )
+
+    @property
+    def payload(self) -> memoryview:
+        offset, payload_length, _, _ = self._layout()
+        return memoryview(self._buffer).toreadonly()[offset:offset + payload_length]
+
+    @property
+    def control_data(self) -> bytes:
+        offset, payload_length, control_length, _ = self._layout()
+        start = offset + payload_length
+        return bytes(self._buffer[start:start + control_length])
+
+    @property
+    def crc(self) -> bytes:
+        offset, payload_length, control_length, crc_length = self._layout()
+        start = offset + payload_length + control_length
+        return bytes(self._buffer[start:start + crc_length])
+
+    def to_received(self) -> ReceivedMessage:
+        """Return an independent, mutable :class:`ReceivedMessage` copy."""
+        from .receiver import ReceivedMessage
+
+        return ReceivedMessage(
+            bytearray(self.payload),
+            crc_valid=self.crc_valid,
+            rssi=self.rssi,
+            sqi=self.sqi,
+            pqi=self.pqi,
+            agc_word=self.agc_word,
+            source_address=self.source_address,
+            destination_address=self.destination_address,
+            control_data=self.control_data,
+            crc=self.crc,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactMessage(payload={bytes(self.payload)!r}, crc_valid={self.crc_valid}, "
+            f"rssi={self.rssi}, source_address={self.source_address}, "
+            f"destination_address={self.destination_address})"
+        )
+
+    def _layout(self) -> tuple[int, int, int, int]:
+        span = self._span
+        return (
+            span >> _OFFSET_SHIFT,
+            (span >> _LENGTH_SHIFT) & 0xFFFF,
+            (span >> _CONTROL_SHIFT) & 0x07,
+            span & 0x03,
+        )
@@ -0,0 +1,435 @@
+"""Compile configuration objects into a SPIRIT1 register image.
+
+Compilation is pure: it reads only the configuration objects and never the
+device, so images can be built, compared and tested without hardware.
+Applying an image writes each run of consecutive registers in one burst.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import math
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from enum import Enum
+from typing import Any, Union
+
+from .basic_packet import BasicPacketConfig
+from .csma import CSMAConfig
+from .device import Register, Spirit1Device
+from .enums import CrcMode, Spirit1Modulation
+from .fifo import FifoConfig
+from .frequency import Frequency
+from .irq import IRQConfig
+from .modulation import CHANNEL_FILTER_BANDWIDTHS_26M
+from .qi import QIConfig
+from .radio import (
+    CHSPACE_DIVIDER,
+    DOUBLE_XTAL_THR,
+    FBASE_DIVIDER,
+    PPM_FACTOR,
+    channel_filter_me,
+    channel_space_factor,
+    datarate_me,
+    frequency_deviation_me,
+    frequency_offset_factor,
+    if_offsets,
+    synth_frequency,
+)
+from .radio_config import RadioConfig
+from .registers import Spirit1Registers
+from .stack_packet import StackPacketConfig
+from .timer import TimerConfig
+
+PacketConfig = Union[BasicPacketConfig, StackPacketConfig]
+
+# Number of compiled images kept by compile_registers().
+CACHE_SIZE = 32
+
+
+class RegisterImage(Mapping[int, tuple[int, int]]):
+    """Target register values, each with a mask of the bits the image sets.
+
+    Bits outside a register's mask belong to something else and are kept
+    from the device when the image is applied.  Images are immutable.
+    """
+
+    def __init__(self, entries: Mapping[Register, tuple[int, int]]|None = None):
+        self._entries: dict[int, tuple[int, int]] = {}
+        for register, (value, mask) in (entries or {}).items():
+            if not 0 <= mask <= 0xFF or not 0 <= value & mask <= 0xFF:
+                raise ValueError(f"Register 0x{int(register):02X} value 0x{value:X} does not fit in a byte")
+            self._entries[int(register)] = (value & mask, mask)
+
+    def __getitem__(self, register: Register) -> tuple[int, int]:
+        return self._entries[int(register)]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(sorted(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        entries = ", ".join(f"0x{register:02X}: 0x{value:02X}/0x{mask:02X}" for register, (value, mask) in self.items())
+        return f"RegisterImage({{{entries}}})"
+
+    def merge(self, other: Mapping[Register, tuple[int, int]]) -> RegisterImage:
+        """Return an image with ``other`` laid over this one."""
+        entries = dict(self._entries)
+        for register, (value, mask) in other.items():
+            old_value, old_mask = entries.get(int(register), (0, 0))
+            entries[int(register)] = ((old_value & ~mask) | (value & mask), old_mask | mask)
+        return RegisterImage(entries)
+
+    def changed(self, previous: Mapping[Register, tuple[int, int]]) -> RegisterImage:
+        """Return the entries of this image that differ from ``previous``."""
+        earlier = {int(register): entry for register, entry in previous.items()}
+        return RegisterImage({
+            register: entry for register, entry in self._entries.items() if earlier.get(register) != entry
+        })
+
+    def mismatches(self, values: Mapping[Register, int]) -> RegisterImage:
+        """Return the entries whose bits differ from the register ``values`` read from a device."""
+        current = {int(register): value for register, value in values.items()}
+        return RegisterImage({
+            register: (value, mask)
+            for register, (value, mask) in self._entries.items()
+            if current[register] & mask != value
+        })
+
+    def signature(self) -> str:
+        """Return a digest identifying the image's values and masks."""
+        data = bytes(byte for register, (value, mask) in self.items() for byte in (register, value, mask))
+        return hashlib.sha256(data).hexdigest()
+
+    def value(self, register: Register, current: int = 0) -> int:
+        """Return the byte to write over a register currently holding ``current``."""
+        value, mask = self._entries[int(register)]
+        return (current & ~mask & 0xFF) | value
+
+    def runs(self) -> list[list[int]]:
+        """Group the registers into runs of consecutive addresses."""
+        runs: list[list[int]] = []
+        for register in self:
+            if runs and runs[-1][-1] + 1 == register:
+                runs[-1].append(register)
+            else:
+                runs.append([register])
+        return runs
+
+    def apply(self, spirit: Spirit1Device, values: Mapping[Register, int]|None = None) -> None:
+        """Write the image, one burst per run of consecutive registers.
+
+        Runs containing partially owned registers are read first in a single
+        burst so that the bits the image does not own are preserved, unless
+        ``values`` already holds the current contents of every register in
+        the run.
+        """
+        known = {int(register): value for register, value in (values or {}).items()}
+        for run in self.runs():
+            current = [known.get(register, 0) for register in run]
+            if any(self._entries[register][1] != 0xFF for register in run) and not all(
+                register in known for register in run
+            ):
+                current = list(spirit.read_register_block(run[0], len(run)))
+            data = [self.value(register, byte) for register, byte in zip(run, current)]
+            _ = spirit.write_registers(run[0], *data)
+
+    def sync(self, spirit: Spirit1Device) -> RegisterImage:
+        """Write only the registers whose contents differ from the image.
+
+        The image's registers are fetched with coalesced block reads first.
+        Return the entries that were written, empty when the device already
+        matched.
+        """
+        values = spirit.read_registers(self)
+        stale = self.mismatches(values)
+        stale.apply(spirit, values)
+        return stale
+
+
+def radio_image(config: RadioConfig) -> RegisterImage:
+    """Compile the synthesizer, modem and channel settings of ``config``.
+
+    The reference divider must be resolved; read it from the device first
+    when ``config.reference_divider`` is ``None``.  VCO calibration is not
+    part of the image.
+    """
+    if config.reference_divider is None:
+        raise ValueError("Resolve the reference divider before compiling the radio configuration")
+    xtal = config.xtal_frequency
+    digital_divider = xtal > DOUBLE_XTAL_THR
+    analog_xtal = xtal / 2 if digital_divider else xtal
+    if_analog, if_digital = if_offsets(xtal)
+    offset = frequency_offset_factor(config.frequency_offset, config.base_frequency, xtal)
+    datarate_mantissa, datarate_exponent = datarate_me(config.datarate, xtal, digital_divider)
+    deviation_mantissa, deviation_exponent = frequency_deviation_me(config.freq_deviation, xtal)
+    filter_mantissa, filter_exponent = channel_filter_me(config.bandwidth, xtal, digital_divider)
+    synth = synth_frequency(config)
+    synt = synth.synt_reg_values(config.reference_divider, xtal)
+    return RegisterImage({
+        Spirit1Registers.ANA: (int(analog_xtal >= 25e6) << 6, 0x40),
+        Spirit1Registers.IF_OFFSET_ANA: (if_analog, 0xFF),
+        Spirit1Registers.SYNT_3: (synt[0], 0xFF),
+        Spirit1Registers.SYNT_2: (synt[1], 0xFF),
+        Spirit1Registers.SYNT_1: (synt[2], 0xFF),
+        Spirit1Registers.SYNT_0: (synt[3], 0xFF),
+        Spirit1Registers.CHANNEL_SPACE_FACTOR: (channel_space_factor(config.channel_space, xtal), 0xFF),
+        Spirit1Registers.IF_OFFSET_DIG: (if_digital, 0xFF),
+        Spirit1Registers.FC_OFFSET_HI: ((offset >> 8) & 0x0F, 0x0F),
+        Spirit1Registers.FC_OFFSET_LO: (offset & 0xFF, 0xFF),
+        Spirit1Registers.MOD1: (datarate_mantissa, 0xFF),
+        Spirit1Registers.MOD0: (config.modulation.value | datarate_exponent, 0x7F),
+        Spirit1Registers.FDEV0: ((deviation_exponent << 4) | deviation_mantissa, 0xF7),
+        Spirit1Registers.CHFLT: ((filter_mantissa << 4) + filter_exponent, 0xFF),
+        # Freeze AFC on sync.
+        Spirit1Registers.AFC_2: (0x80, 0x80),
+        Spirit1Registers.CHANNEL_NUMBER: (config.channel_number, 0xFF),
+        # Optimal IQC correction values.
+        Spirit1Registers.IQC_1: (0x80, 0xFF),
+        Spirit1Registers.IQC_0: (0xE3, 0xFF),
+        Spirit1Registers.SYNTH_CONFIG_HI: ((int(digital_divider) << 7) | synth.vco().value, 0x86),
+        # The higher SEL_TSPLIT time.
+        Spirit1Registers.SYNTH_CONFIG_LO: (0x80, 0x80),
+        # Enable DEM.
+        Spirit1Registers.DEM_CONFIG: (0x00, 0x02),
+        # Switch off the external SMPS.
+        Spirit1Registers.PM_CONFIG_2: (0x00, 0x20),
+        Spirit1Registers.XO_RCO_TEST: (int(not config.reference_divider) << 3, 0x08),
+    })
+
+
+def packet_image(config: PacketConfig) -> RegisterImage:
+    """Compile the packet format written by ``BasicPacket``/``StackPacket.apply()``."""
+    crc_enabled = config.crc_mode != CrcMode.CRC_MODE_OFF
+    packet_format = (config.preamble_length << 3) | ((config.sync_length - 1) << 1) | int(not config.fixed_length)
+    coding = (int(config.crc_mode) << 5) | (int(config.data_whitening) << 4) | int(config.fec)
+    entries: dict[Register, tuple[int, int]] = {
+        Spirit1Registers.PKTCTRL_2: (packet_format, 0xFF),
+        Spirit1Registers.PKTCTRL_1: (coding, 0xFF),
+        Spirit1Registers.PKTFLT_OPTS: (int(crc_enabled), 0x31),
+        Spirit1Registers.PROTOCOL_1: (0x01, 0x01),
+    }
+    if isinstance(config, StackPacketConfig):
+        entries[Spirit1Registers.PKTCTRL_4] = (0x10 | config.control_length, 0xFF)
+        entries[Spirit1Registers.PKTCTRL_3] = (0xC0 | (config.length_width - 1), 0xFF)
+        entries[Spirit1Registers.PROTOCOL_0] = (
+            (config.max_retransmissions << 4) | (int(config.no_ack) << 3) | (int(config.auto_ack) << 2),
+            0xFC,
+        )
+    else:
+        entries[Spirit1Registers.PKTCTRL_4] = ((int(config.address_field) << 3) | config.control_length, 0xFF)
+        entries[Spirit1Registers.PKTCTRL_3] = (config.length_width - 1, 0xFF)
+    for index, word in enumerate(reversed(config.sync_words)):
+        entries[Spirit1Registers.SYNC_4 + index] = (word, 0xFF)
+    return RegisterImage(entries)
+
+
+def qi_image(config: QIConfig) -> RegisterImage:
+    value = (
+        (config.sqi_threshold << 6)
+        | (config.pqi_threshold << 2)
+        | (int(config.sqi_enabled) << 1)
+        | int(config.pqi_enabled)
+    )
+    return RegisterImage({Spirit1Registers.QI: (value, 0xFF)})
+
+
+def irq_image(config: IRQConfig) -> RegisterImage:
+    mask = config.mask
+    return RegisterImage({
+        Spirit1Registers.IRQ_MASK_3 + index: ((mask >> (8 * (3 - index))) & 0xFF, 0xFF)
+        for index in range(4)
+    })
+
+
+def csma_image(config: CSMAConfig) -> RegisterImage:
+    seed = config.backoff_counter_seed
+    return RegisterImage({
+        Spirit1Registers.CSMA_CONFIG_3: ((seed >> 8) & 0xFF, 0xFF),
+        Spirit1Registers.CSMA_CONFIG_2: (seed & 0xFF, 0xFF),
+        Spirit1Registers.CSMA_CONFIG_1: (((config.backoff_prescaler & 0x3F) << 2) | config.cca_period.value, 0xFF),
+        Spirit1Registers.CSMA_CONFIG_0: (config.cca_length.value | config.max_backoffs, 0xFF),
+        Spirit1Registers.PROTOCOL_1: ((int(config.enabled) << 2) | (int(config.persist) << 1), 0x06),
+    })
+
+
+def timer_image(config: TimerConfig) -> RegisterImage:
+    stop_conditions = (
+        (int(config.stop_on_rssi) << 7)
+        | (int(config.stop_on_sqi) << 6)
+        | (int(config.stop_on_pqi) << 5)
+    )
+    return RegisterImage({
+        Spirit1Registers.PKTFLT_OPTS: (int(config.stop_conditions_or) << 7, 0x80),
+        Spirit1Registers.PROTOCOL_2: (stop_conditions, 0xE0),
+        Spirit1Registers.PROTOCOL_1: (int(config.ldc_reload_on_sync) << 6, 0x40),
+        Spirit1Registers.TIMERS_5: (config.timeout_prescaler, 0xFF),
+        Spirit1Registers.TIMERS_4: (config.timeout_counter, 0xFF),
+        Spirit1Registers.TIMERS_3: (config.wakeup_prescaler, 0xFF),
+        Spirit1Registers.TIMERS_2: (config.wakeup_counter, 0xFF),
+        Spirit1Registers.TIMERS_1: (config.ldc_reload_prescaler, 0xFF),
+        Spirit1Registers.TIMERS_0: (config.ldc_reload_counter, 0xFF),
+    })
+
+
+def fifo_image(config: FifoConfig) -> RegisterImage:
+    return RegisterImage({
+        Spirit1Registers.FIFO_CONFIG_3: (config.rx_almost_full, 0xFF),
+        Spirit1Registers.FIFO_CONFIG_2: (config.rx_almost_empty, 0xFF),
+        Spirit1Registers.FIFO_CONFIG_1: (config.tx_almost_full, 0xFF),
+        Spirit1Registers.FIFO_CONFIG_0: (config.tx_almost_empty, 0xFF),
+    })
+
+
+# Registers decode_radio() needs; read them with Spirit1Device.read_registers().
+RADIO_READBACK_REGISTERS: tuple[Spirit1Registers, ...] = (
+    Spirit1Registers.SYNT_3,
+    Spirit1Registers.SYNT_2,
+    Spirit1Registers.SYNT_1,
+    Spirit1Registers.SYNT_0,
+    Spirit1Registers.CHANNEL_SPACE_FACTOR,
+    Spirit1Registers.FC_OFFSET_HI,
+    Spirit1Registers.FC_OFFSET_LO,
+    Spirit1Registers.MOD1,
+    Spirit1Registers.MOD0,
+    Spirit1Registers.FDEV0,
+    Spirit1Registers.CHFLT,
+    Spirit1Registers.CHANNEL_NUMBER,
+    Spirit1Registers.SYNTH_CONFIG_HI,
+    Spirit1Registers.XO_RCO_TEST,
+)
+
+
+def decode_radio(values: Mapping[Register, int], xtal_frequency: int) -> RadioConfig:
+    """Rebuild a :class:`RadioConfig` from the registers in ``RADIO_READBACK_REGISTERS``.
+
+    Where several settings produce the same registers, values that compile
+    back to them are preferred, so recompiling the result and comparing
+    images detects drift.  The XTAL frequency cannot be read from the device
+    and must be supplied.
+    """
+    registers = {int(register): value for register, value in values.items()}
+    xtal = xtal_frequency
+    reference_divider = not registers[Spirit1Registers.XO_RCO_TEST] & 0x08
+    digital_divider = bool(registers[Spirit1Registers.SYNTH_CONFIG_HI] & 0x80)
+    channel_number = registers[Spirit1Registers.CHANNEL_NUMBER]
+
+    # channel_space_factor() rounds up, so pick the smallest spacing giving the factor.
+    space_factor = registers[Spirit1Registers.CHANNEL_SPACE_FACTOR]
+    channel_space = max(0, -(-(space_factor - 1) * xtal // CHSPACE_DIVIDER))
+
+    synt = [registers[Spirit1Registers.SYNT_3 + index] for index in range(4)]
+    word = ((synt[0] & 0x1F) << 21) + (synt[1] << 13) + (synt[2] << 5) + (synt[3] >> 3)
+    band = Frequency.frequency_band_from_reg(synt[3] & 0x07)
+    synth = _synth_frequency(word, xtal, reference_divider, Frequency._band_factor(band) // 2)
+
+    offset_factor = ((registers[Spirit1Registers.FC_OFFSET_HI] & 0x0F) << 8) | registers[Spirit1Registers.FC_OFFSET_LO]
+    if offset_factor & 0x800:
+        offset_factor -= 0x1000
+    frequency_offset = _frequency_offset(offset_factor, synth - channel_space * channel_number, xtal)
+
+    mod0 = registers[Spirit1Registers.MOD0]
+    try:
+        modulation = Spirit1Modulation(mod0 & 0x70)
+    except ValueError:
+        modulation = Spirit1Modulation(mod0 & 0x30)
+    clock = xtal >> (5 + int(digital_divider))
+    datarate = (clock * (256 + registers[Spirit1Registers.MOD1])) >> (23 - (mod0 & 0x0F))
+
+    fdev0 = registers[Spirit1Registers.FDEV0]
+    deviation = xtal / (1 << 18) * ((8 + (fdev0 & 0x07)) / 2 * (1 << (fdev0 >> 4)))
+
+    chflt = registers[Spirit1Registers.CHFLT]
+    filter_index = min((chflt >> 4) + 9 * (chflt & 0x0F), len(CHANNEL_FILTER_BANDWIDTHS_26M) - 1)
+    filter_factor = (xtal / (1 if digital_divider else 2)) / 100
+    bandwidth = CHANNEL_FILTER_BANDWIDTHS_26M[filter_index] * filter_factor / 2600
+
+    return RadioConfig(
+        xtal_frequency=xtal,
+        base_frequency=synth - frequency_offset - channel_space * channel_number,
+        channel_space=channel_space,
+        channel_number=channel_number,
+        modulation=modulation,
+        datarate=datarate,
+        freq_deviation=round(deviation),
+        bandwidth=round(bandwidth),
+        frequency_offset=frequency_offset,
+        reference_divider=reference_divider,
+        digital_divider=digital_divider,
+    )
+
+
+def _synth_frequency(word: int, xtal: int, divider: bool, half_band_factor: int) -> int:
+    """Return the lowest frequency whose synth word is ``word``."""
+    denominator = FBASE_DIVIDER * (int(divider) + 1) * half_band_factor
+    frequency = -(-word * xtal // denominator)
+    # Frequency.synth_word() truncates a float product; step past rounding.
+    for candidate in (frequency - 1, frequency, frequency + 1):
+        if Frequency(candidate).synth_word(divider, xtal) == word:
+            return candidate
+    return frequency
+
+
+def _frequency_offset(factor: int, base_frequency: int, xtal: int) -> int:
+    """Return an offset in ppm that frequency_offset_factor() maps to ``factor``."""
+    estimate = factor * xtal * PPM_FACTOR / (FBASE_DIVIDER * base_frequency)
+    candidates = sorted({math.floor(estimate), math.ceil(estimate)}, key=lambda offset: abs(offset - estimate))
+    for offset in candidates:
+        if frequency_offset_factor(offset, base_frequency - offset, xtal) == factor:
+            return offset
+    return candidates[0]
+
+
+_cache: OrderedDict[tuple[Any, ...], RegisterImage] = OrderedDict()
+
+
+def compile_registers(
+    radio: RadioConfig|None = None,
+    packet: PacketConfig|None = None,
+    qi: QIConfig|None = None,
+    irq: IRQConfig|None = None,
+    csma: CSMAConfig|None = None,
+    timer: TimerConfig|None = None,
+    fifo: FifoConfig|None = None,
+) -> RegisterImage:
+    """Compile the supplied configurations into one register image.
+
+    Results are cached by configuration value, so recompiling an unchanged
+    set of configurations is a dictionary lookup.  Invalid configurations
+    raise ``ValueError``.
+    """
+    configs = (radio, packet, qi, irq, csma, timer, fifo)
+    key = tuple(_freeze(config) for config in configs)
+    image = _cache.get(key)
+    if image is not None:
+        _cache.move_to_end(key)
+        return image
+    for config in configs:
+        errors = config.validate() if config is not None and hasattr(config, "validate") else []
+        if errors:
+            raise ValueError(f"Invalid {type(config).__name__}: {'; '.join(errors)}")
+    image = RegisterImage()
+    compilers = (radio_image, packet_image, qi_image, irq_image, csma_image, timer_image, fifo_image)
+    for compile_config, config in zip(compilers, configs):
+        if config is not None:
+            image = image.merge(compile_config(config))
+    _cache[key] = image
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return image
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable snapshot of a configuration value."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__name__, *(_freeze(getattr(value, item.name)) for item in dataclasses.fields(value)))
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -0,0 +1,155 @@
+"""Software versions of the SPIRIT1 packet CRCs.
+
+The packet handler computes the CRC most significant bit first over the
+length field (variable-length packets only), the address, the control bytes
+and the payload.  The 24-bit mode has been checked against captured packets;
+the other modes use the same seed and bit order.
+
+In the captured packets the length field counts the payload, the control
+bytes and the one-byte address.  :meth:`BasicPacketConfig.packet_length`
+counts two address bytes, so frames sent by :meth:`BasicPacket.transmit`
+with an address field carry a length one larger; pass that ``length`` to
+:func:`basic_packet_crc` to check them.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from ._numpy import require_numpy
+from .basic_packet import BasicPacketConfig, BasicPacketMessage
+from .enums import CrcMode
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (width, polynomial, seed) for each mode.  ST names the 24-bit mode after
+# 0x864CBF, but captured packets only check against 0x864CFB.
+_PARAMETERS: dict[CrcMode, tuple[int, int, int]] = {
+    CrcMode.CRC_MODE_7: (8, 0x07, 0xFF),
+    CrcMode.CRC_MODE_8005: (16, 0x8005, 0xFFFF),
+    CrcMode.CRC_MODE_1021: (16, 0x1021, 0xFFFF),
+    CrcMode.CRC_MODE_864CBF: (24, 0x864CFB, 0xFFFFFF),
+}
+
+
+class Crc:
+    """Table-driven CRC for one :class:`CrcMode`.
+
+    The update methods also accept NumPy integer arrays of CRC values, so a
+    batch of frames can be processed column by column.
+    """
+
+    def __init__(self, mode: CrcMode):
+        if mode not in _PARAMETERS:
+            raise ValueError(f"{mode.name} has no CRC")
+        self.mode: CrcMode = mode
+        self.width, self.polynomial, self.init = _PARAMETERS[mode]
+        self.mask: int = (1 << self.width) - 1
+        self.table: tuple[int, ...] = tuple(self.update_bits(value << (self.width - 8), 0, 8) for value in range(256))
+
+    @property
+    def length(self) -> int:
+        """Bytes of CRC appended to a packet."""
+        return self.mode.length
+
+    def update(self, crc: int, data: Iterable[int]) -> int:
+        """Feed ``data`` into ``crc``, one table lookup per byte."""
+        shift, mask, table = self.width - 8, self.mask, self.table
+        for byte in data:
+            crc = ((crc << 8) & mask) ^ table[((crc >> shift) ^ byte) & 0xFF]
+        return crc
+
+    def update_bits(self, crc: Any, value: Any, count: int) -> Any:
+        """Feed the ``count`` low bits of ``value``, most significant first."""
+        top = self.width - 1
+        for bit in reversed(range(count)):
+            feedback = ((crc >> top) ^ (value >> bit)) & 1
+            crc = ((crc << 1) & self.mask) ^ (feedback * self.polynomial)
+        return crc
+
+    def update_batch(self, crc: Any, frames: Any) -> np.ndarray:
+        """Feed the rows of an ``(n, length)`` byte array into ``n`` CRCs at once."""
+        np = require_numpy("Crc.update_batch")
+        frames = np.asarray(frames, dtype=np.uint8)
+        crc = np.array(np.broadcast_to(crc, frames.shape[:1]), dtype=np.int64)
+        shift, mask, table = self.width - 8, self.mask, np.asarray(self.table, dtype=np.int64)
+        for column in frames.T:
+            crc = ((crc << 8) & mask) ^ table[((crc >> shift) ^ column) & 0xFF]
+        return crc
+
+    def compute(self, data: Iterable[int]) -> int:
+        return self.update(self.init, data)
+
+
+@functools.cache
+def crc_engine(mode: CrcMode) -> Crc:
+    """Return a shared :class:`Crc` for ``mode``."""
+    return Crc(mode)
+
+
+def _covered_bytes(config: BasicPacketConfig, message: BasicPacketMessage) -> bytes:
+    """Return the address, control and payload bytes the CRC covers."""
+    if config.address_field:
+        if message.destination_address is None:
+            raise ValueError("Basic packet address field is enabled, but no destination was supplied")
+        address = bytes([message.destination_address])
+    else:
+        address = b""
+    control = bytes(message.control_data[:config.control_length])
+    if len(control) < config.control_length:
+        raise ValueError("Not enough control-data bytes for the configured packet format")
+    return address + control + bytes(message.payload)
+
+
+def _seed(config: BasicPacketConfig, crc: Crc, length: Any) -> Any:
+    """Return the CRC after a length field holding ``length``."""
+    if config.fixed_length:
+        return crc.init
+    return crc.update_bits(crc.init, length, config.length_width)
+
+
+def basic_packet_crc(config: BasicPacketConfig, message: BasicPacketMessage, length: int|None = None) -> bytes:
+    """Return the CRC SPIRIT1 sends with ``message``.
+
+    The bytes are in :attr:`ReceivedMessage.crc <spirit1.receiver.ReceivedMessage.crc>`
+    order, least significant first.  Use it to pre-check a frame before
+    transmitting it or to verify a captured one.  ``length`` is the value of
+    the length field and defaults to the number of bytes the CRC covers.
+    """
+    crc = crc_engine(config.crc_mode)
+    data = _covered_bytes(config, message)
+    return crc.update(_seed(config, crc, len(data) if length is None else length), data).to_bytes(crc.length, "little")
+
+
+def basic_packet_crcs(config: BasicPacketConfig, messages: Iterable[BasicPacketMessage]) -> list[bytes]:
+    """Return :func:`basic_packet_crc` with the default length for many messages.
+
+    With NumPy installed, messages of equal length are processed together.
+    """
+    crc = crc_engine(config.crc_mode)
+    frames = [_covered_bytes(config, message) for message in messages]
+    try:
+        np = require_numpy("basic_packet_crcs")
+    except RuntimeError:
+        return [crc.update(_seed(config, crc, len(data)), data).to_bytes(crc.length, "little") for data in frames]
+    by_length: dict[int, list[int]] = defaultdict(list)
+    for index, data in enumerate(frames):
+        by_length[len(data)].append(index)
+    results: list[bytes] = [b""] * len(frames)
+    for length, indexes in by_length.items():
+        block = np.frombuffer(b"".join(frames[index] for index in indexes), dtype=np.uint8)
+        values = crc.update_batch(_seed(config, crc, length), block.reshape(len(indexes), length))
+        for index, value in zip(indexes, values.tolist()):
+            results[index] = value.to_bytes(crc.length, "little")
+    return results
+
+
+def check_basic_packet_crc(config: BasicPacketConfig, message: BasicPacketMessage, length: int|None = None) -> bool:
+    """Return whether the CRC recorded with a received ``message`` is correct."""
+    if message.crc is None:
+        raise ValueError("The message has no recorded CRC")
+    return basic_packet_crc(config, message, length) == bytes(message.crc)
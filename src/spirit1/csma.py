@@ -1,11 +1,21 @@
-"""CSMA configuration."""
+"""CSMA configuration and busy-channel aware transmission."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, replace
 from enum import IntEnum
+from typing import TYPE_CHECKING
 
 from .device import Spirit1Device
 from .registers import Spirit1Registers
+from .transmitter import TransmitOutcome, TransmitResult
+
+if TYPE_CHECKING:
+    from .basic_packet import BasicPacket, BasicPacketMessage
+
+logger = logging.getLogger(__name__)
 
 
 class CCAPeriod(IntEnum):
@@ -43,6 +53,9 @@ class CSMAConfig:
     max_backoffs: int = 0
     backoff_counter_seed: int = 0xFF00
     backoff_prescaler: int = 1
+    host_retries: int = 0
+    host_backoff: float = 0.005
+    host_backoff_max: float = 0.1
 
     def validate(self) -> list[str]:
         errors: list[str] = []
@@ -52,15 +65,40 @@ class CSMAConfig:
             errors.append("Backoff counter seed must be a 16-bit value")
         if not 0 <= self.backoff_prescaler <= 0x3F:
             errors.append("Backoff prescaler must be between 0 and 63")
+        if self.host_retries < 0:
+            errors.append("Host retries must not be negative")
+        if not 0 <= self.host_backoff <= self.host_backoff_max:
+            errors.append("Host backoff must be between 0 and the maximum host backoff")
         return errors
 
 
+@dataclass
+class ChannelStats:
+    """Counts of CSMA transmissions, kept by :meth:`CSMA.transmit`."""
+
+    messages: int = 0
+    attempts: int = 0
+    busy: int = 0
+    sent: int = 0
+    failed: int = 0
+
+    @property
+    def busy_ratio(self) -> float:
+        """Fraction of attempts that found the channel busy."""
+        return self.busy / self.attempts if self.attempts else 0.0
+
+    def reset(self) -> None:
+        self.messages = self.attempts = self.busy = self.sent = self.failed = 0
+
+
 class CSMA:
-    """Applies :class:`CSMAConfig` to the device."""
+    """Applies :class:`CSMAConfig` to the device and sends with host backoff."""
 
-    def __init__(self, spirit: Spirit1Device, config: CSMAConfig|None = None):
+    def __init__(self, spirit: Spirit1Device, config: CSMAConfig|None = None, rng: random.Random|None = None):
         self.spirit: Spirit1Device = spirit
         self.config: CSMAConfig = config or CSMAConfig()
+        self.stats: ChannelStats = ChannelStats()
+        self._rng: random.Random = rng or random.Random()
 
     def apply(self) -> bool:
         if self.config.validate():
@@ -73,6 +111,37 @@ class CSMA:
             self.config.cca_length.value | self.config.max_backoffs,
         ]
         _ = self.spirit.write_registers(Spirit1Registers.CSMA_CONFIG_3, *registers)
-        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_1, 2, self.config.persist)
-        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_1, 1, self.config.enabled)
+        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_1, 2, self.config.enabled)
+        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_1, 1, self.config.persist)
         return True
+
+    async def transmit(self, packet: BasicPacket, message: BasicPacketMessage, timeout: float = 1.0) -> TransmitResult:
+        """Send a message, retrying from the host when CSMA finds the channel busy.
+
+        When the chip's own backoffs run out it raises MAX_BO_CCA_REACH, which
+        ends the attempt immediately instead of waiting for ``timeout``.  The
+        message is then retried up to ``host_retries`` times after a random
+        delay of up to ``host_backoff`` seconds, doubling per retry and capped
+        at ``host_backoff_max``.  Enable MAX_BO_CCA_REACH in the IRQ mask.
+        """
+        self.stats.messages += 1
+        attempt = 0
+        while True:
+            attempt += 1
+            self.stats.attempts += 1
+            result = await packet.transmit_async(message, timeout)
+            if result.outcome == TransmitOutcome.CHANNEL_BUSY:
+                self.stats.busy += 1
+            if result.outcome != TransmitOutcome.CHANNEL_BUSY or attempt > self.config.host_retries:
+                break
+            delay = self._rng.uniform(0, self._backoff_limit(attempt))
+            logger.debug("Channel busy on attempt %d; backing off for %.4f s", attempt, delay)
+            await asyncio.sleep(delay)
+        if result.sent:
+            self.stats.sent += 1
+        else:
+            self.stats.failed += 1
+        return replace(result, attempts=attempt)
+
+    def _backoff_limit(self, attempt: int) -> float:
+        return min(self.config.host_backoff_max, self.config.host_backoff * 2 ** (attempt - 1))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Iterable, Mapping
 from typing import AnyStr, Union
 
 from .enums import Spirit1Commands, Spirit1State
@@ -17,6 +18,22 @@ logger = logging.getLogger(__name__)
 Register = Union[Spirit1Registers, int]
 
 
+def register_bursts(values: Mapping[Register, int]) -> list[tuple[int, list[int]]]:
+    """Group register values into runs of consecutive addresses.
+
+    Each run can be written with a single :meth:`Spirit1Device.write_registers`
+    burst.
+    """
+    bursts: list[tuple[int, list[int]]] = []
+    for register in sorted(values):
+        address = int(register)
+        if bursts and bursts[-1][0] + len(bursts[-1][1]) == address:
+            bursts[-1][1].append(values[register])
+        else:
+            bursts.append((address, [values[register]]))
+    return bursts
+
+
 class Spirit1Device:
     """Low-level SPIRIT1 device driver backed by an SPI transport."""
 
@@ -128,6 +145,25 @@ class Spirit1Device:
         regs: tuple[int, ...] = (0x01, start_address) + tuple(0x0 for _ in range(count))
         return self._spi_xfer(*regs)
 
+    def read_registers(self, registers: Iterable[Register], max_gap: int = 4) -> dict[int, int]:
+        """Read scattered registers in as few block transactions as practical.
+
+        Registers at most ``max_gap`` unused addresses apart share one block,
+        as clocking a few extra bytes is cheaper than another transaction.
+        """
+        addresses = sorted({int(register) for register in registers})
+        values: dict[int, int] = {}
+        while addresses:
+            end = 0
+            while end + 1 < len(addresses) and addresses[end + 1] - addresses[end] <= max_gap + 1:
+                end += 1
+            start, stop = addresses[0], addresses[end]
+            block = self.read_register_block(start, stop - start + 1)
+            for address in addresses[:end + 1]:
+                values[address] = block[address - start]
+            addresses = addresses[end + 1:]
+        return values
+
     def write_registers(self, start_register: Register, *args: int) -> bytearray:
         start_address = start_register.value if isinstance(start_register, Spirit1Registers) else start_register
         regs = [0x00, start_address] + list(args)
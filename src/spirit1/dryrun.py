@@ -0,0 +1,178 @@
+"""Hardware-free SPI recording for measuring the cost of configuration paths."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+from .enums import Spirit1Commands, Spirit1State
+from .registers import Spirit1Registers
+
+_READ = 0x01
+_COMMAND = 0x80
+_FIFO = 0xFF
+_MC_STATE_1 = 0xC0
+_MC_STATE_0 = 0xC1
+
+# States entered by each command.  Commands missing here leave the state alone.
+_TRANSITIONS: dict[int, Spirit1State] = {
+    Spirit1Commands.TX: Spirit1State.TX,
+    Spirit1Commands.RX: Spirit1State.RX,
+    Spirit1Commands.READY: Spirit1State.READY,
+    Spirit1Commands.STANDBY: Spirit1State.STANDBY,
+    Spirit1Commands.SLEEP: Spirit1State.SLEEP,
+    Spirit1Commands.LOCKRX: Spirit1State.LOCK,
+    Spirit1Commands.LOCKTX: Spirit1State.LOCK,
+    Spirit1Commands.SABORT: Spirit1State.READY,
+    Spirit1Commands.SRES: Spirit1State.READY,
+}
+
+
+def _register_name(address: int) -> str:
+    if address == _FIFO:
+        return "FIFO"
+    try:
+        return Spirit1Registers(address).name
+    except ValueError:
+        return f"0x{address:02X}"
+
+
+@dataclass(frozen=True)
+class SpiTransaction:
+    """One SPI transfer: a register read or write, or a command."""
+
+    kind: str
+    address: int
+    data: bytes
+    state: Spirit1State
+
+    @property
+    def size(self) -> int:
+        """Bytes clocked on the bus, including the two header bytes."""
+        return 2 + len(self.data)
+
+    def describe(self) -> str:
+        if self.kind == "command":
+            return f"command {Spirit1Commands(self.address).name} -> {self.state.name}"
+        values = " ".join(f"{value:02x}" for value in self.data)
+        return f"{self.kind:<7} {_register_name(self.address)} [{len(self.data)}] {values}"
+
+
+@dataclass
+class DryRunReport:
+    """The SPI traffic recorded while running driver code against a :class:`RecordingSpi`."""
+
+    transactions: list[SpiTransaction] = field(default_factory=list)
+    transitions: list[tuple[Spirit1State, Spirit1State]] = field(default_factory=list)
+
+    @property
+    def bytes(self) -> int:
+        return sum(transaction.size for transaction in self.transactions)
+
+    @property
+    def reads(self) -> int:
+        return sum(transaction.kind == "read" for transaction in self.transactions)
+
+    @property
+    def writes(self) -> int:
+        return sum(transaction.kind == "write" for transaction in self.transactions)
+
+    @property
+    def commands(self) -> int:
+        return sum(transaction.kind == "command" for transaction in self.transactions)
+
+    @property
+    def state_polls(self) -> int:
+        """Status reads made while waiting for a commanded state change."""
+        polls = 0
+        after_command = False
+        for transaction in self.transactions:
+            if transaction.kind == "command":
+                after_command = True
+            elif after_command and transaction.kind == "read" and transaction.address == _MC_STATE_1:
+                polls += 1
+            else:
+                after_command = False
+        return polls
+
+    def estimated_time(
+        self,
+        spi_clock_hz: int = 250_000,
+        transaction_overhead: float = 50e-6,
+        poll_interval: float = 0.001,
+    ) -> float:
+        """Estimate wall time in seconds at ``spi_clock_hz``.
+
+        Every transaction costs its bits on the bus plus ``transaction_overhead``
+        for chip select and driver latency, and every state poll waits
+        ``poll_interval`` first, as :meth:`Spirit1Device._change_state` does.
+        """
+        if spi_clock_hz <= 0:
+            raise ValueError("SPI clock must be greater than zero")
+        return (
+            8 * self.bytes / spi_clock_hz
+            + len(self.transactions) * transaction_overhead
+            + self.state_polls * poll_interval
+        )
+
+    def format(self, spi_clock_hz: int = 250_000) -> str:
+        """Return the transaction list followed by a one-line summary."""
+        lines = [transaction.describe() for transaction in self.transactions]
+        lines.append(
+            f"{len(self.transactions)} transactions ({self.reads} reads, {self.writes} writes, "
+            f"{self.commands} commands), {self.bytes} bytes, {len(self.transitions)} state changes, "
+            f"~{self.estimated_time(spi_clock_hz) * 1000:.2f} ms at {spi_clock_hz / 1000:g} kHz"
+        )
+        return "\n".join(lines)
+
+
+class RecordingSpi:
+    """An SPI transport that emulates the SPIRIT1 register file and state machine.
+
+    Pass it to :class:`~spirit1.device.Spirit1Device` to run ``init_device()``,
+    peripheral ``apply()`` methods or receiver setup without hardware.  Writes
+    are stored and read back, commands change the reported state immediately,
+    and FIFO reads return zeros.  Every transfer is recorded; call
+    :meth:`report` to see them and :meth:`clear` to start a new measurement.
+    """
+
+    def __init__(self, registers: Mapping[int, int]|None = None, state: Spirit1State = Spirit1State.READY):
+        self.registers: bytearray = bytearray(256)
+        for address, value in (registers or {}).items():
+            self.registers[int(address)] = value
+        self.state: Spirit1State = state
+        self._report: DryRunReport = DryRunReport()
+
+    def xfer2(self, values: Sequence[int]) -> list[int]:
+        header, address, *data = values
+        status = [self.registers[_MC_STATE_1] | 0x02, (self.state.value << 1) | 0x01]
+        if header == _COMMAND:
+            previous = self.state
+            self.state = _TRANSITIONS.get(address, self.state)
+            if self.state != previous:
+                self._report.transitions.append((previous, self.state))
+            self._record("command", address, b"")
+            return status
+        if header == _READ:
+            if address == _FIFO:
+                result = bytes(len(data))
+            else:
+                self.registers[_MC_STATE_0] = status[1]
+                result = bytes(self.registers[address:address + len(data)]).ljust(len(data), b"\0")
+            self._record("read", address, result)
+            return status + list(result)
+        if address != _FIFO:
+            stored = bytes(data[:256 - address])
+            self.registers[address:address + len(stored)] = stored
+        self._record("write", address, bytes(data))
+        return status + [0] * len(data)
+
+    def report(self) -> DryRunReport:
+        """Return a snapshot of the traffic recorded since the last :meth:`clear`."""
+        return DryRunReport(list(self._report.transactions), list(self._report.transitions))
+
+    def clear(self) -> None:
+        self._report = DryRunReport()
+
+    def _record(self, kind: str, address: int, data: bytes) -> None:
+        self._report.transactions.append(SpiTransaction(kind, address, data, self.state))
@@ -0,0 +1,178 @@
+"""Airtime calculation and duty-cycle limited transmission scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .basic_packet import BasicPacketConfig
+from .radio_config import RadioConfig
+
+if TYPE_CHECKING:
+    from .basic_packet import BasicPacket, BasicPacketMessage
+    from .transmitter import TransmitResult
+
+logger = logging.getLogger(__name__)
+
+
+def airtime(radio_config: RadioConfig, packet_config: BasicPacketConfig, payload_length: int) -> float:
+    """Return the seconds a basic packet with ``payload_length`` bytes is on air.
+
+    FEC doubles every bit after the sync word.  Encoder tail bits and
+    interleaver padding are not included.
+    """
+    if payload_length < 0:
+        raise ValueError("Payload length must not be negative")
+    header_bits = 8 * (packet_config.preamble_length + packet_config.sync_length)
+    body_bits = 8 * (packet_config.packet_length(payload_length) + packet_config.crc_length)
+    if not packet_config.fixed_length:
+        body_bits += packet_config.length_width
+    if packet_config.fec:
+        body_bits *= 2
+    return (header_bits + body_bits) / radio_config.datarate
+
+
+def channel_frequency(radio_config: RadioConfig) -> int:
+    """Return the centre frequency of the configured channel in hertz."""
+    return radio_config.base_frequency + radio_config.channel_space * radio_config.channel_number
+
+
+@dataclass(frozen=True)
+class SubBand:
+    """A frequency range sharing one duty-cycle budget over a rolling window."""
+
+    name: str
+    low: int
+    high: int
+    duty_cycle: float
+    window: float = 3600.0
+
+    @property
+    def budget(self) -> float:
+        """Seconds of airtime allowed in any one window."""
+        return self.duty_cycle * self.window
+
+    def contains(self, frequency: int) -> bool:
+        return self.low <= frequency < self.high
+
+
+# Common 868 MHz SRD sub-bands (ERC Rec. 70-03 annex 1).  Check the limits
+# that apply to your device and region before relying on them.
+EU868_SUB_BANDS: tuple[SubBand, ...] = (
+    SubBand("h1.3", 863_000_000, 865_000_000, 0.001),
+    SubBand("h1.4", 865_000_000, 868_000_000, 0.01),
+    SubBand("h1.5", 868_000_000, 868_600_000, 0.01),
+    SubBand("h1.6", 868_700_000, 869_200_000, 0.001),
+    SubBand("h1.7", 869_400_000, 869_650_000, 0.1),
+    SubBand("h1.8", 869_700_000, 870_000_000, 0.01),
+)
+
+
+class DutyCycleScheduler:
+    """Delay transmissions until they fit their sub-band's duty-cycle budget.
+
+    Frames are released in the order they were submitted, each at the
+    earliest time its airtime fits in every rolling window.  Frequencies
+    outside all sub-bands are not limited.
+    """
+
+    def __init__(
+        self,
+        radio_config: RadioConfig,
+        sub_bands: Sequence[SubBand] = EU868_SUB_BANDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.radio_config: RadioConfig = radio_config
+        self.sub_bands: tuple[SubBand, ...] = tuple(sub_bands)
+        self.clock: Callable[[], float] = clock
+        self._usage: dict[str, deque[tuple[float, float]]] = {band.name: deque() for band in self.sub_bands}
+        self._lock: asyncio.Lock|None = None
+
+    def sub_band(self, frequency: int|None = None) -> SubBand|None:
+        """Return the sub-band for ``frequency``, defaulting to the configured channel."""
+        if frequency is None:
+            frequency = channel_frequency(self.radio_config)
+        return next((band for band in self.sub_bands if band.contains(frequency)), None)
+
+    def used(self, band: SubBand, now: float|None = None) -> float:
+        """Return the airtime used in the window ending at ``now``."""
+        if now is None:
+            now = self.clock()
+        return self._used_between(band, now - band.window, now)
+
+    def earliest(self, duration: float, frequency: int|None = None, now: float|None = None) -> float:
+        """Return the earliest clock time a frame of ``duration`` seconds may start."""
+        if now is None:
+            now = self.clock()
+        band = self.sub_band(frequency)
+        if band is None:
+            return now
+        if duration > band.budget:
+            raise ValueError(f"A {duration:.3f} s frame exceeds the {band.name} budget of {band.budget:.3f} s")
+        # Allow for rounding when usage exactly fills the budget.
+        target = band.budget - duration + 1e-9
+
+        def used_at(start: float) -> float:
+            return self._used_between(band, start + duration - band.window, start + duration)
+
+        used = used_at(now)
+        if used <= target:
+            return now
+        # Usage changes linearly between the times a window edge crosses the
+        # start or end of a recorded frame, so find the first such point that
+        # fits and interpolate back into the segment before it.
+        edges = sorted({
+            edge - duration + offset
+            for frame in self._usage[band.name]
+            for edge in frame
+            for offset in (0.0, band.window)
+        })
+        previous = now
+        for point in (edge for edge in edges if edge > now):
+            point_used = used_at(point)
+            if point_used <= target:
+                return previous + (used - target) * (point - previous) / (used - point_used)
+            previous, used = point, point_used
+        return previous
+
+    def record(self, duration: float, start: float|None = None, frequency: int|None = None) -> None:
+        """Account for ``duration`` seconds of airtime starting at ``start``."""
+        band = self.sub_band(frequency)
+        if band is None:
+            return
+        if start is None:
+            start = self.clock()
+        usage = self._usage[band.name]
+        usage.append((start, start + duration))
+        while usage and usage[0][1] <= start - band.window:
+            usage.popleft()
+
+    async def transmit(self, packet: BasicPacket, message: BasicPacketMessage, timeout: float = 1.0) -> TransmitResult:
+        """Wait until ``message`` fits the duty-cycle budget, then send it.
+
+        The frame's airtime is reserved when it is released, whether or not
+        the transmission then succeeds.  Concurrent callers are sent one at a
+        time, so frames never overlap on air.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        duration = airtime(self.radio_config, packet.config, len(message.payload))
+        async with self._lock:
+            start = self.earliest(duration)
+            delay = start - self.clock()
+            if delay > 0:
+                logger.debug("Holding a %.4f s frame for %.3f s to respect the duty cycle", duration, delay)
+                await asyncio.sleep(delay)
+            self.record(duration, max(start, self.clock()))
+            return await packet.transmit_async(message, timeout)
+
+    def _used_between(self, band: SubBand, start: float, end: float) -> float:
+        return sum(
+            max(0.0, min(end, used_end) - max(start, used_start))
+            for used_start, used_end in self._usage[band.name]
+        )
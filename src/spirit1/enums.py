@@ -45,3 +45,8 @@ class CrcMode(IntEnum):
     CRC_MODE_8005   = 2
     CRC_MODE_1021   = 3
     CRC_MODE_864CBF = 4
+
+    @property
+    def length(self) -> int:
+        """Bytes of CRC appended to a packet in this mode."""
+        return (0, 1, 2, 2, 3)[self]
@@ -0,0 +1,52 @@
+"""Linear FIFO threshold configuration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .device import Spirit1Device
+from .registers import Spirit1Registers
+
+LINEAR_FIFO_SIZE = 96
+
+
+@dataclass
+class FifoConfig:
+    """Byte thresholds for the FIFO almost-full and almost-empty IRQs.
+
+    ``tx_almost_empty`` sets when TX_FIFO_ALMOST_EMPTY asks for a refill while
+    a payload larger than the FIFO is streamed.  The defaults match the reset
+    values.
+    """
+
+    rx_almost_full: int = 48
+    rx_almost_empty: int = 48
+    tx_almost_full: int = 48
+    tx_almost_empty: int = 48
+
+    def validate(self) -> list[str]:
+        errors: list[str] = []
+        for name in ("rx_almost_full", "rx_almost_empty", "tx_almost_full", "tx_almost_empty"):
+            if not 0 <= getattr(self, name) <= LINEAR_FIFO_SIZE:
+                errors.append(f"{name.replace('_', ' ').capitalize()} threshold must be between 0 and 96 bytes")
+        return errors
+
+
+class Fifo:
+    """Applies :class:`FifoConfig` to the device."""
+
+    def __init__(self, spirit: Spirit1Device, config: FifoConfig|None = None):
+        self.spirit: Spirit1Device = spirit
+        self.config: FifoConfig = config or FifoConfig()
+
+    def apply(self) -> bool:
+        if self.config.validate():
+            return False
+        _ = self.spirit.write_registers(
+            Spirit1Registers.FIFO_CONFIG_3,
+            self.config.rx_almost_full,
+            self.config.rx_almost_empty,
+            self.config.tx_almost_full,
+            self.config.tx_almost_empty,
+        )
+        return True
@@ -0,0 +1,157 @@
+"""Array versions of the :class:`~spirit1.frequency.Frequency` calculations.
+
+Each function accepts anything NumPy can turn into an array and returns
+results identical, element for element, to the scalar methods.  NumPy is an
+optional dependency and is imported when a function is first called.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ._numpy import require_numpy
+from .frequency import FBASE_DIVIDER, FrequencyBand, VCOSetting
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# (band, low, high) limits in hertz, in the order Frequency checks them.
+_BAND_LIMITS: tuple[tuple[FrequencyBand, int, int], ...] = (
+    (FrequencyBand.HIGH_BAND, 778_000_000, 957_100_000),
+    (FrequencyBand.MIDDLE_BAND, 386_000_000, 471_100_000),
+    (FrequencyBand.LOW_BAND, 299_000_000, 349_100_000),
+    (FrequencyBand.VERY_LOW_BAND, 149_000_000, 175_100_000),
+)
+
+# Indexed by FrequencyBand value.
+_BAND_FACTORS: tuple[int, ...] = (6, 12, 16, 32)
+_BAND_REG_VALUES: tuple[int, ...] = (1, 3, 4, 5)
+_VCO_THRESHOLDS: tuple[float, ...] = (860166667, 430083334, 322562500, 161281250)
+
+_WCP_VCO_FREQUENCIES: tuple[int, ...] = (
+    4644, 4708, 4772, 4836, 4902, 4966, 5030, 5095,
+    5161, 5232, 5303, 5375, 5448, 5519, 5592, 5663,
+)
+
+
+def _numpy() -> Any:
+    return require_numpy("spirit1.frequency_array")
+
+
+def _frequencies(frequencies: Any) -> np.ndarray:
+    np = _numpy()
+    return np.asarray(frequencies, dtype=np.int64)
+
+
+def frequency_bands(frequencies: Any) -> np.ndarray:
+    """Return the :class:`FrequencyBand` value for each frequency."""
+    np = _numpy()
+    frequencies = _frequencies(frequencies)
+    bands = np.full(frequencies.shape, FrequencyBand.HIGH_BAND.value, dtype=np.int8)
+    assigned = np.zeros(frequencies.shape, dtype=bool)
+    for band, low, high in _BAND_LIMITS:
+        match = ~assigned & (frequencies >= low) & (frequencies <= high)
+        bands[match] = band.value
+        assigned |= match
+    return bands
+
+
+def is_possible(frequencies: Any) -> np.ndarray:
+    """Return whether each frequency lies in one of the SPIRIT1 bands."""
+    np = _numpy()
+    frequencies = _frequencies(frequencies)
+    possible = np.zeros(frequencies.shape, dtype=bool)
+    for _, low, high in _BAND_LIMITS:
+        possible |= (frequencies >= low) & (frequencies <= high)
+    return possible
+
+
+def band_factors(bands: Any) -> np.ndarray:
+    np = _numpy()
+    return np.asarray(_BAND_FACTORS, dtype=np.int64)[np.asarray(bands)]
+
+
+def band_reg_values(bands: Any) -> np.ndarray:
+    """Return the SYNT_0 band selection bits for each band."""
+    np = _numpy()
+    return np.asarray(_BAND_REG_VALUES, dtype=np.uint8)[np.asarray(bands)]
+
+
+def bands_from_reg(values: Any) -> np.ndarray:
+    """Return the band for each SYNT_0 band selection value (bits 2:0)."""
+    np = _numpy()
+    values = np.asarray(values)
+    bands = np.full(values.shape, FrequencyBand.HIGH_BAND.value, dtype=np.int8)
+    for band, value in zip(FrequencyBand, _BAND_REG_VALUES):
+        if band != FrequencyBand.HIGH_BAND:
+            bands[values == value] = band.value
+    return bands
+
+
+def vco_settings(frequencies: Any) -> np.ndarray:
+    """Return the :class:`VCOSetting` value for each frequency."""
+    np = _numpy()
+    frequencies = _frequencies(frequencies)
+    thresholds = np.asarray(_VCO_THRESHOLDS)[frequency_bands(frequencies)]
+    return np.where(frequencies < thresholds, VCOSetting.VCO_L.value, VCOSetting.VCO_H.value).astype(np.uint8)
+
+
+def charge_pump_words(frequencies: Any) -> np.ndarray:
+    """Return the WCP charge pump word for each frequency."""
+    np = _numpy()
+    frequencies = _frequencies(frequencies)
+    vco_frequency = (frequencies / 1000000) * band_factors(frequency_bands(frequencies))
+    table = np.asarray(_WCP_VCO_FREQUENCIES, dtype=float)
+    # The first of the lower 15 entries above the VCO frequency, or 0 if none is.
+    index = np.searchsorted(table[:15], vco_frequency, side="right")
+    index = np.where(index == 15, 0, index)
+    closer_below = (index != 0) & (table[index] - vco_frequency > vco_frequency - table[index - 1])
+    index = np.where(closer_below, index - 1, index)
+    index = np.where(vco_frequency >= table[15], 15, index)
+    return (index % 8).astype(np.uint8)
+
+
+def synth_words(frequencies: Any, divider: bool, xtal: int) -> np.ndarray:
+    """Return the synthesizer word for each frequency."""
+    np = _numpy()
+    frequencies = _frequencies(frequencies)
+    half_band = band_factors(frequency_bands(frequencies)) // 2
+    return np.trunc(frequencies * half_band * ((FBASE_DIVIDER * (int(divider) + 1)) / xtal)).astype(np.int64)
+
+
+def synt_registers(frequencies: Any, divider: bool, xtal: int) -> np.ndarray:
+    """Return SYNT_3..SYNT_0 for each frequency as an ``(..., 4)`` uint8 array."""
+    np = _numpy()
+    frequencies = _frequencies(frequencies)
+    words = synth_words(frequencies, divider, xtal)
+    registers = np.empty((*frequencies.shape, 4), dtype=np.uint8)
+    registers[..., 0] = (charge_pump_words(frequencies) << 5) + ((words >> 21) & 0x1F)
+    registers[..., 1] = (words >> 13) & 0xFF
+    registers[..., 2] = (words >> 5) & 0xFF
+    registers[..., 3] = ((words & 0x1F) << 3) + band_reg_values(frequency_bands(frequencies))
+    return registers
+
+
+def decode_synt_registers(registers: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Return the synth words and bands held in ``(..., 4)`` SYNT_3..SYNT_0 arrays."""
+    np = _numpy()
+    registers = np.asarray(registers, dtype=np.int64)
+    words = (
+        ((registers[..., 0] & 0x1F) << 21)
+        + (registers[..., 1] << 13)
+        + (registers[..., 2] << 5)
+        + ((registers[..., 3] & 0xF8) >> 3)
+    )
+    return words, bands_from_reg(registers[..., 3] & 0x07)
+
+
+def calculate(words: Any, xtal: int, divider: bool, bands: Any) -> np.ndarray:
+    """Return the frequency for each synth word, as :meth:`Frequency.calculate` does.
+
+    ``bands`` holds :class:`FrequencyBand` values, as returned by
+    :func:`decode_synt_registers`.
+    """
+    np = _numpy()
+    factor = band_factors(bands) / 2
+    words = np.asarray(words, dtype=np.int64)
+    return np.rint(words * xtal / (FBASE_DIVIDER * (int(divider) + 1) * factor)).astype(np.int64)
@@ -14,6 +14,14 @@ class ShutdownPin(Protocol):
     def set_value(self, value: bool) -> None:
         """Drive SDN high (shutdown) or low (operate)."""
 
+
+class IrqPin(Protocol):
+    """Host input connected to a SPIRIT1 GPIO configured as nIRQ."""
+
+    def wait(self, timeout: float|None = None) -> bool:
+        """Block until nIRQ is asserted, returning ``False`` on timeout."""
+
+
 class _OutputDevice(Protocol):
     @property
     def value(self) -> float: ...
@@ -24,6 +32,12 @@ class _OutputDevice(Protocol):
     def close(self) -> None: ...
 
 
+class _InputDevice(Protocol):
+    def wait_for_active(self, timeout: float|None = None) -> bool: ...
+
+    def close(self) -> None: ...
+
+
 class GpioZeroShutdownPin:
     """Adapt a :class:`gpiozero.OutputDevice` to :class:`ShutdownPin`."""
 
@@ -40,6 +54,19 @@ class GpioZeroShutdownPin:
         self._output_device.close()
 
 
+class GpioZeroIrqPin:
+    """Adapt a :class:`gpiozero.DigitalInputDevice` to :class:`IrqPin`."""
+
+    def __init__(self, input_device: _InputDevice) -> None:
+        self._input_device: _InputDevice = input_device
+
+    def wait(self, timeout: float|None = None) -> bool:
+        return bool(self._input_device.wait_for_active(timeout))
+
+    def close(self) -> None:
+        self._input_device.close()
+
+
 def open_gpiozero_sdn(pin: int = 4, *, initial_value: bool|None = None) -> GpioZeroShutdownPin:
     """Open an active-high SDN pin using optional :mod:`gpiozero` support.
 
@@ -56,3 +83,19 @@ def open_gpiozero_sdn(pin: int = 4, *, initial_value: bool|None = None) -> GpioZ
     return GpioZeroShutdownPin(
         OutputDevice(pin, active_high=True, initial_value=initial_value),
     )
+
+
+def open_gpiozero_irq(pin: int = 25) -> GpioZeroIrqPin:
+    """Open the active-low nIRQ input using optional :mod:`gpiozero` support.
+
+    The pull-up keeps the line inactive while SPIRIT1 is shut down.  GPIO25 is
+    physical header pin 22.
+    """
+    try:
+        from gpiozero import DigitalInputDevice
+    except ImportError as error:
+        raise RuntimeError(
+            "open_gpiozero_irq() requires the optional 'gpiozero' dependency; " +
+            "install spirit1[gpio]"
+        ) from error
+    return GpioZeroIrqPin(DigitalInputDevice(pin, pull_up=True))
@@ -0,0 +1,276 @@
+"""Frequency-hopping sequencer built on a calibrated channel table."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .channels import _TUNING_REGISTERS, ChannelTable
+from .duty_cycle import airtime
+from .frequency import FBASE_DIVIDER, Frequency
+from .radio import channel_step
+from .registers import Spirit1Registers
+
+if TYPE_CHECKING:
+    from .basic_packet import BasicPacket, BasicPacketMessage
+    from .transmitter import TransmitResult
+
+logger = logging.getLogger(__name__)
+
+
+def hop_sequence(channels: int, seed: int = 1) -> list[int]:
+    """Return a pseudo-random permutation of ``range(channels)``.
+
+    The permutation is a Fisher-Yates shuffle driven by a 32-bit xorshift
+    generator (shifts 13, 17, 5) seeded with ``seed``, so peers written in
+    other languages can reproduce it.
+    """
+    if channels < 1:
+        raise ValueError("A hop sequence needs at least one channel")
+    state = seed & 0xFFFFFFFF or 1
+    sequence = list(range(channels))
+    for index in range(channels - 1, 0, -1):
+        state ^= (state << 13) & 0xFFFFFFFF
+        state ^= state >> 17
+        state ^= (state << 5) & 0xFFFFFFFF
+        swap = state % (index + 1)
+        sequence[index], sequence[swap] = sequence[swap], sequence[index]
+    return sequence
+
+
+@dataclass
+class HopStats:
+    """Counters describing how closely the hopper kept its schedule."""
+
+    hops: int = 0
+    missed: int = 0
+    late: int = 0
+    resyncs: int = 0
+    max_lateness: float = 0.0
+
+    def reset(self) -> None:
+        self.hops = self.missed = self.late = self.resyncs = 0
+        self.max_lateness = 0.0
+
+
+class FrequencyHopper:
+    """Retune through a channel table on a fixed dwell-time schedule.
+
+    Slot ``n`` starts at ``epoch + n * dwell`` and uses table entry
+    ``sequence[n % len(sequence)]``.  When every channel lies on the radio's
+    channel raster (``base_frequency + k * step`` to within one synthesizer
+    step, with one VCO and band, where ``step`` is the quantised channel
+    spacing), :meth:`start` programs the base synthesizer once and each hop is a
+    single precomputed burst of CHANNEL_NUMBER and the RCO/VCO calibration
+    words.  Other tables fall back to :meth:`ChannelTable.hop`.  Either way
+    the radio is told that its synthesizer registers were rewritten.
+
+    Hops that start more than ``max_lateness`` seconds after their slot
+    boundary are counted as late; slots skipped entirely are counted as
+    missed.
+    """
+
+    def __init__(
+        self,
+        table: ChannelTable,
+        sequence: Sequence[int],
+        dwell: float,
+        max_lateness: float|None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if dwell <= 0:
+            raise ValueError("Dwell time must be greater than zero")
+        if not sequence:
+            raise ValueError("The hop sequence must not be empty")
+        if any(not 0 <= index < len(table) for index in sequence):
+            raise ValueError("The hop sequence refers to channels outside the table")
+        if not table.calibrated:
+            raise ValueError("The channel table must be calibrated before hopping")
+        self.table: ChannelTable = table
+        self.sequence: tuple[int, ...] = tuple(sequence)
+        self.dwell: float = dwell
+        self.max_lateness: float = dwell / 10 if max_lateness is None else max_lateness
+        self.clock: Callable[[], float] = clock
+        self.stats: HopStats = HopStats()
+        self.epoch: float|None = None
+        self.receiving: bool = False
+        self._raster: list[int]|None = self._raster_channels()
+        self._bursts: list[tuple[int, int, int, int]] = []
+        self._last_slot: int|None = None
+        self._running: bool = False
+        self._lock: asyncio.Lock|None = None
+        self._wake: asyncio.Event|None = None
+
+    @property
+    def single_burst(self) -> bool:
+        """True when each hop is one CHANNEL_NUMBER burst."""
+        return self._raster is not None
+
+    def slot(self, now: float|None = None) -> int:
+        """Return the slot number in progress at ``now``."""
+        if self.epoch is None:
+            raise RuntimeError("The hopper has not been started")
+        if now is None:
+            now = self.clock()
+        return math.floor((now - self.epoch) / self.dwell)
+
+    def slot_start(self, slot: int) -> float:
+        if self.epoch is None:
+            raise RuntimeError("The hopper has not been started")
+        return self.epoch + slot * self.dwell
+
+    def channel(self, slot: int) -> int:
+        """Return the table index used in ``slot``."""
+        return self.sequence[slot % len(self.sequence)]
+
+    def time_left(self, now: float|None = None) -> float:
+        """Return the seconds remaining in the current slot."""
+        if now is None:
+            now = self.clock()
+        return self.slot_start(self.slot(now) + 1) - now
+
+    def start(self, epoch: float|None = None, receive: bool = False) -> bool:
+        """Program the shared synthesizer settings and hop to the current slot."""
+        spirit = self.table.radio.spirit
+        self.epoch = self.clock() if epoch is None else epoch
+        self.receiving = receive
+        self._last_slot = None
+        if self._raster is not None:
+            rco_word = spirit.read_register(Spirit1Registers.RCO_VCO_CALIBR_IN2)
+            self._bursts = [
+                (channel, rco_word, entry.vco_tx, entry.vco_rx)
+                for channel, entry in zip(self._raster, self.table.entries)
+            ]
+            base = self.table.radio.config.base_frequency
+            spirit.update_register(Spirit1Registers.SYNTH_CONFIG_HI, 0xF9, self.table[0].vco_select)
+            _ = spirit.write_registers(
+                Spirit1Registers.SYNT_3,
+                *Frequency(base).synt_reg_values(self.table.radio.reference_divider, self.table.radio.xtal_frequency),
+            )
+        return self.hop()
+
+    def hop(self, slot: int|None = None) -> bool:
+        """Retune for ``slot`` (default: the slot in progress) and update the statistics."""
+        now = self.clock()
+        if slot is None:
+            slot = self.slot(now)
+        spirit = self.table.radio.spirit
+        if self.receiving:
+            _ = spirit.sabort()
+        if self._raster is not None:
+            _ = spirit.write_registers(Spirit1Registers.CHANNEL_NUMBER, *self._bursts[self.channel(slot)])
+            self.table.radio.invalidate(_TUNING_REGISTERS)
+            result = spirit.start_rx() if self.receiving else True
+        else:
+            result = self.table.hop(self.channel(slot), start_rx=self.receiving)
+        self._account(slot, now - self.slot_start(slot))
+        return result
+
+    def resync(self, position: int, received_at: float|None = None, offset: float = 0.0) -> None:
+        """Align the schedule with a beacon sent ``offset`` seconds into sequence ``position``.
+
+        The new epoch is the one closest to the current schedule, so slot
+        numbers keep counting and missed-hop statistics stay meaningful.
+        """
+        if received_at is None:
+            received_at = self.clock()
+        start = received_at - offset - position * self.dwell
+        if self.epoch is not None:
+            period = len(self.sequence) * self.dwell
+            start += round((self.epoch - start) / period) * period
+            logger.debug("Resynchronised the hop schedule by %.6f s", start - self.epoch)
+        self.epoch = start
+        self._last_slot = None
+        self.stats.resyncs += 1
+        if self._wake is not None:
+            self._wake.set()
+
+    async def run(self) -> None:
+        """Hop at every slot boundary until :meth:`stop` is called."""
+        if self.epoch is None:
+            raise RuntimeError("The hopper has not been started")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._running = True
+        while self._running:
+            delay = self.slot_start(self.slot() + 1) - self.clock()
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(0.0, delay))
+            except asyncio.TimeoutError:
+                pass
+            if not self._running:
+                break
+            async with self._lock:
+                slot = self.slot()
+                if slot != self._last_slot:
+                    _ = self.hop(slot)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._wake is not None:
+            self._wake.set()
+
+    async def transmit(self, packet: BasicPacket, message: BasicPacketMessage, timeout: float = 1.0) -> TransmitResult:
+        """Send ``message`` within a single dwell, waiting for the next slot if needed.
+
+        The current slot is hopped to first if :meth:`run` has not done so
+        yet.  Hops are held off while the frame is on air.
+        """
+        duration = airtime(self.table.radio.config, packet.config, len(message.payload))
+        if duration > self.dwell:
+            raise ValueError(f"A {duration:.4f} s frame does not fit in a {self.dwell:.4f} s dwell")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        while True:
+            async with self._lock:
+                slot = self.slot()
+                if slot != self._last_slot:
+                    _ = self.hop(slot)
+                if self.time_left() >= duration:
+                    return await packet.transmit_async(message, timeout)
+            await asyncio.sleep(self.time_left())
+
+    def _account(self, slot: int, lateness: float) -> None:
+        stats = self.stats
+        if self._last_slot is not None and slot > self._last_slot + 1:
+            stats.missed += slot - self._last_slot - 1
+        if lateness > self.max_lateness:
+            stats.late += 1
+            logger.debug("Hop for slot %d was %.6f s late", slot, lateness)
+        stats.max_lateness = max(stats.max_lateness, lateness)
+        stats.hops += 1
+        self._last_slot = slot
+
+    def _raster_channels(self) -> list[int]|None:
+        radio = self.table.radio
+        config = radio.config
+        base = Frequency(config.base_frequency)
+        if config.channel_space <= 0 or not base.is_possible():
+            return None
+        # Compare what the synthesizer produces, not the nominal frequencies.
+        resolution = radio.xtal_frequency / (
+            FBASE_DIVIDER * (int(radio.reference_divider) + 1) * base.half_band_factor()
+        )
+        origin = base.synth_word(radio.reference_divider, radio.xtal_frequency) * resolution
+        step = channel_step(config.channel_space, radio.xtal_frequency)
+        channels = []
+        for entry in self.table.entries:
+            synth = Frequency(entry.frequency)
+            target = synth.synth_word(radio.reference_divider, radio.xtal_frequency) * resolution
+            channel = round((target - origin) / step)
+            if (
+                abs(origin + channel * step - target) > resolution
+                or not 0 <= channel <= 0xFF
+                or entry.vco_select != base.vco().value
+                or synth.frequency_band != base.frequency_band
+            ):
+                return None
+            channels.append(channel)
+        return channels
@@ -6,8 +6,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from .device import Spirit1Device
+from .gpio import IrqPin
 from .registers import Spirit1Registers
 
+# GPIO_n_CONF value selecting the nIRQ signal as a low-power digital output.
+GPIO_NIRQ_OUTPUT = 0x02
+
 
 class SpiritIrq(Enum):
     RX_DATA_READY = 1 << 0
@@ -53,17 +57,33 @@ class IRQConfig:
 
 
 class IRQ:
-    """Applies :class:`IRQConfig` and reads interrupt status."""
+    """Applies :class:`IRQConfig` and reads interrupt status.
+
+    When ``pin`` is supplied, callers can block on the nIRQ line instead of
+    polling the status registers over SPI.
+    """
 
-    def __init__(self, spirit: Spirit1Device, config: IRQConfig|None = None):
+    def __init__(
+        self,
+        spirit: Spirit1Device,
+        config: IRQConfig|None = None,
+        pin: IrqPin|None = None,
+    ):
         self.spirit: Spirit1Device = spirit
         self.config: IRQConfig = config or IRQConfig()
+        self.pin: IrqPin|None = pin
 
     def apply(self) -> None:
         mask = self.config.mask
         values = [(mask >> (8 * index)) & 0xFF for index in range(3, -1, -1)]
         _ = self.spirit.write_registers(Spirit1Registers.IRQ_MASK_3, *values)
 
+    def route_to_gpio(self, gpio: int) -> None:
+        """Drive the active-low nIRQ signal on SPIRIT1 GPIO 0 to 3."""
+        if not 0 <= gpio <= 3:
+            raise ValueError("SPIRIT1 GPIO number must be between 0 and 3")
+        _ = self.spirit.write_registers(Spirit1Registers.GPIO_0_CONF - gpio, GPIO_NIRQ_OUTPUT)
+
     def get_status(self) -> int:
         status = self.spirit.read_register_block(
             Spirit1Registers.IRQ_STATUS_3,
@@ -0,0 +1,125 @@
+"""Lookup tables of the datarates, deviations and filters SPIRIT1 can produce."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Channel filter bandwidths in hundreds of hertz for a 26 MHz clock, indexed
+# by ``mantissa + 9 * exponent`` as programmed in CHFLT.
+CHANNEL_FILTER_BANDWIDTHS_26M: tuple[int, ...] = (
+    8001, 7951, 7684, 7368, 7051, 6709, 6423, 5867, 5414,
+    4509, 4259, 4032, 3808, 3621, 3417, 3254, 2945, 2703,
+    2247, 2124, 2015, 1900, 1807, 1706, 1624, 1471, 1350,
+    1123, 1062, 1005,  950,  903,  853,  812,  735,  675,
+    561,  530,  502,  474,  451,  426,  406,  367,  337,
+    280,  265,  251,  237,  226,  213,  203,  184,  169,
+    140,  133,  126,  119,  113,  106,  101,   92,   84,
+    70,   66,   63,   59,   56,   53,   51,   46,   42,
+    35,   33,   31,   30,   28,   27,   25,   23,   21,
+    18,   17,   16,   15,   14,   13,   13,   12,   11,
+)
+
+
+@dataclass(frozen=True)
+class ModulationSetting:
+    """A mantissa/exponent pair and the value it produces."""
+
+    requested: float
+    achieved: float
+    mantissa: int
+    exponent: int
+
+    @property
+    def error(self) -> float:
+        """Achieved minus requested value."""
+        return self.achieved - self.requested
+
+
+class ModulationTable:
+    """Every value one mantissa/exponent register pair can produce, sorted."""
+
+    def __init__(self, settings: Iterable[tuple[float, int, int]]):
+        by_value: dict[float, tuple[int, int]] = {}
+        for value, mantissa, exponent in settings:
+            by_value[value] = (mantissa, exponent)
+        self.values: tuple[float, ...] = tuple(sorted(by_value))
+        self._settings: tuple[tuple[int, int], ...] = tuple(by_value[value] for value in self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def minimum(self) -> float:
+        return self.values[0]
+
+    @property
+    def maximum(self) -> float:
+        return self.values[-1]
+
+    def nearest(self, requested: float) -> ModulationSetting:
+        """Return the setting closest to ``requested``, preferring the lower on a tie."""
+        index = bisect.bisect_left(self.values, requested)
+        if index == len(self.values) or (
+            index > 0 and requested - self.values[index - 1] <= self.values[index] - requested
+        ):
+            index -= 1
+        return ModulationSetting(requested, self.values[index], *self._settings[index])
+
+
+class ModulationSolver:
+    """Nearest achievable datarate, deviation and channel filter for one clock setup.
+
+    The tables are built once per XTAL frequency and digital divider setting;
+    use :func:`modulation_solver` to share them.  The solver never touches
+    hardware, so planning tools can use it directly.
+    """
+
+    def __init__(self, xtal: int, digital_divider: bool):
+        if xtal <= 0:
+            raise ValueError("XTAL frequency must be greater than zero")
+        self.xtal: int = xtal
+        self.digital_divider: bool = digital_divider
+        clock = xtal >> (5 + int(digital_divider))
+        # Later (larger) exponents win for datarates produced by several pairs.
+        self.datarates: ModulationTable = ModulationTable(
+            (((256 + mantissa) * clock) >> (23 - exponent), mantissa, exponent)
+            for exponent in range(16)
+            for mantissa in range(256)
+        )
+        step = xtal / (1 << 18)
+        self.deviations: ModulationTable = ModulationTable(
+            (step * ((8 + mantissa) / 2 * (1 << exponent)), mantissa, exponent)
+            for exponent in range(10)
+            for mantissa in range(8)
+        )
+        filter_factor = (xtal / (1 if digital_divider else 2)) / 100
+        self.bandwidths: ModulationTable = ModulationTable(
+            ((bandwidth * filter_factor) / 2600, index % 9, index // 9)
+            for index, bandwidth in enumerate(CHANNEL_FILTER_BANDWIDTHS_26M)
+        )
+
+    def datarate(self, datarate: float) -> ModulationSetting:
+        """Return the MOD1 mantissa and MOD0 exponent nearest ``datarate``.
+
+        Raise :class:`ValueError` outside the representable range.
+        """
+        if not self.datarates.minimum <= datarate <= self.datarates.maximum:
+            raise ValueError("Datarate cannot be represented by the current XTAL configuration")
+        return self.datarates.nearest(datarate)
+
+    def deviation(self, deviation: float) -> ModulationSetting:
+        """Return the FDEV0 mantissa and exponent nearest ``deviation``."""
+        return self.deviations.nearest(deviation)
+
+    def bandwidth(self, bandwidth: float) -> ModulationSetting:
+        """Return the CHFLT mantissa and exponent nearest ``bandwidth``."""
+        return self.bandwidths.nearest(bandwidth)
+
+
+@functools.lru_cache(maxsize=8)
+def modulation_solver(xtal: int, digital_divider: bool) -> ModulationSolver:
+    """Return a shared :class:`ModulationSolver` for the clock setup."""
+    return ModulationSolver(xtal, digital_divider)
@@ -0,0 +1,123 @@
+"""Packet decoding that shares the receive buffers instead of copying them."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Union
+
+from .basic_packet import BasicPacketConfig, BasicPacketMessage
+from .compact import CompactMessage
+from .receiver import ReceivedMessage
+from .stack_packet import StackPacketConfig, StackPacketMessage
+
+PacketConfig = Union[BasicPacketConfig, StackPacketConfig]
+RawMessage = Union[ReceivedMessage, CompactMessage]
+
+_EMPTY = memoryview(b"")
+
+
+class PacketView:
+    """A decoded packet whose fields are read-only views of a received message.
+
+    The message is a :class:`ReceivedMessage` or, for long-lived storage, a
+    :class:`CompactMessage` whose buffer may be shared through a
+    :class:`PayloadPool <spirit1.compact.PayloadPool>`.  Decoding only pairs
+    the message with its decoder's slicing rules.  :attr:`payload`,
+    :attr:`control_data` and :attr:`crc` return memoryviews when read, and
+    nothing is copied until :meth:`copy` is called or a view is passed to
+    ``bytes()``.  While views exist, a :class:`ReceivedMessage` payload cannot
+    be resized.
+    """
+
+    __slots__ = ("_decoder", "raw")
+
+    def __init__(self, raw: RawMessage, decoder: PacketViewDecoder):
+        self.raw: RawMessage = raw
+        self._decoder: PacketViewDecoder = decoder
+
+    @property
+    def payload(self) -> memoryview:
+        return memoryview(self.raw.payload).toreadonly()
+
+    @property
+    def control_data(self) -> memoryview:
+        control = self._decoder._control
+        return memoryview(self.raw.control_data).toreadonly()[control] if control else _EMPTY
+
+    @property
+    def crc(self) -> memoryview|None:
+        crc = self._decoder._crc
+        return memoryview(self.raw.crc).toreadonly()[crc] if crc else None
+
+    @property
+    def source_address(self) -> int|None:
+        return self.raw.source_address if self._decoder._addresses else None
+
+    @property
+    def destination_address(self) -> int|None:
+        return self.raw.destination_address if self._decoder._addresses else None
+
+    @property
+    def crc_valid(self) -> bool|None:
+        return self.raw.crc_valid
+
+    @property
+    def rssi(self) -> int|None:
+        return self.raw.rssi
+
+    @property
+    def sqi(self) -> int|None:
+        return self.raw.sqi
+
+    @property
+    def pqi(self) -> int|None:
+        return self.raw.pqi
+
+    @property
+    def agc_word(self) -> int|None:
+        return self.raw.agc_word
+
+    def copy(self) -> BasicPacketMessage|StackPacketMessage:
+        """Return the message :meth:`BasicPacket.decode` or :meth:`StackPacket.decode` would give."""
+        crc = self.crc
+        return self._decoder._message_type(
+            payload=bytes(self.raw.payload),
+            source_address=self.source_address,
+            destination_address=self.destination_address,
+            control_data=bytes(self.control_data),
+            crc=bytes(crc) if crc is not None else None,
+            raw=self.raw,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"PacketView(payload={bytes(self.raw.payload)!r}, source_address={self.source_address}, "
+            f"destination_address={self.destination_address})"
+        )
+
+
+class PacketViewDecoder:
+    """Decode received messages into :class:`PacketView` objects.
+
+    The control-data and CRC slices and the address handling are resolved
+    once from the packet configuration, so decoding a frame allocates one
+    small object.  Build a new decoder after changing the configuration.
+    """
+
+    def __init__(self, config: PacketConfig):
+        self.config: PacketConfig = config
+        control_length = config.control_length
+        crc_length = config.crc_length
+        self._control: slice|None = slice(-control_length, None) if control_length else None
+        self._crc: slice|None = slice(0, crc_length) if crc_length else None
+        # STack packets always carry both addresses.
+        self._addresses: bool = getattr(config, "address_field", True)
+        self._message_type: type[BasicPacketMessage|StackPacketMessage] = (
+            BasicPacketMessage if isinstance(config, BasicPacketConfig) else StackPacketMessage
+        )
+
+    def decode(self, raw_message: RawMessage) -> PacketView:
+        return PacketView(raw_message, self)
+
+    def decode_batch(self, raw_messages: Iterable[RawMessage]) -> list[PacketView]:
+        return [PacketView(raw_message, self) for raw_message in raw_messages]
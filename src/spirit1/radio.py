@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import dataclasses
+import json
 import logging
 import math
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .device import Spirit1Device
+from .calibration import CalibrationKey, VcoCalibrationCache
+from .device import Register, Spirit1Device
 from .enums import Spirit1Modulation
 from .frequency import Frequency
+from .modulation import modulation_solver
 from .radio_config import RadioConfig
 from .registers import Spirit1Registers
 
+if TYPE_CHECKING:
+    from .compiler import RegisterImage
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,12 +29,91 @@ CHSPACE_DIVIDER = 32_768  # 2^15
 DOUBLE_XTAL_THR = 30_000_000
 
 
-class Radio:
-    """Applies a :class:`RadioConfig` to a SPIRIT1 device."""
+def if_offsets(xtal: int) -> tuple[int, int]:
+    """Return the IF_OFFSET_ANA and IF_OFFSET_DIG values for an XTAL frequency."""
+    if_off = (3.0 * 480140) / (xtal >> 12) - 64
+    analog = round(if_off)
+    if xtal >= DOUBLE_XTAL_THR:
+        if_off = (3.0 * 480140) / (xtal >> 13) - 64
+    return analog, round(if_off)
+
+
+def channel_space_factor(channel_space: int, xtal: int) -> int:
+    return math.floor((channel_space * CHSPACE_DIVIDER) / xtal) + 1
+
+
+def channel_step(channel_space: int, xtal: int) -> float:
+    """Return the spacing in Hz the synthesizer actually uses for ``channel_space``."""
+    return channel_space_factor(channel_space, xtal) * xtal / CHSPACE_DIVIDER
+
+
+def frequency_offset_factor(frequency_offset: int, base_frequency: int, xtal: int) -> int:
+    """Return the 12-bit FC_OFFSET word for an offset in parts per million."""
+    return int((((frequency_offset * base_frequency) / PPM_FACTOR) * FBASE_DIVIDER) / xtal)
+
+
+def datarate_me(datarate: int, xtal: int, digital_divider: bool) -> tuple[int, int]:
+    """Return the (mantissa, exponent) pair closest to ``datarate``."""
+    setting = modulation_solver(xtal, digital_divider).datarate(datarate)
+    return setting.mantissa, setting.exponent
+
+
+def frequency_deviation_me(freq_deviation: int, xtal: int) -> tuple[int, int]:
+    """Return the (mantissa, exponent) pair closest to a frequency deviation."""
+    setting = modulation_solver(xtal, False).deviation(freq_deviation)
+    return setting.mantissa, setting.exponent
+
+
+def channel_filter_me(bandwidth: int, xtal: int, digital_divider: bool) -> tuple[int, int]:
+    """Return the (mantissa, exponent) pair of the nearest channel filter."""
+    setting = modulation_solver(xtal, digital_divider).bandwidth(bandwidth)
+    return setting.mantissa, setting.exponent
+
+
+_STATE_VERSION = 1
+
+# Registers that set the synthesizer frequency; changing any invalidates VCO calibration.
+_SYNTH_REGISTERS: tuple[Spirit1Registers, ...] = (
+    Spirit1Registers.SYNT_3,
+    Spirit1Registers.SYNT_2,
+    Spirit1Registers.SYNT_1,
+    Spirit1Registers.SYNT_0,
+    Spirit1Registers.CHANNEL_SPACE_FACTOR,
+    Spirit1Registers.FC_OFFSET_HI,
+    Spirit1Registers.FC_OFFSET_LO,
+    Spirit1Registers.CHANNEL_NUMBER,
+    Spirit1Registers.SYNTH_CONFIG_HI,
+    Spirit1Registers.XO_RCO_TEST,
+)
+
+
+def synth_frequency(config: RadioConfig) -> Frequency:
+    """Return the frequency the synthesizer is programmed with for ``config``."""
+    return config.frequency_base.offset(config.frequency_offset + config.channel_space * config.channel_number)
 
-    def __init__(self, spirit: Spirit1Device, config: RadioConfig|None = None):
+
+class Radio:
+    """Applies a :class:`RadioConfig` to a SPIRIT1 device.
+
+    With a ``calibration_cache``, VCO calibration words are reused for
+    frequencies that were calibrated before instead of being measured again.
+    With a ``state_file``, the applied register image and calibration words
+    are recorded so that :meth:`warm_start` can trust them after a restart.
+    """
+
+    def __init__(
+        self,
+        spirit: Spirit1Device,
+        config: RadioConfig|None = None,
+        calibration_cache: VcoCalibrationCache|None = None,
+        state_file: str|os.PathLike[str]|None = None,
+    ):
         self.spirit: Spirit1Device = spirit
         self.config: RadioConfig = config or RadioConfig()
+        self.calibration_cache: VcoCalibrationCache|None = calibration_cache
+        self.state_file: Path|None = Path(state_file).expanduser() if state_file is not None else None
+        self._applied: RadioConfig|None = None
+        self._unknown: set[int] = set()
 
     @property
     def xtal_frequency(self) -> int:
@@ -124,50 +214,195 @@ class Radio:
             logger.error("Invalid radio configuration: %s", error)
         return not errors
 
+    def read_config(self) -> RadioConfig:
+        """Read the device's radio settings back as a new :class:`RadioConfig`.
+
+        The registers are fetched in five block reads; the XTAL frequency is
+        taken from the current configuration.
+        """
+        from .compiler import RADIO_READBACK_REGISTERS, decode_radio
+
+        return decode_radio(self.spirit.read_registers(RADIO_READBACK_REGISTERS), self.xtal_frequency)
+
     def update_from_device(self) -> None:
-        """Read radio configuration values from the device."""
-        self.get_reference_divider()
-        self.get_channel_number()
-        self.get_channel_space()
-        self.get_frequency_base()
-        self.get_frequency_offset()
-        self.get_datarate()
+        """Update the configuration in place with the values read from the device."""
+        self._assign(self.read_config())
 
     def init_device(self) -> bool:
-        """Validate and apply the current configuration to the device."""
+        """Validate and apply the current configuration to the device.
+
+        The configuration is compiled into a register image (see
+        :func:`spirit1.compiler.compile_registers`) and written in bursts
+        from STANDBY, as the digital divider requires; VCO calibration follows.
+        """
+        from .compiler import compile_registers
+
         if not self.validate():
             return False
         self._configure_reference_divider()
-        self.set_xtal_frequency(self.xtal_frequency)
-        # Switch off external SMPS.
-        self.spirit.set_register_bit(Spirit1Registers.PM_CONFIG_2, 5, False)
-        # Set the higher SEL_TSPLIT time.
-        self.spirit.set_register_bit(Spirit1Registers.SYNTH_CONFIG_LO, 7, True)
-        # Enable DEM
-        self.spirit.set_register_bit(Spirit1Registers.DEM_CONFIG, 1, False)
-
-        self.write_if_offsets()
-        self.write_frequency_offset()
-        self.write_channel_number()
-        self.write_channel_space()
-        self.write_datarate_me()
-        self.write_frequency_deviation_me()
-        self.write_channel_bandwidth_me()
-        self.write_modulation()
+        self.digital_divider = self.xtal_frequency > DOUBLE_XTAL_THR
+        image = compile_registers(self.config)
+        if not self.spirit.standby():
+            logger.warning("Unable to change to standby to set the digital divider flag")
+        image.apply(self.spirit)
+        _ = self.spirit.ready()
+        calibrated = self.vco_calibration()
+        if not calibrated:
+            logger.warning("Unable to calibrate the base frequency %d", synth_frequency(self.config).frequency)
+        self._applied = dataclasses.replace(self.config)
+        self._unknown.clear()
+        self._record_state(image, calibrated)
+        return True
 
-        self.spirit.set_register_bit(Spirit1Registers.AFC_2, 7, True)
-        # Set the IQC correction optimal values
-        _ = self.spirit.write_registers(Spirit1Registers.IQC_1, 0x80, 0xE3)
+    def warm_start(self) -> bool:
+        """Apply the configuration to a device that may already hold it.
+
+        For a service restarting while the radio stayed powered.  The compiled
+        configuration is compared with a burst read of the device and only the
+        mismatching registers are written.  VCO calibration is skipped when the
+        synthesizer registers already match and the device's calibration words
+        are known to be good: recorded with the same image in
+        :attr:`state_file`, or held in the calibration cache.  Automatic VCO
+        calibration is then disabled so the words are kept.  A mismatching
+        digital divider needs STANDBY, so falls back to :meth:`init_device`.
+        """
+        from .compiler import compile_registers
 
-        self.write_frequency_base()
+        if not self.validate():
+            return False
+        self._configure_reference_divider()
+        self.digital_divider = self.xtal_frequency > DOUBLE_XTAL_THR
+        image = compile_registers(self.config)
+        values = self.spirit.read_registers([
+            *image,
+            Spirit1Registers.PROTOCOL_2,
+            Spirit1Registers.RCO_VCO_CALIBR_IN1,
+            Spirit1Registers.RCO_VCO_CALIBR_IN0,
+        ])
+        stale = image.mismatches(values)
+        if Spirit1Registers.SYNTH_CONFIG_HI in stale:
+            logger.info("Digital divider differs; applying the full configuration")
+            return self.init_device()
+        stale.apply(self.spirit, values)
+        logger.debug("Warm start rewrote %d of %d registers", len(stale), len(image))
+        words = (values[Spirit1Registers.RCO_VCO_CALIBR_IN1], values[Spirit1Registers.RCO_VCO_CALIBR_IN0])
+        expected = self._recorded_calibration(image)
+        if expected is None and self.calibration_cache is not None:
+            expected = self.calibration_cache.get(self.calibration_key())
+        calibrated = True
+        autocalibrating = False
+        if expected is None or any(int(register) in stale for register in _SYNTH_REGISTERS):
+            calibrated = self.vco_calibration()
+            if not calibrated:
+                logger.warning("Unable to calibrate the base frequency %d", synth_frequency(self.config).frequency)
+        else:
+            protocol = values[Spirit1Registers.PROTOCOL_2]
+            # The next lock would otherwise recalibrate over the trusted words.
+            autocalibrating = bool(protocol & 0x02)
+            if autocalibrating:
+                _ = self.spirit.write_registers(Spirit1Registers.PROTOCOL_2, protocol & ~0x02)
+            if words != expected:
+                _ = self.spirit.write_registers(Spirit1Registers.RCO_VCO_CALIBR_IN1, *expected)
+        self._applied = dataclasses.replace(self.config)
+        self._unknown.clear()
+        if stale or autocalibrating or words != expected:
+            self._record_state(image, calibrated)
         return True
 
+    def reconfigure(self, config: RadioConfig) -> bool:
+        """Apply ``config`` by writing only the registers that change.
+
+        The new configuration is compiled and compared with the last one
+        applied by :meth:`init_device` or :meth:`reconfigure`; VCO calibration
+        runs only when a register feeding the synthesizer changes.  If
+        :attr:`config` was modified since then, for example by a ``set_*``
+        method, every radio register is rewritten and the VCO recalibrated.
+        Registers passed to :meth:`invalidate` are rewritten too.  Without a
+        previous apply, or when the XTAL frequency changes, this is a full
+        :meth:`init_device`.  Call it from READY.
+        """
+        from .compiler import compile_registers
+
+        applied = self._applied
+        if applied is None or config.xtal_frequency != applied.xtal_frequency:
+            self._assign(config)
+            return self.init_device()
+        config = dataclasses.replace(config)
+        if config.reference_divider is None:
+            config.reference_divider = applied.reference_divider
+        config.digital_divider = config.xtal_frequency > DOUBLE_XTAL_THR
+        errors = config.validate()
+        for error in errors:
+            logger.error("Invalid radio configuration: %s", error)
+        if errors:
+            return False
+        image = compile_registers(config)
+        previous = compile_registers(applied)
+        if self.config == applied:
+            changes = image.changed(previous)
+            if self._unknown:
+                changes = changes.merge({register: image[register] for register in self._unknown if register in image})
+            calibrate = any(int(register) in changes for register in _SYNTH_REGISTERS)
+        else:
+            changes, calibrate = image, True
+        changes.apply(self.spirit)
+        self._assign(config)
+        calibrated = not calibrate or self.vco_calibration()
+        if not calibrated:
+            logger.warning("Unable to calibrate the base frequency %d", synth_frequency(self.config).frequency)
+        self._applied = dataclasses.replace(self.config)
+        self._unknown.clear()
+        if changes:
+            self._record_state(image, calibrated)
+        return True
+
+    def _recorded_calibration(self, image: RegisterImage) -> tuple[int, int]|None:
+        """Return the calibration words recorded in the state file for ``image``."""
+        if self.state_file is None or not self.state_file.exists():
+            return None
+        try:
+            data = json.loads(self.state_file.read_text())
+            if data.get("version") != _STATE_VERSION or data["signature"] != image.signature():
+                return None
+            return int(data["vco_tx"]), int(data["vco_rx"])
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring unreadable radio state file %s: %s", self.state_file, error)
+            return None
+
+    def _record_state(self, image: RegisterImage, calibrated: bool) -> None:
+        """Record the applied image and calibration words, or forget them after a failure."""
+        if self.state_file is None:
+            return
+        if not calibrated:
+            self.state_file.unlink(missing_ok=True)
+            return
+        vco_tx, vco_rx = self.spirit.read_register_block(Spirit1Registers.RCO_VCO_CALIBR_IN1, 2)
+        state = {"version": _STATE_VERSION, "signature": image.signature(), "vco_tx": vco_tx, "vco_rx": vco_rx}
+        temporary = self.state_file.with_name(self.state_file.name + ".tmp")
+        temporary.write_text(json.dumps(state))
+        os.replace(temporary, self.state_file)
+
+    def invalidate(self, registers: Iterable[Register]|None = None) -> None:
+        """Record that ``registers`` were written without going through this class.
+
+        The next :meth:`reconfigure` rewrites them, and recalibrates the VCO
+        if one feeds the synthesizer.  Without ``registers`` it runs a full
+        :meth:`init_device`.
+        """
+        if registers is None:
+            self._applied = None
+        else:
+            self._unknown.update(int(register) for register in registers)
+
+    def _assign(self, config: RadioConfig) -> None:
+        """Copy ``config`` into :attr:`config`, keeping the object shared with other users."""
+        for item in dataclasses.fields(config):
+            setattr(self.config, item.name, getattr(config, item.name))
+
     def _configure_reference_divider(self) -> None:
         """Preserve the device divider unless the configuration overrides it."""
         if self.config.reference_divider is None:
             self.get_reference_divider()
-        else:
-            self.set_reference_divider(self.config.reference_divider)
 
     def set_xtal_frequency(self, xtal: int) -> None:
         """Set the XTAL frequency and the corresponding divider state."""
@@ -218,7 +453,7 @@ class Radio:
         self.write_channel_space()
 
     def write_channel_space(self):
-        ch_space_factor = math.floor((self.channel_space * CHSPACE_DIVIDER) / self.xtal_frequency) + 1
+        ch_space_factor = channel_space_factor(self.channel_space, self.xtal_frequency)
         _ = self.spirit.write_registers(Spirit1Registers.CHANNEL_SPACE_FACTOR, ch_space_factor)
 
     def get_frequency_offset(self):
@@ -230,7 +465,7 @@ class Radio:
         self.write_frequency_offset()
 
     def write_frequency_offset(self):
-        factor = int((((self.frequency_offset * self.frequency_base.frequency) / PPM_FACTOR) * FBASE_DIVIDER) / self.xtal_frequency)
+        factor = frequency_offset_factor(self.frequency_offset, self.frequency_base.frequency, self.xtal_frequency)
         self.spirit.update_register(Spirit1Registers.FC_OFFSET_HI, 0xF0, (factor >> 8) & 0x0F)
         _ = self.spirit.write_registers(Spirit1Registers.FC_OFFSET_LO, factor & 0xFF)
 
@@ -260,18 +495,15 @@ class Radio:
         self.spirit.update_register(Spirit1Registers.MOD0, 0x8F, self.modulation.value)
 
     def write_if_offsets(self):
-        if_off= (3.0 * 480140) / (self.xtal_frequency >> 12) - 64
-        _ = self.spirit.write_registers(Spirit1Registers.IF_OFFSET_ANA, round(if_off))
-
-        if self.xtal_frequency >= DOUBLE_XTAL_THR:
-            if_off= (3.0 * 480140) / (self.xtal_frequency >> 13) - 64
-        _ = self.spirit.write_registers(Spirit1Registers.IF_OFFSET_DIG, round(if_off))
+        analog, digital = if_offsets(self.xtal_frequency)
+        _ = self.spirit.write_registers(Spirit1Registers.IF_OFFSET_ANA, analog)
+        _ = self.spirit.write_registers(Spirit1Registers.IF_OFFSET_DIG, digital)
 
     def write_frequency_base(self, do_calibration:bool=True):
         """ Sets the synth word and the band select registers according to the
             provided base frequency.
         """
-        fc = self.frequency_base.offset(self.frequency_offset + self.channel_space * self.channel_number)
+        fc = synth_frequency(self.config)
         self.spirit.update_register(Spirit1Registers.SYNTH_CONFIG_HI, 0xF9, fc.vco().value)
         _ = self.spirit.write_registers(Spirit1Registers.SYNT_3, *fc.synt_reg_values(self.reference_divider, self.xtal_frequency))
 
@@ -288,106 +520,66 @@ class Radio:
         self.write_datarate_me()
 
     def write_datarate_me(self):
-        pce:int = -1
-        factor:int = 20 + int(self.digital_divider)
-        for i in range(15, -1, -1):
-            if self.datarate >= (self.xtal_frequency >> int(factor - i)):
-                pce = i
-                break
-
-        if pce == -1:
-            pce = 0
-        self.spirit.update_register(Spirit1Registers.MOD0, 0xF0, pce)
-
-        factor = 5 + int(self.digital_divider)
-        mantissa_base = int(
-            self.datarate * ((1 << (23 - pce)) / (self.xtal_frequency >> factor))
-        ) - 256
-        candidates = [
-            mantissa
-            for mantissa in range(mantissa_base - 1, mantissa_base + 2)
-            if 0 <= mantissa <= 0xFF
-        ]
-        if not candidates:
-            raise ValueError("Datarate cannot be represented by the current XTAL configuration")
-        pcm = min(
-            candidates,
-            key=lambda mantissa: abs(
-                self.datarate
-                - (((256 + mantissa) * (self.xtal_frequency >> factor)) >> (23 - pce))
-            ),
-        )
-        self.spirit.write_registers(Spirit1Registers.MOD1, pcm)
+        mantissa, exponent = datarate_me(self.datarate, self.xtal_frequency, self.digital_divider)
+        self.spirit.update_register(Spirit1Registers.MOD0, 0xF0, exponent)
+        self.spirit.write_registers(Spirit1Registers.MOD1, mantissa)
 
     def write_frequency_deviation_me(self):
-        xtal_div_tmp = self.xtal_frequency / (1 << 18)
-
-        pce:int = 0
-        for i in range(10):
-            a = xtal_div_tmp * (7.5 * (1 << i))
-            if self.freq_deviation < a:
-                pce = i
-                break
-        self.spirit.update_register(Spirit1Registers.FDEV0, 0x0F, (pce << 4))
-
-        b = 0.0
-        bp = 0.0
-        pcm = 0
-        for i in range(8):
-            bp = b
-            b = xtal_div_tmp * ((8 + i) / 2 * (1 << pce))
-            if self.freq_deviation < b:
-                pcm = i
-                break
-        if self.freq_deviation - bp < b - self.freq_deviation:
-            pcm -= 1
-        self.spirit.update_register(Spirit1Registers.FDEV0, 0xF8, (pcm & 0x07))
+        mantissa, exponent = frequency_deviation_me(self.freq_deviation, self.xtal_frequency)
+        self.spirit.update_register(Spirit1Registers.FDEV0, 0x0F, (exponent << 4))
+        self.spirit.update_register(Spirit1Registers.FDEV0, 0xF8, mantissa)
 
     def set_bandwidth(self, bandwidth:int):
         self.bandwidth = bandwidth
         self.write_channel_bandwidth_me()
 
     def write_channel_bandwidth_me(self):
-        dig_divider = 1 if self.digital_divider else 2
-        chflt_factor = (self.xtal_frequency / dig_divider) / 100
-        s_vectnBandwidth26M:list[int] = [
-            8001, 7951, 7684, 7368, 7051, 6709, 6423, 5867, 5414,
-            4509, 4259, 4032, 3808, 3621, 3417, 3254, 2945, 2703,
-            2247, 2124, 2015, 1900, 1807, 1706, 1624, 1471, 1350,
-            1123, 1062, 1005,  950,  903,  853,  812,  735,  675,
-            561,  530,  502,  474,  451,  426,  406,  367,  337,
-            280,  265,  251,  237,  226,  213,  203,  184,  169,
-            140,  133,  126,  119,  113,  106,  101,   92,   84,
-            70,   66,   63,   59,   56,   53,   51,   46,   42,
-            35,   33,   31,   30,   28,   27,   25,   23,   21,
-            18,   17,   16,   15,   14,   13,   13,   12,   11
-        ]
-
-        me = 0
-        for j in range(90):
-            if self.bandwidth >= (s_vectnBandwidth26M[j] * chflt_factor) / 2600:
-                me = j
-                break
-
-        if me != 0:
-            me_tmp = me
-            chfltCalculation: list[float] = [0.0, 0.0, 0.0]
-            for j in range(3):
-                if 0 <= (me_tmp + j - 1) <= 89:
-                    chfltCalculation[j] = self.bandwidth - (s_vectnBandwidth26M[me_tmp + j -1] * chflt_factor) / 2600
-                else:
-                    chfltCalculation[j] = float("inf")
-
-            chfltDelta = 0xFFFF
-            for j in range(3):
-                if abs(chfltCalculation[j]) < chfltDelta:
-                    chfltDelta = abs(chfltCalculation[j])
-                    me = me_tmp + j - 1
-        val = ((int(me % 9) & 0x0f) << 4) + (int(me / 9) & 0x0f)
-        self.spirit.write_registers(Spirit1Registers.CHFLT, val)
+        mantissa, exponent = channel_filter_me(self.bandwidth, self.xtal_frequency, self.digital_divider)
+        self.spirit.write_registers(Spirit1Registers.CHFLT, (mantissa << 4) + exponent)
 
     # VCO
     def vco_calibration(self) -> bool:
+        calibration = self.cached_vco_calibration()
+        if calibration is None:
+            return False
+        _ = self.spirit.write_registers(Spirit1Registers.RCO_VCO_CALIBR_IN1, *calibration)
+        return True
+
+    def calibration_key(self) -> CalibrationKey:
+        """Return the cache key for the programmed synthesizer settings."""
+        return CalibrationKey(
+            synth_frequency(self.config).frequency,
+            self.xtal_frequency,
+            self.reference_divider,
+            self.digital_divider,
+        )
+
+    def cached_vco_calibration(self) -> tuple[int, int]|None:
+        """Return the (TX, RX) calibration words, measuring only on a cache miss.
+
+        Either way, automatic VCO calibration is left disabled.
+        """
+        cache = self.calibration_cache
+        if cache is None:
+            return self.measure_vco_calibration()
+        key = self.calibration_key()
+        calibration = cache.get(key)
+        if calibration is not None:
+            logger.debug("Reusing the VCO calibration for %d Hz", key.frequency)
+            # Otherwise the next lock would recalibrate over the reused words.
+            self.enable_vco_calibration(False)
+            return calibration
+        calibration = self.measure_vco_calibration()
+        if calibration is not None:
+            cache.put(key, *calibration)
+        return calibration
+
+    def measure_vco_calibration(self) -> tuple[int, int]|None:
+        """Calibrate the VCO at the programmed frequency.
+
+        Return the (TX, RX) calibration words without writing them back, or
+        ``None`` when a state change fails.
+        """
         c_standby:bool = False
         c_restore:bool = False
 
@@ -405,23 +597,23 @@ class Radio:
         if self.spirit.is_standby():
             c_standby = True
             if not self.spirit.ready():
-                return False
+                return None
 
         if not self.spirit.lock_tx():
-            return False
+            return None
 
         vcoTx = self.get_vco_calibration_data()
 
         if not self.spirit.ready():
-            return False
+            return None
 
         if not self.spirit.lock_rx():
-            return False
+            return None
 
         vcoRx = self.get_vco_calibration_data()
 
         if not self.spirit.ready():
-            return False
+            return None
 
         if c_standby:
             self.spirit.standby()
@@ -437,10 +629,7 @@ class Radio:
             # again here would recursively enter vco_calibration().
             self.write_frequency_base(False)
 
-        self.set_vco_calibration_data_tx(vcoTx)
-        self.set_vco_calibration_data_rx(vcoRx)
-
-        return True
+        return vcoTx, vcoRx
 
     def enable_vco_calibration(self, onoff:bool):
         self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_2, 1, onoff)
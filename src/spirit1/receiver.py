@@ -5,10 +5,13 @@ from __future__ import annotations
 import asyncio
 import errno
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass, field
 
+from .compact import CompactMessage, PayloadPool
 from .device import Spirit1Device
+from .enums import Spirit1Commands, Spirit1State
 from .irq import IRQ, SpiritIrq
 from .registers import Spirit1Registers
 
@@ -30,6 +33,10 @@ class ReceivedMessage:
     control_data: bytes = b""
     crc: bytes = b""
 
+    def compact(self, pool: PayloadPool|None = None) -> CompactMessage:
+        """Return a slotted snapshot suitable for keeping many messages in memory."""
+        return CompactMessage.from_received(self, pool)
+
     def update_quality(self, spirit: Spirit1Device) -> None:
         values = spirit.read_register_block(Spirit1Registers.LINK_QUALIF_2, 3)
         self.sqi = values[1] & 0x7F
@@ -47,7 +54,12 @@ class ReceivedMessage:
 
 
 class Receiver:
-    """Yield raw :class:`ReceivedMessage` objects from the RX FIFO."""
+    """Yield raw :class:`ReceivedMessage` objects from the RX FIFO.
+
+    Without an nIRQ pin on ``irq`` the status registers are polled every
+    ``poll_interval`` seconds.  With a pin, the receiver blocks on the line for
+    up to ``irq_timeout`` seconds and only reads SPI when SPIRIT1 signals.
+    """
 
     def __init__(
         self,
@@ -55,15 +67,21 @@ class Receiver:
         irq: IRQ,
         poll_interval: float = 0.01,
         ignore_invalid_crc: bool = True,
+        irq_timeout: float = 0.5,
     ):
         if poll_interval < 0:
             raise ValueError("Poll interval must not be negative")
+        if irq_timeout <= 0:
+            raise ValueError("IRQ timeout must be greater than zero")
         self.spirit: Spirit1Device = spirit
         self.irq: IRQ = irq
         self.poll_interval: float = poll_interval
         self.ignore_invalid_crc: bool = ignore_invalid_crc
+        self.irq_timeout: float = irq_timeout
         self.should_run: bool = True
         self.debug: bool = False
+        self._buffer: bytearray = bytearray()
+        self._low_duty_cycle: bool = False
 
     def get_persistent_rx(self) -> bool:
         return self.spirit.get_register_bit(Spirit1Registers.PROTOCOL_0, 1)
@@ -71,62 +89,241 @@ class Receiver:
     def set_persistent_rx(self, enabled: bool) -> None:
         self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_0, 1, enabled)
 
+    def get_low_duty_cycle(self) -> bool:
+        return self.spirit.get_register_bit(Spirit1Registers.PROTOCOL_1, 7)
+
+    def set_low_duty_cycle(self, enabled: bool) -> None:
+        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_1, 7, enabled)
+
     def stop(self) -> None:
         """Stop receiving and return the radio to READY while SPI is available."""
         if not self.should_run:
             return
         self.should_run = False
-        _ = self.spirit.sabort()
+        self._halt_radio()
+
+    async def receive(self, low_duty_cycle: bool = False) -> AsyncIterator[ReceivedMessage]:
+        """Yield received frames until stopped or, outside LDC mode, RX times out.
+
+        With ``low_duty_cycle`` SPIRIT1 sleeps between wake-up timer periods
+        programmed by :class:`~spirit1.timer.Timer`, listening each time for
+        the RX timeout or until an SQI/PQI/RSSI stop condition fails.  RX
+        timeouts then only end one listening window, and the radio re-arms
+        itself after each frame.
+        """
+        self._start_rx(low_duty_cycle)
+        try:
+            while self.should_run:
+                message, finished = self._step(await self._wait_for_status())
+                if message is not None:
+                    yield message
+                if finished:
+                    break
+                if self.irq.pin is None:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            self._finish_rx()
+
+    async def receive_batch(
+        self,
+        max_messages: int = 32,
+        max_latency: float = 0.05,
+        low_duty_cycle: bool = False,
+    ) -> AsyncIterator[list[ReceivedMessage]]:
+        """Yield lists of received frames gathered within a latency budget.
 
-    async def receive(self) -> AsyncIterator[ReceivedMessage]:
-        buffer = bytearray()
+        A batch is released once it holds ``max_messages`` frames or its
+        oldest frame has waited ``max_latency`` seconds.
+        """
+        if max_messages < 1:
+            raise ValueError("Batches must hold at least one message")
+        if max_latency < 0:
+            raise ValueError("Maximum latency must not be negative")
+        batch: list[ReceivedMessage] = []
+        deadline = 0.0
+        self._start_rx(low_duty_cycle)
+        try:
+            while self.should_run:
+                timeout = max(0.0, deadline - time.monotonic()) if batch else None
+                message, finished = self._step(await self._wait_for_status(timeout))
+                if message is not None:
+                    if not batch:
+                        deadline = time.monotonic() + max_latency
+                    batch.append(message)
+                if batch and (finished or len(batch) >= max_messages or time.monotonic() >= deadline):
+                    yield batch
+                    batch = []
+                if finished:
+                    break
+                if self.irq.pin is None:
+                    await asyncio.sleep(self.poll_interval)
+            if batch:
+                yield batch
+        finally:
+            self._finish_rx()
+
+    def messages(self, low_duty_cycle: bool = False) -> Iterator[ReceivedMessage]:
+        """Yield received frames from a blocking loop that needs no event loop.
+
+        The loop blocks on the nIRQ pin when ``irq`` has one, otherwise it
+        sleeps for ``poll_interval`` between status reads.  It ends like
+        :meth:`receive`; call :meth:`stop` from the consuming thread.
+        """
+        self._start_rx(low_duty_cycle)
+        try:
+            while self.should_run:
+                message, finished = self._step(self._block_for_status())
+                if message is not None:
+                    yield message
+                if finished:
+                    break
+                if self.irq.pin is None:
+                    time.sleep(self.poll_interval)
+        finally:
+            self._finish_rx()
+
+    def __iter__(self) -> Iterator[ReceivedMessage]:
+        return self.messages()
+
+    def run(
+        self,
+        callback: Callable[[ReceivedMessage], object],
+        low_duty_cycle: bool = False,
+    ) -> int:
+        """Call ``callback`` for each frame until stopped, returning the frame count.
+
+        This shares the draining loop of :meth:`messages` without generator
+        hops; the callback may call :meth:`stop` to end reception.
+        """
+        count = 0
+        self._start_rx(low_duty_cycle)
+        try:
+            while self.should_run:
+                message, finished = self._step(self._block_for_status())
+                if message is not None:
+                    callback(message)
+                    count += 1
+                if finished:
+                    break
+                if self.irq.pin is None:
+                    time.sleep(self.poll_interval)
+        finally:
+            self._finish_rx()
+        return count
+
+    def _start_rx(self, low_duty_cycle: bool) -> None:
         self.should_run = True
+        self._buffer = bytearray()
         if not self.spirit.flush_rx_fifo():
             raise RuntimeError("Unable to flush the RX FIFO")
-        if not self.spirit.start_rx():
+        self._low_duty_cycle = low_duty_cycle
+        if low_duty_cycle:
+            self.set_low_duty_cycle(True)
+            # The radio alternates between RX and SLEEP from here on, so there
+            # is no single state to wait for.
+            self.spirit.send_command(Spirit1Commands.RX)
+        elif not self.spirit.start_rx():
             raise RuntimeError("Unable to enter RX state")
 
+    async def _wait_for_status(self, timeout: float|None = None) -> int:
+        if self.irq.pin is None:
+            return self.irq.get_status()
+        if not await asyncio.to_thread(self.irq.pin.wait, self._pin_timeout(timeout)):
+            return 0
+        return self.irq.get_status()
+
+    def _block_for_status(self, timeout: float|None = None) -> int:
+        if self.irq.pin is not None and not self.irq.pin.wait(self._pin_timeout(timeout)):
+            return 0
+        return self.irq.get_status()
+
+    def _pin_timeout(self, timeout: float|None) -> float:
+        if timeout is None or timeout > self.irq_timeout:
+            return self.irq_timeout
+        return timeout
+
+    def _step(self, status: int) -> tuple[ReceivedMessage|None, bool]:
+        """Service one IRQ status snapshot shared by every receive loop.
+
+        Returns any completed frame and whether reception has finished.  RX is
+        re-armed as soon as a frame has been read so that the next one is not
+        delayed by the consumer.
+        """
+        if self._log_status(status):
+            return None, True
+        message = self._service(status)
+        if IRQ.check_flag(status, SpiritIrq.RX_DATA_READY) and self.should_run:
+            self._rearm_rx()
+        return message, False
+
+    def _log_status(self, status: int) -> bool:
+        """Log notable IRQ events and return whether reception should end."""
+        if self.debug and status and status != SpiritIrq.RSSI_ABOVE_TH.value:
+            logger.debug("IRQ status: %#010x", status)
+        if IRQ.check_flag(status, SpiritIrq.WKUP_TOUT_LDC):
+            logger.debug("LDC wake-up")
+        if IRQ.check_flag(status, SpiritIrq.RX_TIMEOUT):
+            if self._low_duty_cycle:
+                logger.debug("LDC listening window closed without a packet")
+            else:
+                logger.info("RX timeout received")
+                return True
+        return False
+
+    def _service(self, status: int) -> ReceivedMessage|None:
+        """Drain the RX FIFO for one IRQ status snapshot.
+
+        Returns the completed frame when RX_DATA_READY is reported and the frame
+        passes CRC filtering.
+        """
+        if IRQ.check_flag(status, SpiritIrq.RX_FIFO_ALMOST_FULL):
+            self._buffer.extend(self._read_fifo())
+        if not IRQ.check_flag(status, SpiritIrq.RX_DATA_READY):
+            return None
+        self._buffer.extend(self._read_fifo())
+        message = ReceivedMessage(
+            self._buffer,
+            crc_valid=not IRQ.check_flag(status, SpiritIrq.CRC_ERROR),
+        )
+        self._buffer = bytearray()
+        message.update_quality(self.spirit)
+        message.update_packet_status(self.spirit)
+        if message.crc_valid or not self.ignore_invalid_crc:
+            return message
+        logger.debug("Discarding received message with an invalid CRC")
+        return None
+
+    def _rearm_rx(self) -> None:
+        if self._low_duty_cycle:
+            # FLUSHRXFIFO is valid in every state and leaves the LDC cycle alone.
+            self.spirit.send_command(Spirit1Commands.FLUSHRXFIFO)
+            return
+        _ = self.spirit.sabort()
+        _ = self.spirit.flush_rx_fifo()
+        _ = self.spirit.start_rx()
+
+    def _finish_rx(self) -> None:
+        if not self.should_run:
+            return
+        self.should_run = False
         try:
-            while self.should_run:
-                status = self.irq.get_status()
-                if self.debug and status and status != SpiritIrq.RSSI_ABOVE_TH.value:
-                    logger.debug("IRQ status: %#010x", status)
-
-                if IRQ.check_flag(status, SpiritIrq.RX_FIFO_ALMOST_FULL):
-                    buffer.extend(self._read_fifo())
-                if IRQ.check_flag(status, SpiritIrq.RX_TIMEOUT):
-                    logger.info("RX timeout received")
-                    break
-                if IRQ.check_flag(status, SpiritIrq.RX_DATA_READY):
-                    buffer.extend(self._read_fifo())
-                    message = ReceivedMessage(
-                        buffer,
-                        crc_valid=not IRQ.check_flag(status, SpiritIrq.CRC_ERROR),
-                    )
-                    message.update_quality(self.spirit)
-                    message.update_packet_status(self.spirit)
-                    if message.crc_valid or not self.ignore_invalid_crc:
-                        yield message
-                    else:
-                        logger.debug("Discarding received message with an invalid CRC")
-                    buffer = bytearray()
-                    if self.should_run:
-                        _ = self.spirit.sabort()
-                        _ = self.spirit.flush_rx_fifo()
-                        _ = self.spirit.start_rx()
-
-                await asyncio.sleep(self.poll_interval)
-        finally:
-            if self.should_run:
-                self.should_run = False
-                try:
-                    _ = self.spirit.sabort()
-                except OSError as error:
-                    # An owning application may close SPI while asyncio is
-                    # finalising this generator during shutdown.
-                    if error.errno != errno.EBADF:
-                        raise
-                    logger.debug("SPI was already closed during receiver cleanup")
+            self._halt_radio()
+        except OSError as error:
+            # An owning application may close SPI while asyncio is
+            # finalising this generator during shutdown.
+            if error.errno != errno.EBADF:
+                raise
+            logger.debug("SPI was already closed during receiver cleanup")
+
+    def _halt_radio(self) -> None:
+        if self._low_duty_cycle:
+            self._low_duty_cycle = False
+            self.set_low_duty_cycle(False)
+            _ = self.spirit.refresh_status()
+            if self.spirit.status.state == Spirit1State.SLEEP:
+                _ = self.spirit.ready()
+                return
+        _ = self.spirit.sabort()
 
     def _read_fifo(self) -> bytearray:
         size = self.spirit.linear_fifo_rx_size()
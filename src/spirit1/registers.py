@@ -3,6 +3,10 @@ from enum import IntEnum
 
 class Spirit1Registers(IntEnum):
     ANA = 0x01
+    GPIO_3_CONF = 0x02
+    GPIO_2_CONF = 0x03
+    GPIO_1_CONF = 0x04
+    GPIO_0_CONF = 0x05
     IF_OFFSET_ANA = 0x07          # Analog intermediate offset
     SYNT_3 = 0x08                 # PLL Programmable Divider
     SYNT_2 = 0x09                 # PLL Programmable Divider
@@ -47,6 +51,11 @@ class Spirit1Registers(IntEnum):
     SYNC_1 = 0x39
     QI = 0x3A                     # SQI & PQI
 
+    FIFO_CONFIG_3 = 0x3E          # RX FIFO almost-full threshold
+    FIFO_CONFIG_2 = 0x3F          # RX FIFO almost-empty threshold
+    FIFO_CONFIG_1 = 0x40          # TX FIFO almost-full threshold
+    FIFO_CONFIG_0 = 0x41          # TX FIFO almost-empty threshold
+
     RX_SOURCE_ADDR = 0x4B
     TX_SOURCE_ADDR = 0x4E
 
@@ -72,6 +81,7 @@ class Spirit1Registers(IntEnum):
     TX_CTRL_0 = 0x6B
 
     CHANNEL_NUMBER = 0x6C         # Channel number
+    RCO_VCO_CALIBR_IN2 = 0x6D     # RCO calibration input
     RCO_VCO_CALIBR_IN1 = 0x6E     # VCO Tx calibration input
     RCO_VCO_CALIBR_IN0 = 0x6F     # VCO Rx calibration input
 
@@ -92,6 +102,9 @@ class Spirit1Registers(IntEnum):
 
     XO_RCO_TEST = 0xB4
 
+    TX_PCKT_INFO = 0xC2           # Sequence number and retransmissions of the last TX packet
+    RX_PCKT_INFO = 0xC3           # NO_ACK, sequence number and NACK of the last RX packet
+
     LINK_QUALIF_2 = 0xC5
     LINK_QUALIF_1 = 0xC6
     LINK_QUALIF_0 = 0xC7
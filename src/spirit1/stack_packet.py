@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
+from .compact import CompactMessage
 from .device import Spirit1Device
 from .enums import CrcMode
+from .fifo import LINEAR_FIFO_SIZE
 from .receiver import ReceivedMessage
 from .registers import Spirit1Registers
+from .transmitter import TransmitResult, Transmitter
 
 
 class ExperimentalStackPacketWarning(UserWarning):
@@ -25,8 +28,10 @@ class StackPacketConfig:
     """Configuration for the experimental STack packet format.
 
     STack always transmits one destination and one source address byte.  The
-    ``no_ack`` and ``auto_ack`` settings control SPIRIT1's protocol engine;
-    their end-to-end behaviour remains unverified.
+    ``no_ack``, ``auto_ack`` and ``max_retransmissions`` settings control
+    SPIRIT1's protocol engine; their end-to-end behaviour remains unverified.
+    The window in which an ACK is awaited is the RX timeout, set with
+    :meth:`spirit1.timer.Timer.set_rx_timeout_ms`.
     """
 
     preamble_length: int = 1
@@ -40,11 +45,17 @@ class StackPacketConfig:
     data_whitening: bool = False
     no_ack: bool = False
     auto_ack: bool = False
+    max_retransmissions: int = 0
 
     @property
     def sync_length(self) -> int:
         return len(self.sync_words)
 
+    @property
+    def crc_length(self) -> int:
+        """Bytes of CRC appended to each packet."""
+        return self.crc_mode.length
+
     def validate(self) -> list[str]:
         errors: list[str] = []
         if not 1 <= self.preamble_length <= 32:
@@ -57,6 +68,8 @@ class StackPacketConfig:
             errors.append("Control length must be between 0 and 4 bytes")
         if self.fixed_length and not 1 <= self.fixed_packet_length <= 0xFFFF:
             errors.append("Fixed packet length must be between 1 and 65535 bytes")
+        if not 0 <= self.max_retransmissions <= 15:
+            errors.append("Maximum retransmissions must be between 0 and 15")
         return errors
 
 
@@ -69,23 +82,45 @@ class StackPacketMessage:
     destination_address: int|None
     control_data: bytes = b""
     crc: bytes|None = None
-    raw: ReceivedMessage|None = None
+    raw: ReceivedMessage|CompactMessage|None = None
 
     @property
     def crc_valid(self) -> bool|None:
         return self.raw.crc_valid if self.raw else None
 
 
+@dataclass
+class StackSendResult(TransmitResult):
+    """A :class:`TransmitResult` with the STack sequence number of the frame.
+
+    ``attempts`` counts the first transmission plus the chip's automatic
+    retransmissions, read from TX_PCKT_INFO.
+    """
+
+    sequence_number: int|None = None
+
+    @property
+    def retransmissions(self) -> int:
+        return self.attempts - 1
+
+
 class StackPacket:
-    """Apply and decode the experimental STack packet format.
+    """Apply, decode and send the experimental STack packet format.
 
     Transmission, automatic ACK/retry, and sequence-number handling should not
     be relied upon until verified with real STack devices.
     """
 
-    def __init__(self, spirit: Spirit1Device, config: StackPacketConfig|None = None):
+    def __init__(
+        self,
+        spirit: Spirit1Device,
+        config: StackPacketConfig|None = None,
+        transmitter: Transmitter|None = None,
+    ):
         self.spirit:Spirit1Device = spirit
         self.config:StackPacketConfig = config or StackPacketConfig()
+        self.transmitter:Transmitter = transmitter or Transmitter(spirit)
+        self._ack_requested: bool|None = None
 
     def apply(self) -> bool:
         """Apply STack framing settings, warning that hardware validation is pending."""
@@ -113,11 +148,58 @@ class StackPacket:
             | int(self.config.fec),
         )
         _ = self.spirit.write_registers(Spirit1Registers.SYNC_4, *reversed(self.config.sync_words))
-        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_2, 3, self.config.no_ack)
-        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_2, 2, self.config.auto_ack)
+        # PROTOCOL_0: NMAX_RETX, NACK_TX and AUTO_ACK; keep PERS_RX/PERS_TX.
+        self.spirit.update_register(
+            Spirit1Registers.PROTOCOL_0,
+            0x03,
+            (self.config.max_retransmissions << 4)
+            | (int(self.config.no_ack) << 3)
+            | (int(self.config.auto_ack) << 2),
+        )
+        self._ack_requested = not self.config.no_ack
+        self.transmitter.invalidate()
         return True
 
-    def decode(self, raw_message: ReceivedMessage) -> StackPacketMessage:
+    async def send(self, message: StackPacketMessage, ack: bool = True, timeout: float = 1.0) -> StackSendResult:
+        """Send a message, letting the chip handle ACKs and retransmissions.
+
+        With ``ack`` the frame asks for an acknowledgement and SPIRIT1
+        retransmits it up to ``max_retransmissions`` times; the result is
+        :attr:`~spirit1.transmitter.TransmitOutcome.SENT` once the ACK
+        arrives or ``NO_ACK`` when the retries run out.  Enable
+        :data:`~spirit1.transmitter.ACK_TRANSMIT_IRQS` in the IRQ mask.
+        """
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than zero")
+        if ack and len(message.payload) > LINEAR_FIFO_SIZE:
+            raise ValueError("Acknowledged frames must fit the 96-byte TX FIFO to be retransmitted")
+        self.transmitter.write_header(self._header_registers(message))
+        if ack != self._ack_requested:
+            self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_0, 3, not ack)
+            self._ack_requested = ack
+        result = await self.transmitter.transmit_async(message.payload, timeout, ack=ack)
+        info = self.spirit.read_register(Spirit1Registers.TX_PCKT_INFO)
+        if ack and result.sent:
+            # The ACK frame itself lands in the RX FIFO.
+            _ = self.spirit.flush_rx_fifo()
+        return StackSendResult(
+            **{**asdict(result), "attempts": (info & 0x0F) + 1},
+            sequence_number=(info >> 4) & 0x03,
+        )
+
+    def _header_registers(self, message: StackPacketMessage) -> dict[Spirit1Registers|int, int]:
+        """Return the packet registers that describe ``message``."""
+        if message.destination_address is None:
+            raise ValueError("STack packets require a destination address")
+        return Transmitter.header_registers(
+            len(message.payload) + self.config.control_length + 2,
+            message.destination_address,
+            message.source_address,
+            message.control_data,
+            self.config.control_length,
+        )
+
+    def decode(self, raw_message: ReceivedMessage|CompactMessage) -> StackPacketMessage:
         """Decode a captured receiver snapshot without reading hardware."""
         return StackPacketMessage(
             payload=bytes(raw_message.payload),
@@ -128,12 +210,6 @@ class StackPacket:
             raw=raw_message,
         )
 
-    def _decode_crc(self, raw_message: ReceivedMessage) -> bytes|None:
-        if self.config.crc_mode == CrcMode.CRC_MODE_OFF:
-            return None
-        length = 3
-        if self.config.crc_mode == CrcMode.CRC_MODE_7:
-            length = 1
-        elif self.config.crc_mode in (CrcMode.CRC_MODE_1021, CrcMode.CRC_MODE_8005):
-            length = 2
-        return raw_message.crc[:length]
+    def _decode_crc(self, raw_message: ReceivedMessage|CompactMessage) -> bytes|None:
+        length = self.config.crc_length
+        return raw_message.crc[:length] if length else None
@@ -0,0 +1,168 @@
+"""RSSI and carrier-sense surveys across a set of channels."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ._numpy import require_numpy
+from .channels import ChannelTable
+from .radio import Radio
+from .registers import Spirit1Registers
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _numpy() -> Any:
+    return require_numpy("ChannelSurvey")
+
+
+def rssi_dbm(level: Any) -> Any:
+    """Convert RSSI_LEVEL readings (a number or an array) to dBm."""
+    return level / 2 - 130
+
+
+class ChannelSurvey:
+    """Sweep a calibrated channel table, sampling RSSI and carrier sense.
+
+    Each :meth:`sweep` retunes to every channel in turn, enters RX, waits
+    ``settle`` seconds and then reads LINK_QUALIF_1 through RSSI_LEVEL in
+    one burst ``samples`` times, ``interval`` seconds apart.  Readings are
+    kept as channel x time arrays in :attr:`rssi` (dBm) and :attr:`busy`
+    (carrier sense), and running statistics cover every sweep.
+    """
+
+    def __init__(
+        self,
+        table: ChannelTable,
+        samples: int = 8,
+        settle: float = 0.0005,
+        interval: float = 0.0,
+        keep_history: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if samples < 1:
+            raise ValueError("Each channel needs at least one sample per sweep")
+        if settle < 0 or interval < 0:
+            raise ValueError("Settle time and sample interval must not be negative")
+        np = _numpy()
+        self.table: ChannelTable = table
+        self.samples: int = samples
+        self.settle: float = settle
+        self.interval: float = interval
+        self.keep_history: bool = keep_history
+        self.sleep: Callable[[float], None] = sleep
+        self.sweeps: int = 0
+        channels = len(table)
+        self._history: list[tuple[np.ndarray, np.ndarray]] = []
+        self._count: int = 0
+        self._sum: np.ndarray = np.zeros(channels)
+        self._busy: np.ndarray = np.zeros(channels, dtype=np.int64)
+        self.minimum: np.ndarray = np.full(channels, np.inf)
+        self.maximum: np.ndarray = np.full(channels, -np.inf)
+
+    @classmethod
+    def from_range(cls, radio: Radio, start: int, stop: int, step: int, **kwargs: Any) -> ChannelSurvey:
+        """Survey every ``step`` hertz from ``start`` to ``stop`` inclusive."""
+        if step <= 0:
+            raise ValueError("Step must be greater than zero")
+        return cls.from_frequencies(radio, range(start, stop + 1, step), **kwargs)
+
+    @classmethod
+    def from_frequencies(cls, radio: Radio, frequencies: Sequence[int], **kwargs: Any) -> ChannelSurvey:
+        """Build and calibrate a channel table, then survey it."""
+        table = ChannelTable(radio, frequencies)
+        if not table.calibrate():
+            raise RuntimeError("Unable to calibrate the survey channels")
+        return cls(table, **kwargs)
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return _numpy().array([entry.frequency for entry in self.table.entries])
+
+    @property
+    def rssi(self) -> np.ndarray:
+        """RSSI readings in dBm, one row per channel and one column per sample."""
+        return self._stack(0)
+
+    @property
+    def busy(self) -> np.ndarray:
+        """Carrier-sense readings, shaped like :attr:`rssi`."""
+        return self._stack(1)
+
+    @property
+    def mean(self) -> np.ndarray:
+        np = _numpy()
+        if self._count == 0:
+            return np.full(len(self.table), np.nan)
+        return self._sum / self._count
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        """Percentage of samples on each channel with carrier sense asserted."""
+        np = _numpy()
+        if self._count == 0:
+            return np.full(len(self.table), np.nan)
+        return 100.0 * self._busy / self._count
+
+    def sweep(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sample every channel once and return this sweep's RSSI and busy arrays."""
+        np = _numpy()
+        spirit = self.table.radio.spirit
+        levels = np.empty((len(self.table), self.samples), dtype=np.uint8)
+        sense = np.empty((len(self.table), self.samples), dtype=bool)
+        try:
+            for index in range(len(self.table)):
+                _ = spirit.sabort()
+                if not self.table.hop(index, start_rx=True):
+                    raise RuntimeError(f"Unable to enter RX on channel {index}")
+                if self.settle:
+                    self.sleep(self.settle)
+                for sample in range(self.samples):
+                    if sample and self.interval:
+                        self.sleep(self.interval)
+                    values = spirit.read_register_block(Spirit1Registers.LINK_QUALIF_1, 3)
+                    sense[index, sample] = values[0] & 0x80
+                    levels[index, sample] = values[2]
+        finally:
+            _ = spirit.sabort()
+        dbm = rssi_dbm(levels.astype(float))
+        self._count += self.samples
+        self._sum += dbm.sum(axis=1)
+        self._busy += sense.sum(axis=1)
+        np.minimum(self.minimum, dbm.min(axis=1), out=self.minimum)
+        np.maximum(self.maximum, dbm.max(axis=1), out=self.maximum)
+        if self.keep_history:
+            self._history.append((dbm, sense))
+        self.sweeps += 1
+        return dbm, sense
+
+    def run(self, sweeps: int) -> None:
+        for _ in range(sweeps):
+            _ = self.sweep()
+
+    def cleanest(self, count: int|None = None) -> list[int]:
+        """Return table indexes ordered by occupancy, then by mean RSSI."""
+        np = _numpy()
+        order = np.lexsort((self.mean, self.occupancy))
+        return [int(index) for index in order[:count]]
+
+    def reset(self) -> None:
+        np = _numpy()
+        self.sweeps = self._count = 0
+        self._history.clear()
+        self._sum[:] = 0
+        self._busy[:] = 0
+        self.minimum[:] = np.inf
+        self.maximum[:] = -np.inf
+
+    def _stack(self, field: int) -> np.ndarray:
+        np = _numpy()
+        if not self._history:
+            return np.empty((len(self.table), 0), dtype=bool if field else float)
+        return np.concatenate([entry[field] for entry in self._history], axis=1)
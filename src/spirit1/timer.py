@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 from .device import Spirit1Device
+from .enums import Spirit1Commands
 from .radio import DOUBLE_XTAL_THR
 from .registers import Spirit1Registers
 
@@ -16,6 +17,12 @@ class TimerConfig:
     stop_on_pqi: bool = False
     stop_on_rssi: bool = False
     stop_conditions_or: bool = False
+    # Low-duty-cycle (LDC) wake-up timer, clocked by the RCO.
+    wakeup_counter: int = 0
+    wakeup_prescaler: int = 0
+    ldc_reload_counter: int = 0
+    ldc_reload_prescaler: int = 0
+    ldc_reload_on_sync: bool = False
 
     def validate(self) -> list[str]:
         errors = []
@@ -25,6 +32,9 @@ class TimerConfig:
             errors.append("Timeout counter must be an 8-bit value")
         if not 0 <= self.timeout_prescaler <= 0xFF:
             errors.append("Timeout prescaler must be an 8-bit value")
+        for name in ("wakeup_counter", "wakeup_prescaler", "ldc_reload_counter", "ldc_reload_prescaler"):
+            if not 0 <= getattr(self, name) <= 0xFF:
+                errors.append(f"{name.replace('_', ' ').capitalize()} must be an 8-bit value")
         return errors
 
 
@@ -45,6 +55,14 @@ class Timer:
         )
         self.spirit.update_register(Spirit1Registers.PROTOCOL_2, 0x1F, stop_conditions)
         self.spirit.set_register_bit(Spirit1Registers.PKTFLT_OPTS, 7, self.config.stop_conditions_or)
+        self.spirit.write_registers(
+            Spirit1Registers.TIMERS_3,
+            self.config.wakeup_prescaler,
+            self.config.wakeup_counter,
+            self.config.ldc_reload_prescaler,
+            self.config.ldc_reload_counter,
+        )
+        self.spirit.set_register_bit(Spirit1Registers.PROTOCOL_1, 6, self.config.ldc_reload_on_sync)
         self.spirit.write_registers(
             Spirit1Registers.TIMERS_5,
             self.config.timeout_prescaler,
@@ -71,6 +89,24 @@ class Timer:
             counter += 1
         return max(1, int(counter) - 1), prescaler - 1
 
+    def set_wakeup_timer_ms(self, milliseconds: int) -> bool:
+        """Set the LDC period between automatic wake-ups."""
+        counter, prescaler = self.timer_compute_wakeup_values(milliseconds)
+        self.config.wakeup_counter = counter
+        self.config.wakeup_prescaler = prescaler
+        return self.apply()
+
+    def set_ldc_reload_timer_ms(self, milliseconds: int) -> bool:
+        """Set the period loaded by ``LDC_RELOAD`` or a sync-word reload."""
+        counter, prescaler = self.timer_compute_wakeup_values(milliseconds)
+        self.config.ldc_reload_counter = counter
+        self.config.ldc_reload_prescaler = prescaler
+        return self.apply()
+
+    def reload_ldc(self) -> None:
+        """Restart the wake-up timer from the LDC reload registers."""
+        self.spirit.send_command(Spirit1Commands.LDC_RELOAD)
+
     def set_rx_timeout_ms(self, milliseconds: int) -> bool:
         counter, prescaler = self.timer_compute_rx_timeout_values(milliseconds)
         self.config.timeout_counter = counter
@@ -0,0 +1,366 @@
+"""Raw packet transmission through the linear TX FIFO."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+
+from .device import Register, Spirit1Device, register_bursts
+from .enums import Spirit1Commands
+from .fifo import LINEAR_FIFO_SIZE
+from .irq import IRQ, SpiritIrq
+from .registers import Spirit1Registers
+
+logger = logging.getLogger(__name__)
+
+# Events used by Transmitter.transmit_async(); enable them in IRQConfig.
+TRANSMIT_IRQS = frozenset({
+    SpiritIrq.TX_DATA_SENT,
+    SpiritIrq.TX_FIFO_ERROR,
+    SpiritIrq.TX_FIFO_ALMOST_EMPTY,
+    SpiritIrq.MAX_BO_CCA_REACH,
+})
+
+# Events used when the STack protocol engine waits for an ACK.
+ACK_TRANSMIT_IRQS = TRANSMIT_IRQS | {SpiritIrq.RX_DATA_READY, SpiritIrq.MAX_RE_TX_REACH}
+
+
+class TransmitOutcome(Enum):
+    SENT = "sent"
+    TIMEOUT = "timeout"
+    FIFO_ERROR = "fifo_error"
+    CHANNEL_BUSY = "channel_busy"
+    NO_ACK = "no_ack"
+
+
+@dataclass
+class TransmitResult:
+    """How a transmission ended, with :func:`time.monotonic` timestamps."""
+
+    outcome: TransmitOutcome
+    started_at: float
+    finished_at: float
+    status: int = 0
+    attempts: int = 1
+
+    @property
+    def sent(self) -> bool:
+        return self.outcome == TransmitOutcome.SENT
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+
+# Header registers, payload, timeout and the caller's future for a queued frame.
+_QueuedFrame = tuple[Mapping[Register, int], bytes, float, "asyncio.Future[TransmitResult]"]
+
+
+class Transmitter:
+    """Load payloads into the TX FIFO and wait for them to be sent.
+
+    Payloads larger than the 96-byte FIFO are streamed: the FIFO is filled,
+    TX is started, and the FIFO is topped up each time SPIRIT1 reports
+    TX_FIFO_ALMOST_EMPTY (see :class:`~spirit1.fifo.FifoConfig`).  A frame
+    is complete at TX_DATA_SENT, and MAX_BO_CCA_REACH or TX_FIFO_ERROR end
+    it early; enable :data:`TRANSMIT_IRQS` in the IRQ mask.
+
+    The transmitter remembers the packet registers it last programmed and
+    whether the TX FIFO is known to be empty, so repeated frames skip
+    unchanged register writes and redundant flushes.  Call
+    :meth:`invalidate` after anything else writes those registers or the
+    FIFO, or after the radio is reset.
+    """
+
+    def __init__(self, spirit: Spirit1Device, irq: IRQ|None = None, poll_interval: float = 0.001):
+        if poll_interval < 0:
+            raise ValueError("Poll interval must not be negative")
+        self.spirit: Spirit1Device = spirit
+        self.irq: IRQ = irq or IRQ(spirit)
+        self.poll_interval: float = poll_interval
+        self.prestage: bool = True
+        self._pending: memoryview = memoryview(b"")
+        self._header: dict[int, int] = {}
+        self._prepared: tuple[Mapping[Register, int], dict[int, int], list[tuple[int, list[int]]]]|None = None
+        self._fifo_clean: bool = False
+        self._queue: deque[_QueuedFrame] = deque()
+        self._worker: asyncio.Task[None]|None = None
+
+    def transmit(self, payload: Sequence[int], timeout: float = 1.0) -> bool:
+        """Send one payload whose packet registers are already programmed."""
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than zero")
+        deadline = time.monotonic() + timeout
+        self._clear_fifo()
+        # Discard events left over from earlier frames.
+        _ = self.irq.get_status()
+        self._load(payload)
+        if not self.spirit.start_tx():
+            self._pending = memoryview(b"")
+            return False
+        while True:
+            # One status read both tops up the FIFO and reports how the frame ended.
+            outcome = self._outcome(self.irq.get_status())
+            if outcome == TransmitOutcome.SENT:
+                self._fifo_clean = True
+                return True
+            if outcome == TransmitOutcome.CHANNEL_BUSY:
+                logger.warning("CSMA found the channel busy; transmission abandoned")
+            if outcome is not None:
+                return False
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out sending a frame with %d bytes unsent", len(self._pending))
+                self._abort()
+                return False
+            time.sleep(self.poll_interval)
+
+    async def transmit_async(self, payload: Sequence[int], timeout: float = 1.0, ack: bool = False) -> TransmitResult:
+        """Send one payload and await TX_DATA_SENT rather than polling the FIFO.
+
+        The TX command is issued without waiting for the TX state, so CSMA can
+        hold the radio in its clear-channel assessment.  Completion, FIFO
+        errors and CSMA giving up (MAX_BO_CCA_REACH) are taken from the IRQ
+        status, waiting on the nIRQ pin when ``irq`` has one.
+
+        With ``ack`` the frame is complete once its ACK arrives (RX_DATA_READY)
+        rather than at TX_DATA_SENT, and MAX_RE_TX_REACH reports
+        :attr:`TransmitOutcome.NO_ACK`; enable :data:`ACK_TRANSMIT_IRQS`.
+        """
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than zero")
+        result, _ = await self._send(payload, timeout, ack=ack)
+        return result
+
+    def submit(
+        self,
+        header: Mapping[Register, int],
+        payload: Sequence[int],
+        timeout: float = 1.0,
+    ) -> asyncio.Future[TransmitResult]:
+        """Queue a frame for back-to-back transmission and return its future.
+
+        ``header`` holds the packet registers (length, addresses, control
+        data) to program before the frame is sent.  Frames are sent in order
+        by a worker task on the running event loop.  While one frame is on
+        air the next frame's changed header registers are worked out and,
+        when it fits behind the frame being sent, its payload is written to
+        the FIFO, so that only the header bursts and the TX command separate
+        the frames.
+        """
+        if timeout <= 0:
+            raise ValueError("Timeout must be greater than zero")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[TransmitResult] = loop.create_future()
+        self._queue.append((dict(header), bytes(payload), timeout, future))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run_queue())
+        return future
+
+    async def drain(self) -> None:
+        """Wait until every submitted frame has been sent or has failed."""
+        while self._worker is not None and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    @staticmethod
+    def header_registers(
+        packet_length: int,
+        destination_address: int|None = None,
+        source_address: int|None = None,
+        control_data: Sequence[int] = (),
+        control_length: int = 0,
+    ) -> dict[Register, int]:
+        """Map one frame's length, addresses and control data onto the TX registers.
+
+        ``packet_length`` is the PCKTLEN value and the first ``control_length``
+        bytes of ``control_data`` fill the TX_CTRL registers.
+        """
+        registers: dict[Register, int] = {}
+        if destination_address is not None:
+            registers[Spirit1Registers.RX_SOURCE_ADDR] = destination_address
+        if source_address is not None:
+            registers[Spirit1Registers.TX_SOURCE_ADDR] = source_address
+        if control_length:
+            if len(control_data) < control_length:
+                raise ValueError("Not enough control-data bytes for the configured packet format")
+            first = Spirit1Registers.TX_CTRL_3 + (4 - control_length)
+            for index, value in enumerate(control_data[:control_length]):
+                registers[first + index] = value
+        if not 0 <= packet_length <= 0xFFFF:
+            raise ValueError("Payload plus packet overhead must fit in 65535 bytes")
+        registers[Spirit1Registers.PKTLEN_1] = (packet_length >> 8) & 0xFF
+        registers[Spirit1Registers.PKTLEN_0] = packet_length & 0xFF
+        return registers
+
+    def write_header(self, header: Mapping[Register, int]) -> None:
+        """Program the packet registers that differ from the last frame.
+
+        Changed registers with consecutive addresses are written as one burst.
+        """
+        self._prepared = None
+        self._program_header(*self._plan_header(header))
+
+    def _plan_header(self, header: Mapping[Register, int]) -> tuple[dict[int, int], list[tuple[int, list[int]]]]:
+        """Return the registers that differ from the last frame and their bursts."""
+        changed = {int(register): value for register, value in header.items() if self._header.get(int(register)) != value}
+        return changed, register_bursts(changed)
+
+    def _program_header(self, changed: dict[int, int], bursts: list[tuple[int, list[int]]]) -> None:
+        try:
+            for start, values in bursts:
+                _ = self.spirit.write_registers(start, *values)
+        except BaseException:
+            # A partial write leaves the registers unknown.
+            self._header.clear()
+            raise
+        self._header.update(changed)
+
+    def invalidate(self) -> None:
+        """Forget the programmed packet registers and the TX FIFO state."""
+        self._header.clear()
+        self._prepared = None
+        self._fifo_clean = False
+
+    async def _run_queue(self) -> None:
+        staged = False
+        while self._queue:
+            header, payload, timeout, future = self._queue.popleft()
+            if future.cancelled():
+                if staged:
+                    self._fifo_clean = False
+                    staged = False
+                continue
+            following = None
+            following_header = self._queue[0][0] if self._queue else None
+            if self.prestage and self._queue and len(self._queue[0][1]) <= LINEAR_FIFO_SIZE:
+                following = self._queue[0][1]
+            prepared, self._prepared = self._prepared, None
+            try:
+                if prepared is not None and prepared[0] is header:
+                    # Worked out while the previous frame was on air.
+                    self._program_header(*prepared[1:])
+                else:
+                    self.write_header(header)
+                result, next_staged = await self._send(payload, timeout, staged, following, following_header)
+                if staged and result.outcome == TransmitOutcome.FIFO_ERROR:
+                    logger.warning("The TX FIFO did not keep a pre-staged payload; disabling pre-staging")
+                    self.prestage = False
+                    result, next_staged = await self._send(payload, timeout)
+            except Exception as error:  # noqa: BLE001 - delivered through the future
+                # Fail this frame only; the registers and FIFO are no longer known.
+                staged = False
+                self.invalidate()
+                if not future.cancelled():
+                    future.set_exception(error)
+                continue
+            staged = next_staged
+            if not future.cancelled():
+                future.set_result(result)
+
+    async def _send(
+        self,
+        payload: Sequence[int],
+        timeout: float,
+        staged: bool = False,
+        following: bytes|None = None,
+        following_header: Mapping[Register, int]|None = None,
+        ack: bool = False,
+    ) -> tuple[TransmitResult, bool]:
+        """Send one frame, returning its result and whether ``following`` is staged.
+
+        The header bursts for ``following_header`` are planned while this frame
+        is on air, so the next frame can write them as soon as it is sent.
+        """
+        if not staged:
+            self._clear_fifo()
+            self._load(payload)
+        # Clear stale events so that TX_DATA_SENT belongs to this frame.
+        _ = self.irq.get_status()
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+        self.spirit.send_command(Spirit1Commands.TX)
+        staged_following = following is not None and self._stage(following)
+        if following_header is not None:
+            self._prepared = (following_header, *self._plan_header(following_header))
+        while True:
+            status = await self._wait_for_status(deadline)
+            outcome = self._outcome(status, ack)
+            if outcome is not None:
+                result = TransmitResult(outcome, started_at, time.monotonic(), status)
+                if outcome == TransmitOutcome.SENT:
+                    # The FIFO has drained, apart from any staged payload.
+                    self._fifo_clean = not staged_following and not ack
+                    return result, staged_following
+                return result, False
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out waiting for TX_DATA_SENT")
+                self._abort()
+                return TransmitResult(TransmitOutcome.TIMEOUT, started_at, time.monotonic(), status), False
+            if self.irq.pin is None:
+                await asyncio.sleep(self.poll_interval)
+
+    def _stage(self, payload: bytes) -> bool:
+        """Append the next frame's payload behind the frame on air, if it fits."""
+        if self._pending or len(payload) > LINEAR_FIFO_SIZE - self.spirit.linear_fifo_tx_size():
+            return False
+        _ = self.spirit.write_linear_fifo(payload)
+        return True
+
+    def _clear_fifo(self) -> None:
+        if not self._fifo_clean:
+            _ = self.spirit.flush_tx_fifo()
+
+    async def _wait_for_status(self, deadline: float) -> int:
+        if self.irq.pin is None:
+            return self.irq.get_status()
+        timeout = max(0.0, deadline - time.monotonic())
+        if not await asyncio.to_thread(self.irq.pin.wait, timeout):
+            return 0
+        return self.irq.get_status()
+
+    def _outcome(self, status: int, ack: bool = False) -> TransmitOutcome|None:
+        """Service one IRQ status snapshot and return a final outcome, if any."""
+        if not self._refill(status):
+            return TransmitOutcome.FIFO_ERROR
+        if IRQ.check_flag(status, SpiritIrq.MAX_BO_CCA_REACH):
+            # SPIRIT1 returns to READY with the frame still in the FIFO.
+            self._abort()
+            return TransmitOutcome.CHANNEL_BUSY
+        if ack:
+            if IRQ.check_flag(status, SpiritIrq.MAX_RE_TX_REACH):
+                self._abort()
+                return TransmitOutcome.NO_ACK
+            if IRQ.check_flag(status, SpiritIrq.RX_DATA_READY):
+                return TransmitOutcome.SENT
+            return None
+        if IRQ.check_flag(status, SpiritIrq.TX_DATA_SENT):
+            return TransmitOutcome.SENT
+        return None
+
+    def _load(self, payload: Sequence[int]) -> None:
+        self._fifo_clean = False
+        data = memoryview(bytes(payload))
+        _ = self.spirit.write_linear_fifo(data[:LINEAR_FIFO_SIZE])
+        self._pending = data[LINEAR_FIFO_SIZE:]
+
+    def _refill(self, status: int) -> bool:
+        """Top up a streamed payload, returning ``False`` on a FIFO error."""
+        if IRQ.check_flag(status, SpiritIrq.TX_FIFO_ERROR):
+            logger.warning("TX FIFO underflow with %d bytes unsent", len(self._pending))
+            self._abort()
+            return False
+        if self._pending and IRQ.check_flag(status, SpiritIrq.TX_FIFO_ALMOST_EMPTY):
+            space = LINEAR_FIFO_SIZE - self.spirit.linear_fifo_tx_size()
+            if space > 0:
+                _ = self.spirit.write_linear_fifo(self._pending[:space])
+                self._pending = self._pending[space:]
+        return True
+
+    def _abort(self) -> None:
+        self._pending = memoryview(b"")
+        _ = self.spirit.sabort()
+        self._fifo_clean = self.spirit.flush_tx_fifo()
@@ -28,6 +28,8 @@ class PacketDevice:
             Spirit1Registers.RX_ADDRESS_1: bytearray([0x24, 0x42]),
             Spirit1Registers.RX_CTRL_FIELD_1: bytearray([0xA1, 0xB2]),
             Spirit1Registers.CRC_FIELD_1: bytearray([0x12, 0x34]),
+            # Every frame is reported sent (TX_DATA_SENT).
+            Spirit1Registers.IRQ_STATUS_3: bytearray([0x00, 0x00, 0x00, 0x04]),
         }
         return values.get(register, bytearray(length))
 
@@ -143,6 +145,18 @@ class BasicPacketTests(unittest.TestCase):
         self.assertIs(message.raw, raw)
         self.assertEqual(message.rssi, 99)
 
+    def test_decode_batch_matches_single_message_decoding(self):
+        config = BasicPacketConfig(address_field=True, control_length=1, crc_mode=CrcMode.CRC_MODE_7)
+        packet = BasicPacket(None, config)
+        raws = [
+            ReceivedMessage(bytearray([n]), source_address=n, destination_address=0x42,
+                            control_data=b"\x00\x00\x00" + bytes([n]), crc=bytes([n, 0, 0]))
+            for n in range(3)
+        ]
+
+        self.assertEqual(packet.decode_batch(raws), [packet.decode(raw) for raw in raws])
+        self.assertEqual(packet.decode_batch(raws)[2].crc, b"\x02")
+
     def test_receive_converts_a_raw_stream_to_basic_packet_messages(self):
         packet = BasicPacket(spirit=None)
 
@@ -166,3 +180,22 @@ class BasicPacketTests(unittest.TestCase):
             ("write", Spirit1Registers.PKTLEN_1, (0x00, 0x07)),
             device.writes,
         )
+
+    def test_header_registers_are_coalesced_into_bursts(self):
+        device = PacketDevice()
+        packet = BasicPacket(device, BasicPacketConfig(address_field=True, control_length=2))
+
+        self.assertTrue(packet.transmit(BasicPacketMessage(
+            payload=b"\x04",
+            destination_address=0x42,
+            control_data=b"\xA1\xB2",
+        )))
+
+        self.assertEqual(
+            [write for write in device.writes if write[0] == "write"],
+            [
+                ("write", Spirit1Registers.PKTLEN_1, (0x00, 0x05)),
+                ("write", Spirit1Registers.RX_SOURCE_ADDR, (0x42,)),
+                ("write", Spirit1Registers.TX_CTRL_1, (0xA1, 0xB2)),
+            ],
+        )
@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from spirit1.calibration import CalibrationKey, VcoCalibrationCache
+from spirit1.radio import Radio
+from spirit1.radio_config import RadioConfig
+from spirit1.registers import Spirit1Registers
+
+KEY = CalibrationKey(868_000_000, 50_000_000, False, True)
+
+
+class CalibratingDevice:
+    """Register file that reports fixed VCO calibration words."""
+
+    def __init__(self):
+        self.registers = [0] * 256
+        self.writes = []
+        self.commands = []
+        self.bits = []
+
+    def read_register(self, register):
+        return 0x52 if self.commands[-1] == "lock_tx" else 0x34
+
+    def write_registers(self, register, *values):
+        self.writes.append((register, values))
+        self.registers[register:register + len(values)] = values
+
+    def update_register(self, register, mask, value):
+        self.write_registers(register, (self.registers[register] & mask) + value)
+
+    def set_register_bit(self, register, bit, value):
+        self.bits.append((register, bit, value))
+
+    def refresh_status(self):
+        pass
+
+    def is_standby(self):
+        return False
+
+    def lock_tx(self):
+        self.commands.append("lock_tx")
+        return True
+
+    def lock_rx(self):
+        self.commands.append("lock_rx")
+        return True
+
+    def ready(self):
+        return True
+
+
+class CountingCache(VcoCalibrationCache):
+    def __init__(self, *args, **kwargs):
+        self.saves = 0
+        super().__init__(*args, **kwargs)
+
+    def save(self):
+        self.saves += 1
+        super().save()
+
+
+class VcoCalibrationCacheTests(unittest.TestCase):
+    def test_records_expire_with_age_and_temperature_drift(self):
+        now = [0.0]
+        temperature = [20.0]
+        cache = VcoCalibrationCache(
+            max_age=100.0,
+            max_temperature_drift=5.0,
+            temperature=lambda: temperature[0],
+            clock=lambda: now[0],
+        )
+
+        cache.put(KEY, 0x40, 0x41)
+        now[0] = 50.0
+        self.assertEqual(cache.get(KEY), (0x40, 0x41))
+        temperature[0] = 26.0
+        self.assertIsNone(cache.get(KEY))
+
+        cache.put(KEY, 0x40, 0x41)
+        now[0] = 151.0
+        self.assertIsNone(cache.get(KEY))
+
+    def test_records_persist_and_unreadable_files_are_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "vco.json"
+            VcoCalibrationCache(path, clock=lambda: 0.0).put(KEY, 0x40, 0x41)
+
+            self.assertEqual(VcoCalibrationCache(path, clock=lambda: 1.0).get(KEY), (0x40, 0x41))
+
+            path.write_text("{not json")
+            with self.assertLogs("spirit1.calibration", "WARNING"):
+                cache = VcoCalibrationCache(path)
+            self.assertEqual(len(cache), 0)
+
+    def test_file_is_saved_only_when_records_change(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CountingCache(Path(directory) / "vco.json")
+            cache.put(KEY, 0x40, 0x41)
+            cache.put(KEY, 0x40, 0x41)
+            self.assertEqual(cache.saves, 1)
+
+            with cache.batch():
+                for frequency in range(868_000_000, 869_000_000, 100_000):
+                    cache.put(CalibrationKey(frequency, 50_000_000, False, True), 0x40, 0x41)
+                self.assertEqual(cache.saves, 1)
+            self.assertEqual(cache.saves, 2)
+
+            cache.invalidate(CalibrationKey(1, 1, False, False))
+            self.assertEqual(cache.saves, 2)
+            self.assertEqual(len(CountingCache(cache.path)), 10)
+
+    def test_radio_reuses_cached_calibration(self):
+        cache = VcoCalibrationCache()
+        first = CalibratingDevice()
+        radio = Radio(first, RadioConfig(reference_divider=False), calibration_cache=cache)
+        radio.write_frequency_base()
+        self.assertEqual(first.commands, ["lock_tx", "lock_rx"])
+
+        second = CalibratingDevice()
+        radio = Radio(second, RadioConfig(reference_divider=False), calibration_cache=cache)
+        radio.write_frequency_base()
+
+        self.assertEqual(second.commands, [])
+        self.assertIn((0x6E, (0x52, 0x34)), second.writes)
+        self.assertEqual(second.bits[-1], (Spirit1Registers.PROTOCOL_2, 1, False))
+
@@ -5,6 +5,7 @@ import unittest
 from pathlib import Path
 
 from spirit1.basic_packet import BasicPacket, BasicPacketConfig
+from spirit1.crc import basic_packet_crcs, check_basic_packet_crc
 from spirit1.enums import CrcMode
 from spirit1.receiver import ReceivedMessage
 
@@ -51,3 +52,18 @@ class CapturedPacketTests(unittest.TestCase):
                 self.assertEqual(message.sqi, record["sqi"])
                 self.assertEqual(message.pqi, record["pqi"])
                 self.assertEqual(message.agc_word, record["agc_word"])
+
+    def test_captured_crcs_match_the_software_crc(self):
+        records = [json.loads(line) for line in CAPTURES.read_text().splitlines() if line]
+        # The packet format used by capture_messages.py, including its 7-bit length field.
+        config = BasicPacketConfig(
+            fixed_packet_length=100,
+            control_length=4,
+            address_field=True,
+            crc_mode=CrcMode.CRC_MODE_864CBF,
+        )
+        messages = [BasicPacket(None, config).decode(received_message(record)) for record in records]
+
+        for message in messages:
+            self.assertTrue(check_basic_packet_crc(config, message), message.payload.hex())
+        self.assertEqual(basic_packet_crcs(config, messages), [message.crc for message in messages])
@@ -0,0 +1,128 @@
+import dataclasses
+import unittest
+
+from spirit1 import Spirit1Device
+from spirit1.channels import ChannelTable
+from spirit1.compiler import compile_registers
+from spirit1.dryrun import RecordingSpi
+from spirit1.enums import Spirit1State
+from spirit1.radio import Radio
+from spirit1.radio_config import RadioConfig
+from spirit1.registers import Spirit1Registers
+
+
+class SynthDevice:
+    """Register file whose VCO calibration output follows the programmed SYNT_0 and channel."""
+
+    def __init__(self):
+        self.registers = [0] * 256
+        self.registers[Spirit1Registers.RCO_VCO_CALIBR_IN2] = 0x70
+        self.writes = []
+        self.commands = []
+
+    def read_register(self, register):
+        if register == Spirit1Registers.RCO_VCO_CALIBR_OUT0:
+            return (self.registers[Spirit1Registers.SYNT_0] + self.registers[Spirit1Registers.CHANNEL_NUMBER]) & 0x7F
+        return self.registers[register]
+
+    def read_register_block(self, register, count):
+        return bytearray(self.registers[register:register + count])
+
+    def write_registers(self, register, *values):
+        self.writes.append((register, values))
+        self.registers[register:register + len(values)] = values
+
+    def update_register(self, register, mask, value):
+        self.write_registers(register, (self.registers[register] & mask) + value)
+
+    def set_register_bit(self, register, bit, value):
+        current = self.registers[register] & ~(1 << bit)
+        self.registers[register] = current | (int(value) << bit)
+
+    def refresh_status(self):
+        pass
+
+    def is_standby(self):
+        return False
+
+    def lock_tx(self):
+        self.commands.append("lock_tx")
+        return True
+
+    def lock_rx(self):
+        self.commands.append("lock_rx")
+        return True
+
+    def ready(self):
+        return True
+
+    def start_rx(self):
+        self.commands.append("start_rx")
+        return True
+
+
+class ChannelTableTests(unittest.TestCase):
+    def setUp(self):
+        self.device = SynthDevice()
+        config = RadioConfig(reference_divider=False, channel_space=200_000, channel_number=5)
+        self.radio = Radio(self.device, config)
+
+    def test_hops_are_two_bursts_once_calibrated(self):
+        table = ChannelTable.from_channels(self.radio, [0, 1, 2])
+        with self.assertRaises(ValueError):
+            table.hop(0)
+
+        self.assertTrue(table.calibrate())
+        self.assertEqual(self.radio.config.channel_number, 5)
+        self.assertEqual(self.device.commands.count("lock_tx"), 3)
+        self.device.writes.clear()
+        self.device.commands.clear()
+
+        self.assertTrue(table.hop(1, start_rx=True))
+
+        entry = table[1]
+        # Channel 1 is one quantised 200 744.6 Hz step above the base frequency.
+        self.assertEqual(entry.frequency, 868_200_745)
+        self.assertEqual(self.device.writes, [
+            (Spirit1Registers.SYNT_3, entry.synt),
+            (Spirit1Registers.CHANNEL_NUMBER, (0, 0x70, entry.vco_tx, entry.vco_rx)),
+        ])
+        self.assertEqual(self.device.commands, ["start_rx"])
+        self.assertEqual(entry.vco_tx, entry.synt[3] & 0x7F)
+
+    def test_calibration_measures_channel_zero_and_restores_the_radio(self):
+        registers = self.device.registers
+        registers[Spirit1Registers.CHANNEL_NUMBER] = 5
+        registers[Spirit1Registers.RCO_VCO_CALIBR_IN1:Spirit1Registers.RCO_VCO_CALIBR_IN0 + 1] = [0x11, 0x22]
+        self.radio.write_frequency_base(False)
+        synt = registers[Spirit1Registers.SYNT_3:Spirit1Registers.SYNT_0 + 1]
+        table = ChannelTable.from_channels(self.radio, [0, 1, 2])
+
+        self.assertTrue(table.calibrate())
+
+        for entry in table:
+            self.assertEqual(entry.vco_tx, entry.synt[3] & 0x7F)
+        self.assertEqual(registers[Spirit1Registers.SYNT_3:Spirit1Registers.SYNT_0 + 1], synt)
+        self.assertEqual(registers[Spirit1Registers.CHANNEL_NUMBER:Spirit1Registers.RCO_VCO_CALIBR_IN0 + 1], [
+            5, 0x70, 0x11, 0x22,
+        ])
+
+    def test_reconfigure_after_a_hop_restores_the_synthesizer(self):
+        spi = RecordingSpi()
+        radio = Radio(Spirit1Device(spi), RadioConfig(reference_divider=False, channel_space=200_000))
+        self.assertTrue(radio.init_device())
+        table = ChannelTable.from_channels(radio, [7])
+        self.assertTrue(table.calibrate())
+        self.assertTrue(table.hop(0))
+        spi.clear()
+
+        self.assertTrue(radio.reconfigure(dataclasses.replace(radio.config)))
+
+        image = compile_registers(radio.config)
+        for register in (Spirit1Registers.SYNT_3, Spirit1Registers.SYNT_0, Spirit1Registers.CHANNEL_NUMBER):
+            self.assertEqual(spi.registers[register], image.value(register, spi.registers[register]))
+        self.assertIn((Spirit1State.READY, Spirit1State.LOCK), spi.report().transitions)
+
+    def test_frequencies_outside_the_bands_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ChannelTable(self.radio, [600_000_000])
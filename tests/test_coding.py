@@ -0,0 +1,55 @@
+import unittest
+
+from spirit1.coding import encoded_length, fec_decode, fec_encode, pn9, whiten
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class WhiteningTests(unittest.TestCase):
+    def test_pn9_sequence_starts_with_the_documented_bytes(self):
+        self.assertEqual(pn9(8), bytes.fromhex("ffe11d9aed853324"))
+
+    def test_whitening_is_its_own_inverse(self):
+        data = bytes(range(40))
+
+        self.assertEqual(whiten(b"\x00" * 40), pn9(40))
+        self.assertEqual(whiten(whiten(data)), data)
+
+
+class FecTests(unittest.TestCase):
+    def test_frames_round_trip_with_the_trellis_terminator(self):
+        for data in (b"", b"\x01", bytes(range(19)), bytes(range(20))):
+            with self.subTest(length=len(data)):
+                encoded = fec_encode(data)
+
+                self.assertEqual(len(encoded), encoded_length(len(data)))
+                decoded = fec_decode(encoded)
+                self.assertEqual(decoded[:len(data)], data)
+                self.assertEqual(set(decoded[len(data):]), {0x0B})
+
+    def test_scattered_bit_errors_are_corrected(self):
+        data = bytes.fromhex("05ff00b1cfc37f011fc82f6c0207e87461cbfb")
+        encoded = bytearray(fec_encode(data))
+        for position in (1, 14, 27):
+            encoded[position] ^= 0x20
+
+        self.assertEqual(fec_decode(bytes(encoded))[:len(data)], data)
+
+    def test_partial_blocks_are_rejected(self):
+        with self.assertRaises(ValueError):
+            fec_decode(b"\x00\x00\x00")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_arrays_are_coded_one_frame_per_row(self):
+        frames = numpy.arange(3 * 11, dtype=numpy.uint8).reshape(3, 11)
+
+        encoded = fec_encode(frames)
+        errors = encoded.copy()
+        errors[:, 6] ^= 0x04
+
+        self.assertEqual([bytes(row) for row in encoded], [fec_encode(bytes(row)) for row in frames])
+        self.assertTrue((fec_decode(errors)[:, :11] == frames).all())
+        self.assertTrue((whiten(frames)[1] == numpy.frombuffer(whiten(bytes(frames[1])), numpy.uint8)).all())
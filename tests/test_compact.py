@@ -0,0 +1,69 @@
+import sys
+import unittest
+
+from spirit1.basic_packet import BasicPacket, BasicPacketConfig
+from spirit1.compact import PayloadPool
+from spirit1.enums import CrcMode
+from spirit1.receiver import ReceivedMessage
+
+
+def received(payload: bytes) -> ReceivedMessage:
+    return ReceivedMessage(
+        bytearray(payload),
+        crc_valid=True,
+        rssi=96,
+        sqi=32,
+        pqi=40,
+        agc_word=8,
+        source_address=0x00,
+        destination_address=0xFF,
+        control_data=b"\xd6\x00\x38\x06",
+        crc=b"\x70\x2f\x6c",
+    )
+
+
+class CompactMessageTests(unittest.TestCase):
+    def test_round_trip_preserves_every_received_field(self):
+        raw = received(b"\x05\xff\x00\xb1")
+
+        self.assertEqual(raw.compact().to_received(), raw)
+        self.assertEqual(raw.compact(PayloadPool(64)).to_received(), raw)
+
+    def test_pooled_messages_share_a_slab_and_expose_read_only_payloads(self):
+        pool = PayloadPool(slab_size=32)
+        first = received(b"\x01\x02").compact(pool)
+        second = received(b"\x03\x04").compact(pool)
+
+        self.assertIs(first._buffer, second._buffer)
+        self.assertEqual(bytes(second.payload), b"\x03\x04")
+        self.assertTrue(first.payload.readonly)
+        with self.assertRaises(AttributeError):
+            first.extra = True
+
+    def test_full_slabs_are_replaced_without_disturbing_stored_messages(self):
+        pool = PayloadPool(slab_size=12)
+        first = received(b"\xaa").compact(pool)
+        second = received(b"\xbb\xbb\xbb\xbb\xbb").compact(pool)
+
+        self.assertIsNot(first._buffer, second._buffer)
+        self.assertEqual(bytes(first.payload), b"\xaa")
+        self.assertEqual(second.crc, b"\x70\x2f\x6c")
+
+    def test_compact_message_is_smaller_than_a_received_message(self):
+        raw = received(bytes(19))
+        compact = raw.compact(PayloadPool())
+
+        self.assertLess(sys.getsizeof(compact), sys.getsizeof(raw) + sys.getsizeof(raw.__dict__))
+
+    def test_basic_packet_decodes_a_compact_message(self):
+        packet = BasicPacket(None, BasicPacketConfig(
+            control_length=4,
+            address_field=True,
+            crc_mode=CrcMode.CRC_MODE_864CBF,
+        ))
+
+        message = packet.decode(received(b"\x05\xff").compact(PayloadPool()))
+
+        self.assertEqual(message.payload, b"\x05\xff")
+        self.assertEqual(message.control_data, b"\xd6\x00\x38\x06")
+        self.assertEqual(message.rssi, 96)
@@ -0,0 +1,192 @@
+import dataclasses
+import unittest
+
+from spirit1 import Spirit1Device
+from spirit1.basic_packet import BasicPacketConfig
+from spirit1.compiler import RegisterImage, compile_registers, radio_image
+from spirit1.dryrun import RecordingSpi
+from spirit1.enums import Spirit1Modulation
+from spirit1.radio import DOUBLE_XTAL_THR, Radio, synth_frequency
+from spirit1.radio_config import RadioConfig
+from spirit1.registers import Spirit1Registers
+from spirit1.timer import TimerConfig
+
+
+class RegisterFile:
+    def __init__(self, fill=0xFF):
+        self.registers = [fill] * 256
+        self.transactions = []
+
+    def read_register(self, register):
+        self.transactions.append(("read", register, 1))
+        return self.registers[register]
+
+    def read_register_block(self, register, length):
+        self.transactions.append(("read", register, length))
+        return bytearray(self.registers[register:register + length])
+
+    def write_registers(self, register, *values):
+        self.transactions.append(("write", register, len(values)))
+        self.registers[register:register + len(values)] = values
+
+    def get_register_bit(self, register, bit):
+        return bool(self.registers[register] & (1 << bit))
+
+    def set_register_bit(self, register, bit, value):
+        current = self.registers[register] & ~(1 << bit)
+        self.write_registers(register, current | (int(value) << bit))
+
+    def standby(self):
+        return True
+
+    def ready(self):
+        return True
+
+
+class CompilerTests(unittest.TestCase):
+    def test_equal_configurations_reuse_the_compiled_image(self):
+        first = compile_registers(RadioConfig(reference_divider=False), BasicPacketConfig(sync_words=[1, 2]))
+        second = compile_registers(RadioConfig(reference_divider=False), BasicPacketConfig(sync_words=(1, 2)))
+        other = compile_registers(RadioConfig(reference_divider=False, channel_number=3))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(other[Spirit1Registers.CHANNEL_NUMBER], (3, 0xFF))
+
+    def test_invalid_or_unresolved_configurations_are_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_registers(RadioConfig())
+        with self.assertRaises(ValueError):
+            compile_registers(RadioConfig(reference_divider=False, datarate=1))
+
+    def test_overlapping_configurations_merge_their_bits(self):
+        image = compile_registers(
+            packet=BasicPacketConfig(),
+            timer=TimerConfig(26_000_000, stop_conditions_or=True),
+        )
+
+        self.assertEqual(image[Spirit1Registers.PKTFLT_OPTS], (0x80, 0xB1))
+
+    def test_apply_writes_one_burst_per_run_and_keeps_foreign_bits(self):
+        device = RegisterFile(fill=0xFF)
+        image = RegisterImage({0x10: (0x12, 0xFF), 0x11: (0x00, 0x0F), 0x20: (0x34, 0xFF)})
+
+        image.apply(device)
+
+        self.assertEqual(device.transactions, [("read", 0x10, 2), ("write", 0x10, 2), ("write", 0x20, 1)])
+        self.assertEqual(device.registers[0x10:0x12], [0x12, 0xF0])
+
+    def test_sync_writes_only_mismatching_registers_without_rereading(self):
+        spi = RecordingSpi({0x10: 0x12, 0x11: 0xA5, 0x20: 0x33})
+        image = RegisterImage({0x10: (0x12, 0xFF), 0x11: (0x05, 0x0F), 0x20: (0x34, 0xFF)})
+
+        stale = image.sync(Spirit1Device(spi))
+
+        self.assertEqual(list(stale), [0x20])
+        self.assertEqual(spi.registers[0x20], 0x34)
+        self.assertEqual([(t.kind, t.address) for t in spi.report().transactions if t.kind == "write"], [("write", 0x20)])
+        self.assertEqual(image.sync(Spirit1Device(spi)), RegisterImage())
+
+    def test_signature_identifies_values_and_masks(self):
+        image = RegisterImage({0x10: (0x12, 0xFF)})
+
+        self.assertEqual(image.signature(), RegisterImage({0x10: (0x12, 0xFF)}).signature())
+        self.assertNotEqual(image.signature(), RegisterImage({0x10: (0x12, 0x7F)}).signature())
+
+    def test_init_device_applies_the_compiled_image_before_calibrating(self):
+        device = RegisterFile(fill=0x00)
+        radio = Radio(device, RadioConfig(reference_divider=True, channel_number=2))
+        radio.vco_calibration = lambda: True
+
+        self.assertTrue(radio.init_device())
+
+        image = compile_registers(radio.config)
+        writes = [transaction for transaction in device.transactions if transaction[0] == "write"]
+        self.assertEqual(len(writes), len(image.runs()))
+        for register in image:
+            self.assertEqual(device.registers[register], image.value(register, 0x00))
+
+    def test_compiled_image_matches_the_imperative_setters(self):
+        configs = [
+            RadioConfig(reference_divider=False),
+            RadioConfig(reference_divider=True, channel_space=100_000, channel_number=2),
+            RadioConfig(
+                xtal_frequency=50_000_000,
+                base_frequency=433_920_000,
+                channel_space=100_000,
+                channel_number=3,
+                modulation=Spirit1Modulation.FSK,
+                datarate=38_400,
+                freq_deviation=20_000,
+                bandwidth=100_000,
+                frequency_offset=-12,
+                reference_divider=False,
+            ),
+            RadioConfig(
+                xtal_frequency=50_000_000,
+                base_frequency=169_400_000,
+                modulation=Spirit1Modulation.GFSK_BT05,
+                datarate=2_400,
+                bandwidth=12_000,
+                frequency_offset=25,
+                reference_divider=True,
+            ),
+        ]
+        for config in configs:
+            with self.subTest(config=config):
+                # The register writes init_device() made before it used the compiler.
+                imperative = RecordingSpi()
+                spirit = Spirit1Device(imperative)
+                radio = Radio(spirit, dataclasses.replace(config))
+                radio.set_reference_divider(config.reference_divider)
+                radio.set_xtal_frequency(config.xtal_frequency)
+                spirit.set_register_bit(Spirit1Registers.PM_CONFIG_2, 5, False)
+                spirit.set_register_bit(Spirit1Registers.SYNTH_CONFIG_LO, 7, True)
+                spirit.set_register_bit(Spirit1Registers.DEM_CONFIG, 1, False)
+                radio.write_if_offsets()
+                radio.write_frequency_offset()
+                radio.write_channel_number()
+                radio.write_channel_space()
+                radio.write_datarate_me()
+                radio.write_frequency_deviation_me()
+                radio.write_channel_bandwidth_me()
+                radio.write_modulation()
+                spirit.set_register_bit(Spirit1Registers.AFC_2, 7, True)
+                _ = spirit.write_registers(Spirit1Registers.IQC_1, 0x80, 0xE3)
+                radio.write_frequency_base(False)
+
+                compiled = RecordingSpi()
+                resolved = dataclasses.replace(config, digital_divider=config.xtal_frequency > DOUBLE_XTAL_THR)
+                compile_registers(resolved).apply(Spirit1Device(compiled))
+
+                self.assertEqual(bytes(compiled.registers), bytes(imperative.registers))
+
+    def test_device_registers_decode_to_an_equivalent_configuration(self):
+        config = RadioConfig(
+            xtal_frequency=50_000_000,
+            base_frequency=433_920_000,
+            channel_space=100_000,
+            channel_number=3,
+            modulation=Spirit1Modulation.FSK,
+            datarate=38_400,
+            freq_deviation=20_000,
+            bandwidth=100_000,
+            frequency_offset=-12,
+            reference_divider=False,
+            digital_divider=True,
+        )
+        spi = RecordingSpi()
+        radio = Radio(Spirit1Device(spi), RadioConfig(xtal_frequency=50_000_000))
+        radio_image(config).apply(radio.spirit)
+        spi.clear()
+
+        radio.update_from_device()
+
+        self.assertEqual(spi.report().reads, 5)
+        self.assertEqual(radio_image(radio.config), radio_image(config))
+        self.assertEqual(radio.config.modulation, Spirit1Modulation.FSK)
+        self.assertEqual(radio.config.channel_number, 3)
+        self.assertEqual(radio.config.frequency_offset, -12)
+        # Within one synthesizer step of the middle band.
+        self.assertLess(abs(synth_frequency(radio.config).frequency - synth_frequency(config).frequency), 50_000_000 / 2**18 / 6)
+        self.assertFalse(radio.config.reference_divider)
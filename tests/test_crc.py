@@ -0,0 +1,74 @@
+import unittest
+
+from spirit1.basic_packet import BasicPacketConfig, BasicPacketMessage
+from spirit1.crc import Crc, basic_packet_crc, basic_packet_crcs, check_basic_packet_crc
+from spirit1.enums import CrcMode
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def bitwise(crc, data):
+    value = crc.init
+    for byte in data:
+        value = crc.update_bits(value, byte, 8)
+    return value
+
+
+class CrcTests(unittest.TestCase):
+    def test_sixteen_bit_modes_match_published_check_values(self):
+        self.assertEqual(Crc(CrcMode.CRC_MODE_1021).compute(b"123456789"), 0x29B1)
+        self.assertEqual(Crc(CrcMode.CRC_MODE_8005).compute(b"123456789"), 0xAEE7)
+
+    def test_tables_match_the_bitwise_calculation(self):
+        data = bytes(range(256))
+        for mode in (CrcMode.CRC_MODE_7, CrcMode.CRC_MODE_8005, CrcMode.CRC_MODE_1021, CrcMode.CRC_MODE_864CBF):
+            crc = Crc(mode)
+            self.assertEqual(crc.compute(data), bitwise(crc, data), mode.name)
+            self.assertEqual(mode.length * 8, crc.width, mode.name)
+
+    def test_crc_off_has_no_engine(self):
+        with self.assertRaises(ValueError):
+            Crc(CrcMode.CRC_MODE_OFF)
+
+    def test_transmit_frames_can_be_prechecked(self):
+        config = BasicPacketConfig(crc_mode=CrcMode.CRC_MODE_1021, control_length=2, address_field=True)
+        message = BasicPacketMessage(b"hello", destination_address=7, control_data=b"\x01\x02")
+        message.crc = basic_packet_crc(config, message)
+
+        self.assertEqual(len(message.crc), 2)
+        self.assertTrue(check_basic_packet_crc(config, message))
+        message.payload = b"hellO"
+        self.assertFalse(check_basic_packet_crc(config, message))
+        with self.assertRaises(ValueError):
+            basic_packet_crc(config, BasicPacketMessage(b"hello", control_data=b"\x01\x02"))
+
+    def test_length_field_and_control_bytes_follow_the_transmit_path(self):
+        config = BasicPacketConfig(crc_mode=CrcMode.CRC_MODE_1021, control_length=2, address_field=True)
+        message = BasicPacketMessage(b"hello", destination_address=7, control_data=b"\x01\x02\x03")
+        programmed = config.packet_length(len(message.payload))
+
+        self.assertEqual(basic_packet_crc(config, message), basic_packet_crc(config, message, length=8))
+        self.assertNotEqual(basic_packet_crc(config, message, length=programmed), basic_packet_crc(config, message))
+        # Only the leading control bytes are sent, as BasicPacket.transmit() writes them.
+        self.assertEqual(
+            basic_packet_crc(config, message),
+            basic_packet_crc(config, BasicPacketMessage(b"hello", destination_address=7, control_data=b"\x01\x02")),
+        )
+
+    def test_fixed_length_packets_have_no_length_field(self):
+        variable = BasicPacketConfig(crc_mode=CrcMode.CRC_MODE_7, fixed_packet_length=20)
+        fixed = BasicPacketConfig(crc_mode=CrcMode.CRC_MODE_7, fixed_length=True, fixed_packet_length=20)
+        message = BasicPacketMessage(b"\x00" * 20)
+
+        self.assertEqual(basic_packet_crc(fixed, message), bytes([Crc(CrcMode.CRC_MODE_7).compute(message.payload)]))
+        self.assertNotEqual(basic_packet_crc(variable, message), basic_packet_crc(fixed, message))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_batches_match_single_messages(self):
+        config = BasicPacketConfig(crc_mode=CrcMode.CRC_MODE_864CBF, fixed_packet_length=100, control_length=1)
+        messages = [BasicPacketMessage(bytes(range(length)), control_data=bytes([length])) for length in (3, 9, 3, 0, 9)]
+
+        self.assertEqual(basic_packet_crcs(config, messages), [basic_packet_crc(config, m) for m in messages])
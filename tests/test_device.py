@@ -46,6 +46,16 @@ class Spirit1DeviceTests(unittest.TestCase):
 
         self.assertEqual(spi.transfers[-1], (0x01, 0xD2, 0x00, 0x00))
 
+    def test_scattered_registers_are_read_in_coalesced_blocks(self):
+        spi = FakeSpi()
+        device = Spirit1Device(spi)
+        spi.transfers.clear()
+
+        values = device.read_registers([0x0B, 0x08, 0x10, 0x6C])
+
+        self.assertEqual(sorted(values), [0x08, 0x0B, 0x10, 0x6C])
+        self.assertEqual(spi.transfers, [(0x01, 0x08) + (0x00,) * 9, (0x01, 0x6C, 0x00)])
+
     def test_state_transition_resets_lockwon_before_retrying(self):
         device = object.__new__(Spirit1Device)
         device.status = Spirit1Status()
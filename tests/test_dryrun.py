@@ -0,0 +1,47 @@
+import unittest
+
+from spirit1 import Radio, RadioConfig, Spirit1Device
+from spirit1.dryrun import DryRunReport, RecordingSpi, SpiTransaction
+from spirit1.enums import Spirit1State
+from spirit1.registers import Spirit1Registers
+
+
+class DryRunTests(unittest.TestCase):
+    def test_init_device_runs_against_the_recording_transport(self):
+        spi = RecordingSpi()
+        spirit = Spirit1Device(spi)
+        spi.clear()
+
+        self.assertTrue(Radio(spirit, RadioConfig(xtal_frequency=50_000_000)).init_device())
+
+        report = spi.report()
+        self.assertEqual(report.transitions, [
+            (Spirit1State.READY, Spirit1State.STANDBY),
+            (Spirit1State.STANDBY, Spirit1State.READY),
+            (Spirit1State.READY, Spirit1State.LOCK),
+            (Spirit1State.LOCK, Spirit1State.READY),
+            (Spirit1State.READY, Spirit1State.LOCK),
+            (Spirit1State.LOCK, Spirit1State.READY),
+        ])
+        self.assertEqual(report.state_polls, 6)
+        self.assertEqual(spi.state, Spirit1State.READY)
+        self.assertEqual(spirit.read_register(Spirit1Registers.VCO_CONFIG), 0x11)
+        # A budget for the configuration path: the register image plus calibration.
+        self.assertLessEqual(report.writes, 13)
+        self.assertLess(report.estimated_time(spi_clock_hz=1_000_000), 0.01)
+
+    def test_estimate_counts_bus_time_overhead_and_polls(self):
+        report = DryRunReport([
+            SpiTransaction("command", 0x62, b"", Spirit1State.READY),
+            SpiTransaction("read", 0xC0, b"\x00", Spirit1State.READY),
+            SpiTransaction("write", 0x08, b"\x00" * 4, Spirit1State.READY),
+        ])
+
+        self.assertEqual(report.bytes, 11)
+        self.assertEqual(report.state_polls, 1)
+        self.assertAlmostEqual(
+            report.estimated_time(spi_clock_hz=1_000_000, transaction_overhead=0.0001, poll_interval=0.001),
+            88e-6 + 0.0003 + 0.001,
+        )
+        self.assertIn("3 transactions (1 reads, 1 writes, 1 commands), 11 bytes", report.format())
+
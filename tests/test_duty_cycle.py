@@ -0,0 +1,105 @@
+import asyncio
+import time
+import unittest
+
+from spirit1.basic_packet import BasicPacketConfig, BasicPacketMessage
+from spirit1.duty_cycle import DutyCycleScheduler, SubBand, airtime
+from spirit1.enums import CrcMode
+from spirit1.radio_config import RadioConfig
+from spirit1.transmitter import TransmitOutcome, TransmitResult
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingPacket:
+    def __init__(self, config):
+        self.config = config
+        self.sent_at = []
+
+    async def transmit_async(self, message, timeout):
+        now = time.monotonic()
+        self.sent_at.append(now)
+        return TransmitResult(TransmitOutcome.SENT, now, now)
+
+
+class SlowPacket:
+    def __init__(self, config):
+        self.config = config
+        self.on_air = []
+
+    async def transmit_async(self, message, timeout):
+        start = time.monotonic()
+        await asyncio.sleep(0.01)
+        self.on_air.append((start, time.monotonic()))
+        return TransmitResult(TransmitOutcome.SENT, start, start)
+
+
+class DutyCycleTests(unittest.TestCase):
+    def test_airtime_counts_every_packet_field_and_fec_doubling(self):
+        radio = RadioConfig(datarate=10_000)
+        config = BasicPacketConfig(
+            preamble_length=4,
+            sync_words=(1, 2, 3, 4),
+            fixed_packet_length=255,
+            crc_mode=CrcMode.CRC_MODE_1021,
+            control_length=1,
+            address_field=True,
+        )
+
+        # 64 preamble/sync bits, 8 length bits and 8 * (10 + 1 + 2 + 2) body bits.
+        self.assertAlmostEqual(airtime(radio, config, 10), 192 / 10_000)
+        config.fec = True
+        self.assertAlmostEqual(airtime(radio, config, 10), (64 + 2 * 128) / 10_000)
+
+    def test_earliest_waits_for_old_airtime_to_leave_the_window(self):
+        clock = FakeClock()
+        band = SubBand("test", 868_000_000, 868_600_000, 0.01, window=100.0)
+        scheduler = DutyCycleScheduler(RadioConfig(), [band], clock)
+
+        scheduler.record(0.6, start=0.0)
+        scheduler.record(0.3, start=10.0)
+        clock.now = 20.0
+
+        self.assertEqual(scheduler.earliest(0.1), 20.0)
+        self.assertAlmostEqual(scheduler.earliest(0.2), 99.9)
+        self.assertAlmostEqual(scheduler.used(band), 0.9)
+        self.assertEqual(scheduler.earliest(0.2, frequency=915_000_000), 20.0)
+        with self.assertRaises(ValueError):
+            scheduler.earliest(2.0)
+
+    def test_transmit_holds_frames_until_they_fit_the_budget(self):
+        # Each frame is 656 bits (6.56 ms), so only three fit the 25 ms budget
+        # and the fourth waits until the window has moved on by 43.85 ms.
+        band = SubBand("test", 868_000_000, 868_600_000, 0.5, window=0.05)
+        scheduler = DutyCycleScheduler(RadioConfig(datarate=100_000), [band])
+        packet = RecordingPacket(BasicPacketConfig(fixed_length=True, fixed_packet_length=80))
+        message = BasicPacketMessage(payload=bytes(80))
+
+        async def send_all():
+            return [await scheduler.transmit(packet, message) for _ in range(4)]
+
+        results = asyncio.run(send_all())
+
+        self.assertTrue(all(result.sent for result in results))
+        self.assertLess(packet.sent_at[2] - packet.sent_at[0], 0.04)
+        self.assertGreaterEqual(packet.sent_at[3] - packet.sent_at[0], 0.0438)
+
+    def test_concurrent_callers_do_not_overlap_on_air(self):
+        scheduler = DutyCycleScheduler(RadioConfig(datarate=100_000), [])
+        packet = SlowPacket(BasicPacketConfig())
+        message = BasicPacketMessage(payload=b"frame")
+
+        async def send_together():
+            return await asyncio.gather(scheduler.transmit(packet, message), scheduler.transmit(packet, message))
+
+        results = asyncio.run(send_together())
+
+        self.assertTrue(all(result.sent for result in results))
+        first, second = sorted(packet.on_air)
+        self.assertGreaterEqual(second[0], first[1])
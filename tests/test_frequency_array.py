@@ -0,0 +1,63 @@
+import unittest
+
+from spirit1.frequency import Frequency
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+else:
+    from spirit1 import frequency_array
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class FrequencyArrayTests(unittest.TestCase):
+    def setUp(self):
+        edges = [149_000_000, 175_100_000, 299_000_000, 349_100_000, 386_000_000, 471_100_000, 778_000_000, 957_100_000]
+        spread = numpy.linspace(140_000_000, 960_000_000, 4001).astype(numpy.int64)
+        self.frequencies = numpy.concatenate([spread, edges, [430_083_334, 860_166_667, 600_000_000]])
+
+    def test_matches_the_scalar_calculations(self):
+        scalars = [Frequency(value) for value in self.frequencies.tolist()]
+
+        self.assertEqual(
+            frequency_array.frequency_bands(self.frequencies).tolist(),
+            [frequency.frequency_band.value for frequency in scalars],
+        )
+        self.assertEqual(
+            frequency_array.vco_settings(self.frequencies).tolist(),
+            [frequency.vco().value for frequency in scalars],
+        )
+        self.assertEqual(
+            frequency_array.is_possible(self.frequencies).tolist(),
+            [frequency.is_possible() for frequency in scalars],
+        )
+        for divider, xtal in ((False, 50_000_000), (True, 26_000_000)):
+            self.assertEqual(
+                frequency_array.synt_registers(self.frequencies, divider, xtal).tolist(),
+                [frequency.synt_reg_values(divider, xtal) for frequency in scalars],
+            )
+
+    def test_registers_decode_back_to_frequencies(self):
+        registers = frequency_array.synt_registers(self.frequencies, False, 50_000_000)
+
+        words, bands = frequency_array.decode_synt_registers(registers)
+        decoded = frequency_array.calculate(words, 50_000_000, False, bands)
+
+        expected = [
+            Frequency.calculate(
+                ((row[0] & 0x1F) << 21) + (row[1] << 13) + (row[2] << 5) + (row[3] >> 3),
+                50_000_000,
+                False,
+                row[3] & 0x07,
+            ).frequency
+            for row in registers.tolist()
+        ]
+        self.assertEqual(decoded.tolist(), expected)
+
+    def test_scalars_are_accepted(self):
+        self.assertEqual(
+            frequency_array.synt_registers(868_000_000, False, 50_000_000).tolist(),
+            Frequency(868_000_000).synt_reg_values(False, 50_000_000),
+        )
+
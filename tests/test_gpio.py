@@ -3,7 +3,7 @@ import types
 import unittest
 from unittest.mock import patch
 
-from spirit1.gpio import open_gpiozero_sdn
+from spirit1.gpio import open_gpiozero_irq, open_gpiozero_sdn
 
 
 class FakeOutputDevice:
@@ -17,6 +17,20 @@ class FakeOutputDevice:
         self.closed = True
 
 
+class FakeInputDevice:
+    def __init__(self, pin, *, pull_up):
+        self.pin = pin
+        self.pull_up = pull_up
+        self.timeouts = []
+
+    def wait_for_active(self, timeout=None):
+        self.timeouts.append(timeout)
+        return False
+
+    def close(self):
+        pass
+
+
 class GpioTests(unittest.TestCase):
     def test_gpiozero_sdn_uses_bcm_gpio4_and_preserves_state_by_default(self):
         output = None
@@ -36,3 +50,12 @@ class GpioTests(unittest.TestCase):
         self.assertTrue(sdn.get_value())
         sdn.close()
         self.assertTrue(output.closed)
+
+    def test_gpiozero_irq_pin_waits_on_a_pulled_up_input(self):
+        with patch.dict(sys.modules, {"gpiozero": types.SimpleNamespace(DigitalInputDevice=FakeInputDevice)}):
+            irq_pin = open_gpiozero_irq(25)
+
+        self.assertFalse(irq_pin.wait(0.5))
+        self.assertEqual(irq_pin._input_device.pin, 25)
+        self.assertTrue(irq_pin._input_device.pull_up)
+        self.assertEqual(irq_pin._input_device.timeouts, [0.5])
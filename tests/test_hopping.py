@@ -0,0 +1,183 @@
+import asyncio
+import unittest
+
+from spirit1.basic_packet import BasicPacketConfig, BasicPacketMessage
+from spirit1.channels import ChannelTable
+from spirit1.frequency import Frequency
+from spirit1.hopping import FrequencyHopper, hop_sequence
+from spirit1.radio import Radio, channel_step
+from spirit1.radio_config import RadioConfig
+from spirit1.registers import Spirit1Registers
+
+
+class HopDevice:
+    """Register file that records bursts and state commands."""
+
+    def __init__(self):
+        self.registers = [0] * 256
+        self.registers[Spirit1Registers.RCO_VCO_CALIBR_IN2] = 0x70
+        self.writes = []
+        self.commands = []
+
+    def read_register(self, register):
+        if register == Spirit1Registers.RCO_VCO_CALIBR_OUT0:
+            return self.registers[Spirit1Registers.SYNT_0] & 0x7F
+        return self.registers[register]
+
+    def read_register_block(self, register, count):
+        return bytearray(self.registers[register:register + count])
+
+    def write_registers(self, register, *values):
+        self.writes.append((register, values))
+        self.registers[register:register + len(values)] = values
+
+    def update_register(self, register, mask, value):
+        self.write_registers(register, (self.registers[register] & mask) + value)
+
+    def set_register_bit(self, register, bit, value):
+        pass
+
+    def refresh_status(self):
+        pass
+
+    def is_standby(self):
+        return False
+
+    def lock_tx(self):
+        return True
+
+    def lock_rx(self):
+        return True
+
+    def ready(self):
+        return True
+
+    def sabort(self):
+        self.commands.append("sabort")
+        return True
+
+    def start_rx(self):
+        self.commands.append("start_rx")
+        return True
+
+
+class FakePacket:
+    def __init__(self):
+        self.config = BasicPacketConfig()
+        self.sent = []
+
+    async def transmit_async(self, message, timeout):
+        self.sent.append(message)
+        return True
+
+
+class HopSequenceTests(unittest.TestCase):
+    def test_sequence_is_a_reproducible_permutation(self):
+        sequence = hop_sequence(50, seed=7)
+
+        self.assertEqual(sorted(sequence), list(range(50)))
+        self.assertEqual(sequence, hop_sequence(50, seed=7))
+        self.assertNotEqual(sequence, hop_sequence(50, seed=8))
+        self.assertEqual(hop_sequence(5, seed=1), [2, 3, 0, 1, 4])
+
+
+class FrequencyHopperTests(unittest.TestCase):
+    def setUp(self):
+        self.device = HopDevice()
+        self.radio = Radio(self.device, RadioConfig(reference_divider=False, channel_space=200_000))
+        self.now = 0.0
+
+    def hopper(self, table, sequence):
+        self.assertTrue(table.calibrate())
+        self.device.writes.clear()
+        return FrequencyHopper(table, sequence, dwell=0.1, clock=lambda: self.now)
+
+    def test_raster_channels_hop_with_one_burst(self):
+        table = ChannelTable.from_channels(self.radio, [0, 3, 7])
+        hopper = self.hopper(table, [2, 0, 1])
+        self.assertTrue(hopper.single_burst)
+
+        hopper.start(receive=True)
+        self.device.writes.clear()
+        self.device.commands.clear()
+        self.now = 0.1
+        self.assertTrue(hopper.hop())
+
+        entry = table[0]
+        self.assertEqual(self.device.writes, [
+            (Spirit1Registers.CHANNEL_NUMBER, (0, 0x70, entry.vco_tx, entry.vco_rx)),
+        ])
+        self.assertEqual(self.device.commands, ["sabort", "start_rx"])
+        self.assertIn(Spirit1Registers.SYNT_3, self.radio._unknown)
+
+    def synthesized(self, radio):
+        """Return the frequency the register file tunes the synthesizer to."""
+        registers = self.device.registers
+        synt = registers[Spirit1Registers.SYNT_3:Spirit1Registers.SYNT_0 + 1]
+        word = ((synt[0] & 0x1F) << 21) | (synt[1] << 13) | (synt[2] << 5) | (synt[3] >> 3)
+        base = Frequency.calculate(word, radio.xtal_frequency, radio.reference_divider, synt[3] & 0x07)
+        channel = registers[Spirit1Registers.CHANNEL_NUMBER]
+        return base.frequency + channel * channel_step(radio.config.channel_space, radio.xtal_frequency)
+
+    def test_raster_and_table_hops_reach_the_same_frequency(self):
+        radio = Radio(self.device, RadioConfig(xtal_frequency=26_000_000, reference_divider=False, channel_space=200_000))
+        table = ChannelTable.from_channels(radio, [0, 50])
+        hopper = self.hopper(table, [1])
+        self.assertTrue(hopper.single_burst)
+
+        hopper.start()
+        self.assertEqual(self.device.registers[Spirit1Registers.CHANNEL_NUMBER], 50)
+        raster = self.synthesized(radio)
+        self.assertTrue(table.hop(1))
+        self.assertEqual(self.device.registers[Spirit1Registers.CHANNEL_NUMBER], 0)
+
+        self.assertLess(abs(raster - self.synthesized(radio)), 40)
+        # The nominal 200 kHz grid is about 37 kHz off the chip's channel 50.
+        nominal = ChannelTable(radio, [radio.config.base_frequency, radio.config.base_frequency + 50 * 200_000])
+        self.assertFalse(self.hopper(nominal, [1]).single_burst)
+
+    def test_transmit_hops_to_the_current_slot_instead_of_waiting(self):
+        table = ChannelTable.from_channels(self.radio, [0, 1])
+        hopper = self.hopper(table, [0, 1])
+        hopper.start(epoch=0.0)
+        packet = FakePacket()
+        message = BasicPacketMessage(payload=b"hop")
+
+        self.now = 0.11
+        result = asyncio.run(asyncio.wait_for(hopper.transmit(packet, message), 0.05))
+
+        self.assertTrue(result)
+        self.assertEqual(packet.sent, [message])
+        self.assertEqual(self.device.registers[Spirit1Registers.CHANNEL_NUMBER], 1)
+
+    def test_off_raster_channels_fall_back_to_the_table(self):
+        table = ChannelTable(self.radio, [868_000_000, 868_150_000])
+        hopper = self.hopper(table, [1, 0])
+        self.assertFalse(hopper.single_burst)
+
+        hopper.start()
+
+        self.assertEqual(self.device.writes[-1][1][1:], (0x70, table[1].vco_tx, table[1].vco_rx))
+
+    def test_statistics_and_resync(self):
+        table = ChannelTable.from_channels(self.radio, [0, 1, 2, 3])
+        hopper = self.hopper(table, [0, 1, 2, 3])
+        hopper.start(epoch=0.0)
+
+        self.now = 0.105
+        hopper.hop()
+        self.now = 0.42
+        hopper.hop()
+
+        self.assertEqual((hopper.stats.hops, hopper.stats.missed, hopper.stats.late), (3, 2, 1))
+        self.assertAlmostEqual(hopper.stats.max_lateness, 0.02)
+
+        # A beacon sent 5 ms into position 1 arrives 12 ms later than expected.
+        self.now = 0.517
+        hopper.resync(1, offset=0.005)
+
+        self.assertAlmostEqual(hopper.epoch, 0.012)
+        self.assertEqual(hopper.slot(), 5)
+        self.assertEqual(hopper.channel(hopper.slot()), 1)
+        self.assertEqual(hopper.stats.resyncs, 1)
+
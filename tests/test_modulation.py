@@ -0,0 +1,45 @@
+import unittest
+
+from spirit1.modulation import (
+    CHANNEL_FILTER_BANDWIDTHS_26M,
+    ModulationSolver,
+    modulation_solver,
+)
+
+
+class ModulationSolverTests(unittest.TestCase):
+    def test_results_are_the_nearest_achievable_values(self):
+        solver = ModulationSolver(50_000_000, True)
+        clock = 50_000_000 >> 6
+
+        for requested in (150, 1_200, 9_600, 38_400, 50_000, 250_000, 500_000):
+            setting = solver.datarate(requested)
+            achieved = ((256 + setting.mantissa) * clock) >> (23 - setting.exponent)
+            best = min(
+                abs(requested - (((256 + mantissa) * clock) >> (23 - exponent)))
+                for mantissa in range(256)
+                for exponent in range(16)
+            )
+            self.assertEqual(setting.achieved, achieved)
+            self.assertEqual(abs(setting.error), best)
+
+        setting = solver.bandwidth(100_000)
+        self.assertEqual(setting.achieved, CHANNEL_FILTER_BANDWIDTHS_26M[setting.mantissa + 9 * setting.exponent] * 500_000 / 2600)
+        self.assertEqual(abs(setting.error), min(abs(100_000 - value) for value in solver.bandwidths.values))
+
+        setting = solver.deviation(20_000)
+        self.assertEqual(setting.achieved, 50_000_000 / 2**18 * (8 + setting.mantissa) / 2 * 2**setting.exponent)
+        self.assertEqual(abs(setting.error), min(abs(20_000 - value) for value in solver.deviations.values))
+
+    def test_values_outside_the_tables(self):
+        solver = ModulationSolver(26_000_000, False)
+
+        with self.assertRaises(ValueError):
+            solver.datarate(10)
+        self.assertEqual(solver.deviation(0).achieved, solver.deviations.minimum)
+        self.assertEqual(solver.bandwidth(10**9).achieved, solver.bandwidths.maximum)
+
+    def test_solvers_are_shared_per_clock_setup(self):
+        self.assertIs(modulation_solver(26_000_000, False), modulation_solver(26_000_000, False))
+        self.assertIsNot(modulation_solver(26_000_000, False), modulation_solver(26_000_000, True))
+
@@ -0,0 +1,70 @@
+import unittest
+
+from spirit1.basic_packet import BasicPacket, BasicPacketConfig, BasicPacketMessage
+from spirit1.compact import PayloadPool
+from spirit1.enums import CrcMode
+from spirit1.packet_view import PacketViewDecoder
+from spirit1.receiver import ReceivedMessage
+from spirit1.stack_packet import StackPacket, StackPacketConfig, StackPacketMessage
+
+
+def received(payload=b"\x05\xff\x00\x01"):
+    return ReceivedMessage(
+        payload=bytearray(payload),
+        crc_valid=True,
+        rssi=90,
+        source_address=0x12,
+        destination_address=0xFF,
+        control_data=bytes.fromhex("c6003d00"),
+        crc=bytes.fromhex("758756"),
+    )
+
+
+class PacketViewTests(unittest.TestCase):
+    def test_fields_are_views_over_the_received_message(self):
+        raw = received()
+        view = PacketViewDecoder(BasicPacketConfig(
+            control_length=2,
+            address_field=True,
+            crc_mode=CrcMode.CRC_MODE_1021,
+        )).decode(raw)
+
+        self.assertEqual(view.control_data, b"\x3d\x00")
+        self.assertEqual(view.crc, b"\x75\x87")
+        self.assertEqual((view.source_address, view.destination_address, view.rssi), (0x12, 0xFF, 90))
+        raw.payload[0] = 0x06
+        self.assertEqual(view.payload[0], 0x06)
+        with self.assertRaises(TypeError):
+            view.payload[0] = 0x07
+
+    def test_copies_match_the_copying_decoders(self):
+        raw = received()
+        basic = BasicPacketConfig(control_length=4, crc_mode=CrcMode.CRC_MODE_864CBF)
+        stack = StackPacket(None, StackPacketConfig(control_length=1, crc_mode=CrcMode.CRC_MODE_7))
+
+        basic_copy = PacketViewDecoder(basic).decode(raw).copy()
+        stack_copy = PacketViewDecoder(stack.config).decode_batch([raw])[0].copy()
+
+        self.assertIsInstance(basic_copy, BasicPacketMessage)
+        self.assertEqual(basic_copy, BasicPacket(None, basic).decode(raw))
+        self.assertIsNone(basic_copy.source_address)
+        self.assertIsInstance(stack_copy, StackPacketMessage)
+        self.assertEqual(stack_copy, stack.decode(raw))
+
+    def test_disabled_fields_are_empty(self):
+        view = PacketViewDecoder(BasicPacketConfig()).decode(received())
+
+        self.assertEqual(view.control_data, b"")
+        self.assertIsNone(view.crc)
+        self.assertIsNone(view.destination_address)
+
+    def test_views_over_pooled_compact_messages_share_the_slab(self):
+        pool = PayloadPool(slab_size=256)
+        decoder = PacketViewDecoder(BasicPacketConfig(control_length=2, address_field=True))
+        first, second = (decoder.decode(received(payload).compact(pool)) for payload in (b"one", b"two"))
+
+        self.assertIs(first.payload.obj, second.payload.obj)
+        self.assertEqual((bytes(first.payload), bytes(second.payload)), (b"one", b"two"))
+        self.assertEqual(first.control_data, b"\x3d\x00")
+        self.assertEqual((first.source_address, first.rssi, first.crc_valid), (0x12, 90, True))
+        self.assertEqual(second.copy().payload, b"two")
@@ -1,9 +1,13 @@
+import asyncio
+import random
 import unittest
 
 from spirit1.csma import CSMA, CCALength, CCAPeriod, CSMAConfig
+from spirit1.fifo import Fifo, FifoConfig
 from spirit1.irq import IRQ, IRQConfig, SpiritIrq
 from spirit1.qi import QI, QIConfig
 from spirit1.timer import Timer, TimerConfig
+from spirit1.transmitter import TransmitOutcome, TransmitResult
 
 
 class RecordingDevice:
@@ -37,6 +41,22 @@ class PeripheralConfigTests(unittest.TestCase):
         self.assertEqual(device.calls[0][0], "update")
         self.assertEqual(device.calls[-1][2], (8, 7))
 
+    def test_timer_apply_writes_the_ldc_wakeup_timers(self):
+        device = RecordingDevice()
+        config = TimerConfig(
+            26_000_000,
+            wakeup_counter=0x20,
+            wakeup_prescaler=0x10,
+            ldc_reload_counter=0x22,
+            ldc_reload_prescaler=0x11,
+            ldc_reload_on_sync=True,
+        )
+
+        self.assertTrue(Timer(device, config).apply())
+
+        self.assertIn(("write", 0x55, (0x10, 0x20, 0x11, 0x22)), device.calls)
+        self.assertIn(("bit", 0x51, 6, True), device.calls)
+
     def test_csma_apply_encodes_seed_and_prescaler_as_bytes(self):
         device = RecordingDevice()
         config = CSMAConfig(
@@ -51,6 +71,29 @@ class PeripheralConfigTests(unittest.TestCase):
         self.assertTrue(CSMA(device, config).apply())
 
         self.assertEqual(device.calls[0][2], (0xAB, 0xCD, 0x16, 0x34))
+        self.assertEqual(device.calls[1:], [("bit", 0x51, 2, True), ("bit", 0x51, 1, False)])
+
+    def test_csma_transmit_retries_a_busy_channel_with_host_backoff(self):
+        class BusyPacket:
+            def __init__(self, outcomes):
+                self.outcomes = outcomes
+
+            async def transmit_async(self, message, timeout):
+                return TransmitResult(self.outcomes.pop(0), 0.0, 0.001)
+
+        busy = TransmitOutcome.CHANNEL_BUSY
+        config = CSMAConfig(enabled=True, host_retries=2, host_backoff=0.001, host_backoff_max=0.002)
+        csma = CSMA(RecordingDevice(), config, rng=random.Random(1))
+
+        sent = asyncio.run(csma.transmit(BusyPacket([busy, busy, TransmitOutcome.SENT]), None))
+        failed = asyncio.run(csma.transmit(BusyPacket([busy, busy, busy]), None))
+
+        self.assertTrue(sent.sent)
+        self.assertEqual(sent.attempts, 3)
+        self.assertEqual(failed.outcome, busy)
+        self.assertEqual(failed.attempts, 3)
+        self.assertEqual((csma.stats.sent, csma.stats.failed, csma.stats.busy), (1, 1, 5))
+        self.assertAlmostEqual(csma.stats.busy_ratio, 5 / 6)
 
     def test_irq_apply_encodes_enabled_flags_as_a_32_bit_mask(self):
         device = RecordingDevice()
@@ -59,3 +102,18 @@ class PeripheralConfigTests(unittest.TestCase):
         IRQ(device, config).apply()
 
         self.assertEqual(device.calls[0][2], (0x20, 0x00, 0x00, 0x01))
+
+    def test_fifo_apply_writes_all_thresholds_in_one_burst(self):
+        device = RecordingDevice()
+
+        self.assertTrue(Fifo(device, FifoConfig(tx_almost_empty=16)).apply())
+        self.assertFalse(Fifo(device, FifoConfig(rx_almost_full=97)).apply())
+
+        self.assertEqual(device.calls, [("write", 0x3E, (48, 48, 48, 16))])
+
+    def test_irq_can_be_routed_to_a_gpio_as_nirq(self):
+        device = RecordingDevice()
+
+        IRQ(device).route_to_gpio(3)
+
+        self.assertEqual(device.calls, [("write", 0x02, (0x02,))])
@@ -1,7 +1,14 @@
+import dataclasses
+import os
+import tempfile
 import unittest
 
+from spirit1.device import Spirit1Device
+from spirit1.dryrun import RecordingSpi
+from spirit1.enums import Spirit1Commands, Spirit1State
 from spirit1.radio import Radio
 from spirit1.radio_config import RadioConfig
+from spirit1.registers import Spirit1Registers
 
 
 class RegisterDevice:
@@ -76,3 +83,111 @@ class RadioTests(unittest.TestCase):
 
         self.assertTrue(radio.reference_divider)
         self.assertEqual(device.writes, [])
+
+
+class ReconfigureTests(unittest.TestCase):
+    def setUp(self):
+        self.spi = RecordingSpi()
+        self.radio = Radio(Spirit1Device(self.spi), RadioConfig(xtal_frequency=50_000_000))
+        self.assertTrue(self.radio.init_device())
+        self.spi.clear()
+
+    def locks(self):
+        return [
+            transaction for transaction in self.spi.report().transactions
+            if transaction.kind == "command" and transaction.address == Spirit1Commands.LOCKTX
+        ]
+
+    def test_datarate_change_writes_only_the_modulation_registers(self):
+        config = self.radio.config
+        self.assertTrue(self.radio.reconfigure(dataclasses.replace(config, datarate=38_400)))
+
+        # MOD0 shares bits with other settings, so MOD1..MOD0 is read before the burst write.
+        report = self.spi.report()
+        self.assertEqual(
+            [(t.kind, t.address, len(t.data)) for t in report.transactions],
+            [("read", Spirit1Registers.MOD1, 2), ("write", Spirit1Registers.MOD1, 2)],
+        )
+        self.assertEqual(self.radio.config.datarate, 38_400)
+        self.assertIs(self.radio.config, config)
+
+    def test_unchanged_configuration_writes_nothing(self):
+        self.assertTrue(self.radio.reconfigure(dataclasses.replace(self.radio.config)))
+
+        self.assertEqual(self.spi.report().transactions, [])
+
+    def test_frequency_change_recalibrates_the_vco(self):
+        self.assertTrue(self.radio.reconfigure(dataclasses.replace(self.radio.config, channel_number=3)))
+
+        self.assertTrue(self.locks())
+        self.assertEqual(self.spi.registers[Spirit1Registers.CHANNEL_NUMBER], 3)
+
+    def test_configuration_changed_outside_reconfigure_is_rewritten(self):
+        self.radio.config.datarate = 38_400
+        self.assertTrue(self.radio.reconfigure(self.radio.config))
+
+        writes = [t for t in self.spi.report().transactions if t.kind == "write"]
+        self.assertTrue(any(t.address <= Spirit1Registers.SYNT_3 < t.address + len(t.data) for t in writes))
+        self.assertTrue(self.locks())
+
+    def test_invalid_configuration_is_rejected_without_writes(self):
+        config = self.radio.config
+
+        self.assertFalse(self.radio.reconfigure(dataclasses.replace(config, datarate=0)))
+        self.assertEqual(self.spi.report().transactions, [])
+        self.assertEqual(config.datarate, 50_000)
+
+
+class WarmStartTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.state_file = os.path.join(directory.name, "radio.json")
+        self.spi = RecordingSpi()
+        radio = Radio(Spirit1Device(self.spi), RadioConfig(xtal_frequency=50_000_000), state_file=self.state_file)
+        self.assertTrue(radio.init_device())
+        self.spi.clear()
+
+    def restart(self, state_file=None):
+        return Radio(Spirit1Device(self.spi), RadioConfig(xtal_frequency=50_000_000), state_file=state_file)
+
+    def test_configured_device_is_only_read(self):
+        self.assertTrue(self.restart(self.state_file).warm_start())
+
+        report = self.spi.report()
+        self.assertEqual(report.writes + report.commands, 0)
+        self.assertLessEqual(report.reads, 9)
+        self.assertLess(report.estimated_time(spi_clock_hz=1_000_000), 0.001)
+
+    def test_only_mismatching_registers_are_rewritten(self):
+        self.spi.registers[Spirit1Registers.FDEV0] ^= 0x01
+
+        self.assertTrue(self.restart(self.state_file).warm_start())
+
+        report = self.spi.report()
+        self.assertEqual([(t.address, len(t.data)) for t in report.transactions if t.kind == "write"], [
+            (Spirit1Registers.FDEV0, 1),
+        ])
+        self.assertEqual(report.commands, 0)
+
+    def test_trusted_calibration_disables_autocalibration(self):
+        self.spi.registers[Spirit1Registers.PROTOCOL_2] |= 0x02
+
+        self.assertTrue(self.restart(self.state_file).warm_start())
+
+        self.assertFalse(self.spi.registers[Spirit1Registers.PROTOCOL_2] & 0x02)
+        self.assertEqual(self.spi.report().commands, 0)
+
+    def test_unknown_calibration_is_measured_again(self):
+        self.assertTrue(self.restart().warm_start())
+
+        report = self.spi.report()
+        self.assertIn((Spirit1State.READY, Spirit1State.LOCK), report.transitions)
+        self.assertNotIn((Spirit1State.READY, Spirit1State.STANDBY), report.transitions)
+
+    def test_reset_device_falls_back_to_a_full_init(self):
+        self.spi.registers[:] = bytes(256)
+
+        self.assertTrue(self.restart(self.state_file).warm_start())
+
+        self.assertIn((Spirit1State.READY, Spirit1State.STANDBY), self.spi.report().transitions)
@@ -1,6 +1,7 @@
 import asyncio
 import unittest
 
+from spirit1.enums import Spirit1Commands, Spirit1State
 from spirit1.irq import SpiritIrq
 from spirit1.receiver import Receiver
 from spirit1.registers import Spirit1Registers
@@ -42,6 +43,8 @@ class ReceiverDevice:
 
 
 class ReceiverIrq:
+    pin = None
+
     def __init__(self):
         self.statuses = [
             SpiritIrq.RX_DATA_READY.value | SpiritIrq.CRC_ERROR.value,
@@ -52,6 +55,45 @@ class ReceiverIrq:
         return self.statuses.pop(0)
 
 
+class LowDutyCycleDevice(ReceiverDevice):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.status = type("Status", (), {"state": Spirit1State.SLEEP})()
+
+    def set_register_bit(self, register, bit, value):
+        self.calls.append(("bit", register, bit, value))
+
+    def send_command(self, command):
+        self.calls.append(("command", command))
+
+    def refresh_status(self):
+        return True
+
+    def ready(self):
+        self.calls.append(("ready",))
+        return True
+
+
+class IrqLine:
+    def __init__(self):
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        return True
+
+
+class LowDutyCycleIrq(ReceiverIrq):
+    def __init__(self):
+        self.pin = IrqLine()
+        self.statuses = [
+            SpiritIrq.WKUP_TOUT_LDC.value,
+            SpiritIrq.RX_TIMEOUT.value,
+            SpiritIrq.RX_DATA_READY.value,
+        ]
+
+
 class ReceiverTests(unittest.TestCase):
     @staticmethod
     async def collect(ignore_invalid_crc):
@@ -77,3 +119,61 @@ class ReceiverTests(unittest.TestCase):
         self.assertEqual(messages[0].destination_address, 0x42)
         self.assertEqual(messages[0].control_data, b"\x01\x02\x03\x04")
         self.assertEqual(messages[0].crc, b"\x10\x20\x30")
+
+    def test_low_duty_cycle_mode_survives_rx_timeouts_and_waits_on_nirq(self):
+        device = LowDutyCycleDevice()
+        irq = LowDutyCycleIrq()
+        receiver = Receiver(device, irq, irq_timeout=2.0)
+
+        async def first_message():
+            async for message in receiver.receive(low_duty_cycle=True):
+                return message
+
+        message = asyncio.run(first_message())
+
+        self.assertEqual(message.payload, bytearray([0x12, 0x34]))
+        self.assertEqual(irq.pin.waits, [2.0, 2.0, 2.0])
+        self.assertEqual(device.calls[:2], [
+            ("bit", Spirit1Registers.PROTOCOL_1, 7, True),
+            ("command", Spirit1Commands.RX),
+        ])
+        self.assertIn(("bit", Spirit1Registers.PROTOCOL_1, 7, False), device.calls)
+        self.assertEqual(device.calls[-1], ("ready",))
+        self.assertEqual(device.aborts, 0)
+
+    def test_batches_are_released_when_full_and_flushed_on_timeout(self):
+        irq = ReceiverIrq()
+        irq.statuses = [SpiritIrq.RX_DATA_READY.value] * 3 + [SpiritIrq.RX_TIMEOUT.value]
+        receiver = Receiver(ReceiverDevice(), irq, poll_interval=0)
+
+        async def collect():
+            return [batch async for batch in receiver.receive_batch(max_messages=2, max_latency=60)]
+
+        batches = asyncio.run(collect())
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertTrue(all(message.crc_valid for batch in batches for message in batch))
+
+    def test_blocking_iterator_shares_the_async_draining_rules(self):
+        receiver = Receiver(ReceiverDevice(), ReceiverIrq(), poll_interval=0, ignore_invalid_crc=False)
+
+        messages = list(receiver)
+
+        self.assertEqual(len(messages), 1)
+        self.assertFalse(messages[0].crc_valid)
+        self.assertFalse(receiver.should_run)
+
+    def test_run_invokes_the_callback_until_it_stops_the_receiver(self):
+        device = ReceiverDevice()
+        irq = ReceiverIrq()
+        irq.statuses = [SpiritIrq.RX_DATA_READY.value] * 3
+        receiver = Receiver(device, irq, poll_interval=0)
+        received = []
+
+        def callback(message):
+            received.append(message)
+            if len(received) == 2:
+                receiver.stop()
+
+        self.assertEqual(receiver.run(callback), 2)
+        self.assertEqual(len(irq.statuses), 1)
@@ -1,12 +1,17 @@
+import asyncio
 import unittest
 
-from spirit1.enums import CrcMode
+from spirit1.enums import CrcMode, Spirit1Commands
+from spirit1.irq import SpiritIrq
 from spirit1.receiver import ReceivedMessage
+from spirit1.registers import Spirit1Registers
 from spirit1.stack_packet import (
     ExperimentalStackPacketWarning,
     StackPacket,
     StackPacketConfig,
+    StackPacketMessage,
 )
+from spirit1.transmitter import TransmitOutcome, Transmitter
 
 
 class StackDevice:
@@ -22,6 +27,46 @@ class StackDevice:
     def write_registers(self, register, *values):
         self.calls.append(("write", register, values))
 
+    def update_register(self, register, mask, value):
+        self.calls.append(("update", (register, mask, value)))
+
+
+class SendDevice(StackDevice):
+    def __init__(self, packet_info):
+        super().__init__()
+        self.packet_info = packet_info
+
+    def read_register(self, register):
+        return self.packet_info if register == Spirit1Registers.TX_PCKT_INFO else 0
+
+    def flush_tx_fifo(self):
+        self.calls.append(("flush_tx_fifo",))
+        return True
+
+    def flush_rx_fifo(self):
+        self.calls.append(("flush_rx_fifo",))
+        return True
+
+    def write_linear_fifo(self, data):
+        self.calls.append(("fifo", bytes(data)))
+
+    def send_command(self, command):
+        self.calls.append(("command", command))
+
+    def sabort(self):
+        self.calls.append(("sabort",))
+        return True
+
+
+class ScriptedIrq:
+    pin = None
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def get_status(self):
+        return self.statuses.pop(0)
+
 
 class StackPacketTests(unittest.TestCase):
     def test_apply_selects_stack_format_and_warns(self):
@@ -39,8 +84,34 @@ class StackPacketTests(unittest.TestCase):
             self.assertTrue(packet.apply())
 
         self.assertEqual(device.calls[2][2], (0x12, 0xC7, 0x2B, 0x60))
-        self.assertEqual(device.calls[-2], ("bit", (0x50, 3, True)))
-        self.assertEqual(device.calls[-1], ("bit", (0x50, 2, False)))
+        self.assertEqual(device.calls[-1], ("update", (0x52, 0x03, 0x08)))
+
+    def test_send_with_ack_reports_retransmissions_and_sequence_number(self):
+        device = SendDevice(packet_info=0x22)
+        irq = ScriptedIrq([0, SpiritIrq.TX_DATA_SENT.value, SpiritIrq.RX_DATA_READY.value])
+        packet = StackPacket(device, StackPacketConfig(max_retransmissions=3), Transmitter(device, irq, poll_interval=0))
+        with self.assertWarns(ExperimentalStackPacketWarning):
+            packet.apply()
+
+        result = asyncio.run(packet.send(StackPacketMessage(b"\x10", 0x24, 0x42)))
+
+        self.assertIn(("update", (0x52, 0x03, 0x30)), device.calls)
+        self.assertTrue(result.sent)
+        self.assertEqual((result.attempts, result.retransmissions, result.sequence_number), (3, 2, 2))
+        self.assertIn(("command", Spirit1Commands.TX), device.calls)
+        self.assertEqual(device.calls[-1], ("flush_rx_fifo",))
+
+    def test_send_reports_no_ack_when_retransmissions_run_out(self):
+        device = SendDevice(packet_info=0x0F)
+        irq = ScriptedIrq([0, SpiritIrq.MAX_RE_TX_REACH.value])
+        packet = StackPacket(device, StackPacketConfig(), Transmitter(device, irq, poll_interval=0))
+
+        result = asyncio.run(packet.send(StackPacketMessage(b"\x10", 0x24, 0x42)))
+
+        self.assertEqual(result.outcome, TransmitOutcome.NO_ACK)
+        self.assertEqual(result.attempts, 16)
+        self.assertIn(("bit", (Spirit1Registers.PROTOCOL_0, 3, False)), device.calls)
+        self.assertIn(("sabort",), device.calls)
 
     def test_decode_uses_the_received_snapshot(self):
         raw = ReceivedMessage(
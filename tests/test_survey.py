@@ -0,0 +1,90 @@
+import unittest
+
+from spirit1.channels import ChannelTable
+from spirit1.radio import Radio
+from spirit1.radio_config import RadioConfig
+from spirit1.registers import Spirit1Registers
+from spirit1.survey import ChannelSurvey, rssi_dbm
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NoisyDevice:
+    """Register file reporting RSSI and carrier sense per programmed SYNT_0."""
+
+    def __init__(self, noise):
+        self.registers = [0] * 256
+        self.noise = noise
+        self.commands = []
+
+    def read_register(self, register):
+        if register == Spirit1Registers.RCO_VCO_CALIBR_OUT0:
+            return self.registers[Spirit1Registers.SYNT_0] & 0x7F
+        return self.registers[register]
+
+    def read_register_block(self, register, count):
+        if register == Spirit1Registers.RCO_VCO_CALIBR_IN1:
+            return bytearray(self.registers[register:register + count])
+        level = self.noise[self.registers[Spirit1Registers.SYNT_0]]
+        return bytearray([0x80 if level > 100 else 0, 0, level])
+
+    def write_registers(self, register, *values):
+        self.registers[register:register + len(values)] = values
+
+    def update_register(self, register, mask, value):
+        self.write_registers(register, (self.registers[register] & mask) + value)
+
+    def set_register_bit(self, register, bit, value):
+        pass
+
+    def refresh_status(self):
+        pass
+
+    def is_standby(self):
+        return False
+
+    def lock_tx(self):
+        return True
+
+    def lock_rx(self):
+        return True
+
+    def ready(self):
+        return True
+
+    def sabort(self):
+        self.commands.append("sabort")
+        return True
+
+    def start_rx(self):
+        self.commands.append("start_rx")
+        return True
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class ChannelSurveyTests(unittest.TestCase):
+    def test_sweeps_build_channel_by_time_statistics(self):
+        radio = Radio(NoisyDevice({}), RadioConfig(reference_divider=False, channel_space=200_000))
+        table = ChannelTable.from_channels(radio, [0, 1, 2])
+        radio.spirit.noise = {entry.synt[3]: level for entry, level in zip(table, (60, 120, 40))}
+        table.calibrate()
+        survey = ChannelSurvey(table, samples=4, settle=0)
+
+        survey.run(2)
+
+        self.assertEqual(survey.rssi.shape, (3, 8))
+        self.assertEqual(survey.busy.sum(axis=1).tolist(), [0, 8, 0])
+        self.assertEqual(survey.occupancy.tolist(), [0.0, 100.0, 0.0])
+        self.assertEqual(survey.mean.tolist(), [-100.0, -70.0, -110.0])
+        self.assertEqual(survey.minimum.tolist(), survey.maximum.tolist())
+        self.assertEqual(survey.cleanest(), [2, 0, 1])
+        self.assertEqual(radio.spirit.commands.count("start_rx"), 6)
+        self.assertEqual(radio.spirit.commands[-1], "sabort")
+
+    def test_rssi_conversion(self):
+        self.assertEqual(rssi_dbm(0), -130)
+        self.assertEqual(rssi_dbm(numpy.array([20, 120])).tolist(), [-120.0, -70.0])
+
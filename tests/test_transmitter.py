@@ -0,0 +1,258 @@
+import asyncio
+import time
+import unittest
+
+from spirit1.enums import Spirit1Commands
+from spirit1.irq import SpiritIrq
+from spirit1.registers import Spirit1Registers
+from spirit1.transmitter import TransmitOutcome, Transmitter
+
+
+class FifoDevice:
+    """Models the linear TX FIFO draining by ``drain`` bytes per register read."""
+
+    def __init__(self, drain=40):
+        self.drain = drain
+        self.level = 0
+        self.written = bytearray()
+        self.calls = []
+
+    def write_registers(self, register, *values):
+        self.calls.append(("write", register, values))
+
+    def flush_tx_fifo(self):
+        self.calls.append("flush_tx_fifo")
+        self.level = 0
+        return True
+
+    def write_linear_fifo(self, data):
+        data = bytes(data)
+        if self.level + len(data) > 96:
+            raise AssertionError("TX FIFO overflow")
+        self.level += len(data)
+        self.written.extend(data)
+
+    def send_command(self, command):
+        self.calls.append(command)
+
+    def start_tx(self):
+        self.calls.append("start_tx")
+        return True
+
+    def sabort(self):
+        self.calls.append("sabort")
+        return True
+
+    def linear_fifo_tx_size(self):
+        level = self.level
+        self.level = max(0, self.level - self.drain)
+        return level
+
+
+class DrainingIrq:
+    pin = None
+
+    def __init__(self, device, statuses=None):
+        self.device = device
+        self.statuses = statuses
+
+    def get_status(self):
+        if self.statuses is not None:
+            return self.statuses.pop(0)
+        self.device.level = max(0, self.device.level - self.device.drain)
+        if not self.device.level:
+            return SpiritIrq.TX_FIFO_ALMOST_EMPTY.value | SpiritIrq.TX_DATA_SENT.value
+        return SpiritIrq.TX_FIFO_ALMOST_EMPTY.value if self.device.level <= 48 else 0
+
+
+class IrqLine:
+    def __init__(self, results):
+        self.results = results
+        self.timeouts = []
+
+    def wait(self, timeout=None):
+        self.timeouts.append(timeout)
+        result = self.results.pop(0)
+        if not result:
+            time.sleep(timeout)
+        return result
+
+
+class TransmitterTests(unittest.TestCase):
+    def test_payloads_larger_than_the_fifo_are_streamed(self):
+        device = FifoDevice()
+        transmitter = Transmitter(device, DrainingIrq(device), poll_interval=0)
+        payload = bytes(range(250))
+
+        self.assertTrue(transmitter.transmit(payload))
+
+        self.assertEqual(bytes(device.written), payload)
+        self.assertEqual(device.calls, ["flush_tx_fifo", "start_tx"])
+
+    def test_fifo_error_aborts_a_streamed_transmission(self):
+        device = FifoDevice()
+        irq = DrainingIrq(device, [0, SpiritIrq.TX_FIFO_ERROR.value])
+        transmitter = Transmitter(device, irq, poll_interval=0)
+
+        self.assertFalse(transmitter.transmit(bytes(200)))
+
+        self.assertEqual(len(device.written), 96)
+        self.assertEqual(device.calls[-2:], ["sabort", "flush_tx_fifo"])
+
+    def test_busy_channel_ends_a_streamed_transmission(self):
+        device = FifoDevice()
+        irq = DrainingIrq(device, [0, 0, SpiritIrq.MAX_BO_CCA_REACH.value])
+        transmitter = Transmitter(device, irq, poll_interval=0)
+
+        started = time.monotonic()
+        with self.assertLogs("spirit1.transmitter", "WARNING"):
+            self.assertFalse(transmitter.transmit(bytes(200), timeout=5.0))
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(irq.statuses, [])
+        self.assertEqual(device.calls[-2:], ["sabort", "flush_tx_fifo"])
+
+    def test_async_transmit_completes_on_tx_data_sent(self):
+        device = FifoDevice()
+        irq = DrainingIrq(device, [SpiritIrq.TX_DATA_SENT.value, 0, SpiritIrq.TX_DATA_SENT.value])
+        transmitter = Transmitter(device, irq, poll_interval=0)
+
+        result = asyncio.run(transmitter.transmit_async(b"\x01\x02"))
+
+        self.assertTrue(result.sent)
+        self.assertEqual(irq.statuses, [])
+        self.assertGreaterEqual(result.duration, 0)
+        self.assertEqual(device.calls, ["flush_tx_fifo", Spirit1Commands.TX])
+
+    def test_async_transmit_reports_a_busy_channel_from_the_nirq_line(self):
+        device = FifoDevice()
+        irq = DrainingIrq(device, [0, SpiritIrq.MAX_BO_CCA_REACH.value])
+        irq.pin = IrqLine([True])
+        transmitter = Transmitter(device, irq)
+
+        result = asyncio.run(transmitter.transmit_async(b"\x01", timeout=0.5))
+
+        self.assertEqual(result.outcome, TransmitOutcome.CHANNEL_BUSY)
+        self.assertEqual(len(irq.pin.timeouts), 1)
+        self.assertIn("sabort", device.calls)
+
+    def test_async_transmit_times_out_without_completion(self):
+        device = FifoDevice()
+        irq = DrainingIrq(device, [0, 0])
+        irq.pin = IrqLine([False])
+        transmitter = Transmitter(device, irq)
+
+        result = asyncio.run(transmitter.transmit_async(b"\x01", timeout=0.01))
+
+        self.assertEqual(result.outcome, TransmitOutcome.TIMEOUT)
+        self.assertEqual(device.calls[-2:], ["sabort", "flush_tx_fifo"])
+
+    def test_queued_frames_are_sent_back_to_back_with_staged_payloads(self):
+        device = FifoDevice()
+        sent = SpiritIrq.TX_DATA_SENT.value
+        irq = DrainingIrq(device, [0, sent, 0, sent, 0, sent])
+        transmitter = Transmitter(device, irq, poll_interval=0)
+        payloads = [b"\x01" * 10, b"\x02" * 20, b"\x03" * 30]
+
+        async def send_all():
+            futures = [
+                transmitter.submit(
+                    {Spirit1Registers.PKTLEN_1: 0, Spirit1Registers.PKTLEN_0: len(payload)},
+                    payload,
+                )
+                for payload in payloads
+            ]
+            await transmitter.drain()
+            return [future.result() for future in futures]
+
+        results = asyncio.run(send_all())
+
+        self.assertTrue(all(result.sent for result in results))
+        self.assertEqual(bytes(device.written), b"".join(payloads))
+        self.assertEqual(device.calls.count("flush_tx_fifo"), 1)
+        self.assertEqual(device.calls.count(Spirit1Commands.TX), 3)
+        self.assertIn(("write", Spirit1Registers.PKTLEN_0, (20,)), device.calls)
+
+    def test_the_next_header_is_planned_on_air_and_written_once_sent(self):
+        device = FifoDevice()
+        sent = SpiritIrq.TX_DATA_SENT.value
+        statuses = [0, 0, sent, 0, sent]
+        irq = DrainingIrq(device, statuses)
+        transmitter = Transmitter(device, irq, poll_interval=0)
+        get_status, plan_header = irq.get_status, transmitter._plan_header
+
+        def record_status():
+            status = get_status()
+            device.calls.append(("status", status))
+            return status
+
+        def record_plan(header):
+            device.calls.append("plan")
+            return plan_header(header)
+
+        irq.get_status = record_status
+        transmitter._plan_header = record_plan
+
+        async def send_all():
+            futures = [transmitter.submit({Spirit1Registers.PKTLEN_0: length}, b"\x01" * length) for length in (4, 8)]
+            await transmitter.drain()
+            return [future.result() for future in futures]
+
+        results = asyncio.run(send_all())
+
+        self.assertTrue(all(result.sent for result in results))
+        first_sent = device.calls.index(("status", sent))
+        self.assertLess(device.calls.index("plan", device.calls.index(Spirit1Commands.TX)), first_sent)
+        self.assertEqual(device.calls[first_sent + 1], ("write", Spirit1Registers.PKTLEN_0, (8,)))
+        self.assertEqual(device.calls.count("plan"), 2)
+
+    def test_an_unexpected_error_fails_only_its_own_frame(self):
+        device = FifoDevice()
+        irq = DrainingIrq(device, [0, SpiritIrq.TX_DATA_SENT.value])
+        transmitter = Transmitter(device, irq, poll_interval=0)
+        failures = [RuntimeError("SPI bus went away")]
+
+        def write_registers(register, *values):
+            if failures:
+                raise failures.pop()
+            device.calls.append(("write", register, values))
+
+        device.write_registers = write_registers
+
+        async def send_all():
+            futures = [transmitter.submit({Spirit1Registers.PKTLEN_0: 4}, b"\x01\x02\x03\x04") for _ in range(2)]
+            await asyncio.wait_for(transmitter.drain(), 1.0)
+            return futures
+
+        first, second = asyncio.run(send_all())
+
+        self.assertIsInstance(first.exception(), RuntimeError)
+        self.assertTrue(second.result().sent)
+        self.assertEqual(device.calls[0], ("write", Spirit1Registers.PKTLEN_0, (4,)))
+
+    def test_unchanged_headers_and_a_clean_fifo_are_not_rewritten(self):
+        device = FifoDevice()
+        transmitter = Transmitter(device, DrainingIrq(device), poll_interval=0)
+        header = {
+            Spirit1Registers.PKTLEN_1: 0,
+            Spirit1Registers.PKTLEN_0: 4,
+            Spirit1Registers.RX_SOURCE_ADDR: 0x42,
+        }
+
+        for _ in range(2):
+            transmitter.write_header(header)
+            self.assertTrue(transmitter.transmit(b"\x01\x02\x03\x04"))
+        transmitter.write_header({**header, Spirit1Registers.PKTLEN_0: 5})
+        transmitter.invalidate()
+        transmitter.write_header(header)
+
+        self.assertEqual(device.calls, [
+            ("write", Spirit1Registers.PKTLEN_1, (0, 4)),
+            ("write", Spirit1Registers.RX_SOURCE_ADDR, (0x42,)),
+            "flush_tx_fifo",
+            "start_tx",
+            "start_tx",
+            ("write", Spirit1Registers.PKTLEN_0, (5,)),
+            ("write", Spirit1Registers.PKTLEN_1, (0, 4)),
+            ("write", Spirit1Registers.RX_SOURCE_ADDR, (0x42,)),
+        ])